@@ -673,6 +673,31 @@ class UnaryUnaryMultiCallable(six.with_metaclass(abc.ABCMeta)):
         """
         raise NotImplementedError()
 
+    def batch(self, requests, timeout=None, metadata=None, credentials=None):
+        """Asynchronously invokes the underlying RPC once for each request.
+
+        This is an EXPERIMENTAL API.
+
+        Args:
+          requests: An iterable of request values, one for each RPC.
+          timeout: An optional duration of time in seconds to allow for
+            each RPC.
+          metadata: Optional :term:`metadata` to be transmitted to the
+            service-side of each RPC.
+          credentials: An optional CallCredentials for the RPCs.
+
+        Returns:
+          A list of objects that are each both a Call for an RPC and a Future,
+          in the order of the requests, as future would return them.
+        """
+        return [
+            self.future(
+                request,
+                timeout=timeout,
+                metadata=metadata,
+                credentials=credentials) for request in requests
+        ]
+
 
 class UnaryStreamMultiCallable(six.with_metaclass(abc.ABCMeta)):
     """Affords invoking a unary-stream RPC from client-side."""
@@ -764,7 +789,10 @@ class StreamUnaryMultiCallable(six.with_metaclass(abc.ABCMeta)):
         """Asynchronously invokes the underlying RPC on the client.
 
         Args:
-          request_iterator: An iterator that yields request values for the RPC.
+          request_iterator: An iterator that yields request values for the RPC,
+            or None (EXPERIMENTAL) to instead write request values with the
+            returned object's write method and end the request stream with
+            its done_writing method.
           timeout: An optional duration of time in seconds to allow for
             the RPC. If None, the timeout is considered infinite.
           metadata: Optional :term:`metadata` to be transmitted to the
@@ -793,7 +821,10 @@ class StreamStreamMultiCallable(six.with_metaclass(abc.ABCMeta)):
         """Invokes the underlying RPC on the client.
 
         Args:
-          request_iterator: An iterator that yields request values for the RPC.
+          request_iterator: An iterator that yields request values for the RPC,
+            or None (EXPERIMENTAL) to instead write request values with the
+            returned object's write method and end the request stream with
+            its done_writing method.
           timeout: An optional duration of time in seconds to allow for
             the RPC. If not specified, the timeout is considered infinite.
           metadata: Optional :term:`metadata` to be transmitted to the
@@ -857,6 +888,9 @@ class Channel(six.with_metaclass(abc.ABCMeta)):
           method: The name of the RPC method.
           request_serializer: Optional behaviour for serializing the request
             message. Request goes unserialized in case None is passed.
+            (EXPERIMENTAL) The serialized request may be any object exporting
+            a contiguous buffer; large ones are sent without being copied and
+            must not be modified until the RPC has completed.
           response_deserializer: Optional behaviour for deserializing the
             response message. Response goes undeserialized in case None
             is passed.
@@ -877,6 +911,9 @@ class Channel(six.with_metaclass(abc.ABCMeta)):
           method: The name of the RPC method.
           request_serializer: Optional behaviour for serializing the request
             message. Request goes unserialized in case None is passed.
+            (EXPERIMENTAL) The serialized request may be any object exporting
+            a contiguous buffer; large ones are sent without being copied and
+            must not be modified until the RPC has completed.
           response_deserializer: Optional behaviour for deserializing the
             response message. Response goes undeserialized in case None is
             passed.
@@ -897,6 +934,9 @@ class Channel(six.with_metaclass(abc.ABCMeta)):
           method: The name of the RPC method.
           request_serializer: Optional behaviour for serializing the request
             message. Request goes unserialized in case None is passed.
+            (EXPERIMENTAL) The serialized request may be any object exporting
+            a contiguous buffer; large ones are sent without being copied and
+            must not be modified until the RPC has completed.
           response_deserializer: Optional behaviour for deserializing the
             response message. Response goes undeserialized in case None is
             passed.
@@ -917,6 +957,9 @@ class Channel(six.with_metaclass(abc.ABCMeta)):
           method: The name of the RPC method.
           request_serializer: Optional behaviour for serializing the request
             message. Request goes unserialized in case None is passed.
+            (EXPERIMENTAL) The serialized request may be any object exporting
+            a contiguous buffer; large ones are sent without being copied and
+            must not be modified until the RPC has completed.
           response_deserializer: Optional behaviour for deserializing the
             response message. Response goes undeserialized in case None
             is passed.
@@ -1075,7 +1118,10 @@ class RpcMethodHandler(six.with_metaclass(abc.ABCMeta)):
       response_serializer: A callable behavior that accepts an object produced
         by this object's business logic and returns a byte string, or None to
         indicate that the byte strings produced by this object's business logic
-        should be transmitted on the wire as they are.
+        should be transmitted on the wire as they are. (EXPERIMENTAL) Any object
+        exporting a contiguous buffer, such as a bytearray or memoryview, may
+        stand in for a byte string; large ones are sent without being copied
+        and must not be modified until the RPC has completed.
       unary_unary: This object's application-specific business logic as a
         callable value that takes a request value and a ServicerContext object
         and returns a response value. Only non-None if both request_streaming
@@ -1265,7 +1311,8 @@ class Server(six.with_metaclass(abc.ABCMeta)):
 
 def unary_unary_rpc_method_handler(behavior,
                                    request_deserializer=None,
-                                   response_serializer=None):
+                                   response_serializer=None,
+                                   inline=False):
     """Creates an RpcMethodHandler for a unary-unary RPC method.
 
     Args:
@@ -1273,14 +1320,24 @@ def unary_unary_rpc_method_handler(behavior,
         and returns one response.
       request_deserializer: An optional behavior for request deserialization.
       response_serializer: An optional behavior for response serialization.
+      inline: Whether to call behavior directly on the server's polling thread
+        as soon as the request arrives rather than in the server's thread pool.
+        This saves two thread handoffs per RPC but stalls all of the server's
+        other RPCs on that thread while behavior runs, so it suits only
+        behaviors that complete quickly and never block. RPCs so serviced do
+        not count toward the server's maximum_concurrent_rpcs. This is an
+        EXPERIMENTAL API.
 
     Returns:
       An RpcMethodHandler object that is typically used by grpc.Server.
     """
     from grpc import _utilities  # pylint: disable=cyclic-import
-    return _utilities.RpcMethodHandler(False, False, request_deserializer,
-                                       response_serializer, behavior, None,
-                                       None, None)
+    if inline:
+        method_handler_class = _utilities.InlineRpcMethodHandler
+    else:
+        method_handler_class = _utilities.RpcMethodHandler
+    return method_handler_class(False, False, request_deserializer,
+                                response_serializer, behavior, None, None, None)
 
 
 def unary_stream_rpc_method_handler(behavior,
@@ -1617,7 +1674,9 @@ def server(thread_pool,
            handlers=None,
            interceptors=None,
            options=None,
-           maximum_concurrent_rpcs=None):
+           maximum_concurrent_rpcs=None,
+           completion_queue_count=1,
+           method_lanes=None):
     """Creates a Server with which RPCs can be serviced.
 
     Args:
@@ -1635,6 +1694,16 @@ def server(thread_pool,
       maximum_concurrent_rpcs: The maximum number of concurrent RPCs this server
         will service before returning RESOURCE_EXHAUSTED status, or None to
         indicate no limit.
+      completion_queue_count: The number of completion queues the server polls,
+        each from its own thread, to accept RPCs and process their events. This
+        is an EXPERIMENTAL API.
+      method_lanes: An optional dictionary mapping fully-qualified method names
+        (such as '/package.Service/Method') and service names (such as
+        'package.Service') to lanes created with grpc.experimental.server_lane.
+        RPCs of a method named here, or else of a service named here, are
+        serviced by that lane's thread pool and limited only by that lane's
+        maximum_concurrent_rpcs; other RPCs use thread_pool and
+        maximum_concurrent_rpcs. This is an EXPERIMENTAL API.
 
     Returns:
       A Server object.
@@ -1642,7 +1711,9 @@ def server(thread_pool,
     from grpc import _server  # pylint: disable=cyclic-import
     return _server.Server(thread_pool, () if handlers is None else handlers, ()
                           if interceptors is None else interceptors, () if
-                          options is None else options, maximum_concurrent_rpcs)
+                          options is None else options, maximum_concurrent_rpcs,
+                          completion_queue_count, {} if method_lanes is None
+                          else method_lanes)
 
 
 ###################################  __all__  #################################
@@ -13,21 +13,28 @@
 # limitations under the License.
 """Invocation-side implementation of gRPC Python."""
 
+import collections
 import logging
 import sys
 import threading
 import time
+import weakref
 
 import grpc
 from grpc import _common
 from grpc import _grpcio_metadata
 from grpc._cython import cygrpc
+from grpc.experimental import ChannelOptions
 from grpc.framework.foundation import callable_util
 
 _USER_AGENT = 'grpc-python/{}'.format(_grpcio_metadata.__version__)
 
 _EMPTY_FLAGS = 0
 
+_DEFAULT_REQUEST_SEND_WINDOW = 1
+_DEFAULT_RESPONSE_PREFETCH_DEPTH = 0
+_MAXIMUM_EVENTS_PER_POLL = 64
+
 _UNARY_UNARY_INITIAL_DUE = (
     cygrpc.OperationType.send_initial_metadata,
     cygrpc.OperationType.send_message,
@@ -118,6 +125,20 @@ class _RPCState(object):
         # prior to termination of the RPC.
         self.cancelled = False
         self.callbacks = []
+        # Serialized request messages of a request-streaming RPC that are waiting
+        # for the send_message operation in progress to complete, and whether the
+        # request stream has ended and remains to be closed.
+        self.unsent_requests = collections.deque()
+        self.requests_ended = False
+        # The number of responses of a response-streaming RPC to receive ahead of
+        # the application, the responses so received, and whether the response
+        # stream has ended.
+        self.prefetch_depth = 0
+        self.responses = collections.deque()
+        self.responses_ended = False
+        # Whether responses of a response-streaming RPC are received as views of
+        # the transport's memory rather than as copied bytes.
+        self.zero_copy_receive = False
 
 
 def _abort(state, code, details):
@@ -129,21 +150,35 @@ def _abort(state, code, details):
         state.trailing_metadata = ()
 
 
+def _typed_operations(batch_operations):
+    if isinstance(batch_operations, cygrpc.ClientBatch):
+        # A batch template answers for each of its operations itself.
+        return ((operation_type, batch_operations)
+                for operation_type in batch_operations.operation_types())
+    else:
+        return ((batch_operation.type(), batch_operation)
+                for batch_operation in batch_operations)
+
+
 def _handle_event(event, state, response_deserializer):
     callbacks = []
-    for batch_operation in event.batch_operations:
-        operation_type = batch_operation.type()
+    for operation_type, batch_operation in _typed_operations(
+            event.batch_operations):
         state.due.remove(operation_type)
         if operation_type == cygrpc.OperationType.receive_initial_metadata:
             state.initial_metadata = batch_operation.initial_metadata()
         elif operation_type == cygrpc.OperationType.receive_message:
             serialized_response = batch_operation.message()
-            if serialized_response is not None:
+            if serialized_response is None:
+                state.responses_ended = True
+            else:
                 response = _common.deserialize(serialized_response,
                                                response_deserializer)
                 if response is None:
                     details = 'Exception deserializing response!'
                     _abort(state, grpc.StatusCode.INTERNAL, details)
+                elif state.prefetch_depth:
+                    state.responses.append(response)
                 else:
                     state.response = response
         elif operation_type == cygrpc.OperationType.receive_status_on_client:
@@ -163,11 +198,57 @@ def _handle_event(event, state, response_deserializer):
     return callbacks
 
 
+def _send_unsent_requests(state, call, response_deserializer):
+    """Starts the next send of a request-streaming RPC if one may be started.
+
+    Must be called with state.condition held. The send's completion may start
+    receiving responses ahead, which are deserialized with
+    response_deserializer.
+    """
+    if (state.code is not None or
+            cygrpc.OperationType.send_message in state.due or
+            cygrpc.OperationType.send_close_from_client in state.due):
+        return
+    operations = []
+    if state.unsent_requests:
+        serialized_request = state.unsent_requests.popleft()
+        flags = (cygrpc.WriteFlag.buffer_hint
+                 if state.unsent_requests else _EMPTY_FLAGS)
+        operations.append(
+            cygrpc.SendMessageOperation(serialized_request, flags))
+        state.due.add(cygrpc.OperationType.send_message)
+    if state.requests_ended and not state.unsent_requests:
+        operations.append(cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS))
+        state.due.add(cygrpc.OperationType.send_close_from_client)
+        state.requests_ended = False
+    if operations:
+        call.start_client_batch(
+            operations, _event_handler(state, call, response_deserializer))
+
+
+def _receive_ahead(state, call, response_deserializer):
+    """Starts receiving a response if fewer than state.prefetch_depth are held.
+
+    Must be called with state.condition held.
+    """
+    if (state.prefetch_depth and state.code is None and
+            not state.responses_ended and
+            cygrpc.OperationType.receive_message not in state.due and
+            len(state.responses) < state.prefetch_depth):
+        call.start_client_batch(
+            (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS,
+                                            state.zero_copy_receive),),
+            _event_handler(state, call, response_deserializer))
+        state.due.add(cygrpc.OperationType.receive_message)
+
+
 def _event_handler(state, call, response_deserializer):
 
     def handle_event(event):
         with state.condition:
             callbacks = _handle_event(event, state, response_deserializer)
+            _send_unsent_requests(state, call, response_deserializer)
+            _receive_ahead(state, call, response_deserializer)
             state.condition.notify_all()
             done = not state.due
         for callback in callbacks:
@@ -177,9 +258,16 @@ def _event_handler(state, call, response_deserializer):
     return handle_event
 
 
+def _requests_in_flight(state):
+    in_flight = len(state.unsent_requests)
+    if cygrpc.OperationType.send_message in state.due:
+        in_flight += 1
+    return in_flight
+
+
 def _consume_request_iterator(request_iterator, state, call,
-                              request_serializer):
-    event_handler = _event_handler(state, call, None)
+                              request_serializer, response_deserializer,
+                              send_window):
 
     def consume_request_iterator():
         while True:
@@ -202,25 +290,22 @@ def _consume_request_iterator(request_iterator, state, call,
                         _abort(state, grpc.StatusCode.INTERNAL, details)
                         return
                     else:
-                        operations = (cygrpc.SendMessageOperation(
-                            serialized_request, _EMPTY_FLAGS),)
-                        call.start_client_batch(operations, event_handler)
-                        state.due.add(cygrpc.OperationType.send_message)
+                        state.unsent_requests.append(serialized_request)
+                        _send_unsent_requests(state, call,
+                                              response_deserializer)
                         while True:
-                            state.condition.wait()
                             if state.code is None:
-                                if cygrpc.OperationType.send_message not in state.due:
+                                if _requests_in_flight(state) < send_window:
                                     break
+                                state.condition.wait()
                             else:
                                 return
                 else:
                     return
         with state.condition:
             if state.code is None:
-                operations = (
-                    cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),)
-                call.start_client_batch(operations, event_handler)
-                state.due.add(cygrpc.OperationType.send_close_from_client)
+                state.requests_ended = True
+                _send_unsent_requests(state, call, response_deserializer)
 
     def stop_consumption_thread(timeout):  # pylint: disable=unused-argument
         with state.condition:
@@ -250,6 +335,7 @@ class _Rendezvous(grpc.RpcError, grpc.Future, grpc.Call):
                 self._call.cancel()
                 self._state.cancelled = True
                 _abort(self._state, grpc.StatusCode.CANCELLED, 'Cancelled!')
+                self._state.responses.clear()
                 self._state.condition.notify_all()
             return False
 
@@ -315,15 +401,27 @@ class _Rendezvous(grpc.RpcError, grpc.Future, grpc.Call):
 
         fn(self)
 
+    def _next_prefetched(self):
+        response = self._state.responses.popleft()
+        _receive_ahead(self._state, self._call, self._response_deserializer)
+        return response
+
     def _next(self):
         with self._state.condition:
-            if self._state.code is None:
-                event_handler = _event_handler(self._state, self._call,
-                                               self._response_deserializer)
-                self._call.start_client_batch(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
-                    event_handler)
-                self._state.due.add(cygrpc.OperationType.receive_message)
+            if self._state.responses:
+                return self._next_prefetched()
+            elif self._state.code is None:
+                if self._state.prefetch_depth:
+                    _receive_ahead(self._state, self._call,
+                                   self._response_deserializer)
+                else:
+                    event_handler = _event_handler(self._state, self._call,
+                                                   self._response_deserializer)
+                    self._call.start_client_batch(
+                        (cygrpc.ReceiveMessageOperation(
+                            _EMPTY_FLAGS, self._state.zero_copy_receive),),
+                        event_handler)
+                    self._state.due.add(cygrpc.OperationType.receive_message)
             elif self._state.code is grpc.StatusCode.OK:
                 raise StopIteration()
             else:
@@ -334,6 +432,8 @@ class _Rendezvous(grpc.RpcError, grpc.Future, grpc.Call):
                     response = self._state.response
                     self._state.response = None
                     return response
+                elif self._state.responses:
+                    return self._next_prefetched()
                 elif cygrpc.OperationType.receive_message not in self._state.due:
                     if self._state.code is grpc.StatusCode.OK:
                         raise StopIteration()
@@ -414,6 +514,62 @@ class _Rendezvous(grpc.RpcError, grpc.Future, grpc.Call):
                 self._state.condition.notify_all()
 
 
+class _RequestStreamingRendezvous(_Rendezvous):
+    """A _Rendezvous to which the application writes the request messages.
+
+    Used when a request-streaming RPC is invoked without a request iterator so
+    that the requests are sent from the application's own threads rather than
+    from a request-consumption thread.
+    """
+
+    def __init__(self, state, call, response_deserializer, deadline,
+                 request_serializer, send_window):
+        super(_RequestStreamingRendezvous, self).__init__(
+            state, call, response_deserializer, deadline)
+        self._request_serializer = request_serializer
+        self._send_window = send_window
+        self._done_writing = False
+
+    def write(self, request):
+        """Sends a request message, blocking while the send window is full.
+
+        Raises:
+          ValueError: If done_writing has already been called.
+          grpc.RpcError: If the RPC has terminated.
+        """
+        serialized_request = _common.serialize(request,
+                                               self._request_serializer)
+        with self._state.condition:
+            if self._done_writing:
+                raise ValueError('write called after done_writing!')
+            elif self._state.code is not None:
+                raise self
+            elif serialized_request is None:
+                self._call.cancel()
+                _abort(self._state, grpc.StatusCode.INTERNAL,
+                       'Exception serializing request!')
+                self._state.condition.notify_all()
+                raise self
+            self._state.unsent_requests.append(serialized_request)
+            _send_unsent_requests(self._state, self._call,
+                                  self._response_deserializer)
+            while self._state.code is None:
+                if _requests_in_flight(self._state) < self._send_window:
+                    return
+                self._state.condition.wait()
+            raise self
+
+    def done_writing(self):
+        """Indicates that no more request messages will be written."""
+        with self._state.condition:
+            if not self._done_writing:
+                self._done_writing = True
+                if self._state.code is None:
+                    self._state.requests_ended = True
+                    _send_unsent_requests(self._state, self._call,
+                                          self._response_deserializer)
+
+
 def _start_unary_request(request, timeout, request_serializer):
     deadline = _deadline(timeout)
     serialized_request = _common.serialize(request, request_serializer)
@@ -426,6 +582,28 @@ def _start_unary_request(request, timeout, request_serializer):
         return deadline, serialized_request, None
 
 
+_BLOCKING_COMPLETION_QUEUES = threading.local()
+
+
+def _acquire_blocking_completion_queue():
+    completion_queue = getattr(_BLOCKING_COMPLETION_QUEUES, 'completion_queue',
+                               None)
+    if completion_queue is None:
+        return cygrpc.CompletionQueue()
+    else:
+        _BLOCKING_COMPLETION_QUEUES.completion_queue = None
+        return completion_queue
+
+
+def _release_blocking_completion_queue(completion_queue):
+    """Keeps a drained completion queue for the calling thread's next use.
+
+    Must only be called once every operation started against the queue has
+    been reported, so that no stale event is seen by a later RPC.
+    """
+    _BLOCKING_COMPLETION_QUEUES.completion_queue = completion_queue
+
+
 def _end_unary_response_blocking(state, call, with_call, deadline):
     if state.code is grpc.StatusCode.OK:
         if with_call:
@@ -439,13 +617,26 @@ def _end_unary_response_blocking(state, call, with_call, deadline):
 
 class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
 
-    def __init__(self, channel, managed_call, method, request_serializer,
-                 response_deserializer):
+    # pylint: disable=too-many-arguments
+    def __init__(self, channel, managed_call, managed_calls, method,
+                 request_serializer, response_deserializer, zero_copy_receive):
         self._channel = channel
         self._managed_call = managed_call
+        self._managed_calls = managed_calls
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._zero_copy_receive = zero_copy_receive
+        # Batches of completed blocking calls, ready to be filled again.
+        self._idle_batches = collections.deque()
+
+    def _batch(self, metadata, serialized_request):
+        try:
+            batch = self._idle_batches.pop()
+        except IndexError:
+            batch = cygrpc.UnaryUnaryClientBatch(self._zero_copy_receive)
+        batch.fill(metadata, serialized_request)
+        return batch
 
     def _prepare(self, request, timeout, metadata):
         deadline, serialized_request, rendezvous = (_start_unary_request(
@@ -454,14 +645,7 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             return None, None, None, rendezvous
         else:
             state = _RPCState(_UNARY_UNARY_INITIAL_DUE, None, None, None, None)
-            operations = (
-                cygrpc.SendInitialMetadataOperation(metadata, _EMPTY_FLAGS),
-                cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
-                cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
-                cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
-                cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
-                cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
-            )
+            operations = self._batch(metadata, serialized_request)
             return state, operations, deadline, None
 
     def _blocking(self, request, timeout, metadata, credentials):
@@ -470,15 +654,23 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
         if rendezvous:
             raise rendezvous
         else:
-            completion_queue = cygrpc.CompletionQueue()
+            completion_queue = _acquire_blocking_completion_queue()
             call = self._channel.create_call(None, 0, completion_queue,
                                              self._method, None, deadline)
             if credentials is not None:
                 call.set_credentials(credentials._credentials)
             call_error = call.start_client_batch(operations, None)
-            _check_call_error(call_error, metadata)
+            if call_error != cygrpc.CallError.ok:
+                # Nothing was started against the queue, so it may be kept;
+                # the batch is dropped rather than recycled.
+                _release_blocking_completion_queue(completion_queue)
+                _check_call_error(call_error, metadata)
             _handle_event(completion_queue.poll(), state,
                           self._response_deserializer)
+            _release_blocking_completion_queue(completion_queue)
+            # Only a batch whose event has been delivered is ready to be filled
+            # again.
+            self._idle_batches.append(operations)
             return state, call, deadline
 
     def __call__(self, request, timeout=None, metadata=None, credentials=None):
@@ -512,16 +704,68 @@ class _UnaryUnaryMultiCallable(grpc.UnaryUnaryMultiCallable):
             return _Rendezvous(state, call, self._response_deserializer,
                                deadline)
 
+    def batch(self, requests, timeout=None, metadata=None, credentials=None):
+        deadline = _deadline(timeout)
+        rendezvouses = []
+        prepared = []
+        for request in requests:
+            state, operations, _, rendezvous = self._prepare(
+                request, timeout, metadata)
+            if rendezvous:
+                rendezvouses.append(rendezvous)
+            else:
+                prepared.append((len(rendezvouses), state, operations))
+                rendezvouses.append(None)
+        if not prepared:
+            return rendezvouses
+        calls, drive_calls = self._managed_calls(None, 0, self._method, None,
+                                                 deadline, len(prepared))
+        if credentials is not None:
+            for call in calls:
+                call.set_credentials(credentials._credentials)
+        event_handlers = [
+            _event_handler(state, call, self._response_deserializer)
+            for call, (_, state, _) in zip(calls, prepared)
+        ]
+        # As in future, every event handler must be kept from running until
+        # its call has been handed to drive_calls.
+        for _, state, _ in prepared:
+            state.condition.acquire()
+        try:
+            call_errors = cygrpc.start_client_batches(
+                calls, [operations for _, _, operations in prepared],
+                event_handlers)
+            started_calls = []
+            for call, call_error, (index, state, _) in zip(
+                    calls, call_errors, prepared):
+                if call_error == cygrpc.CallError.ok:
+                    started_calls.append(call)
+                    rendezvouses[index] = _Rendezvous(
+                        state, call, self._response_deserializer, deadline)
+                else:
+                    _call_error_set_RPCstate(state, call_error, metadata)
+                    rendezvouses[index] = _Rendezvous(state, None, None,
+                                                      deadline)
+            drive_calls(started_calls)
+        finally:
+            for _, state, _ in prepared:
+                state.condition.release()
+        return rendezvouses
+
 
 class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
 
+    # pylint: disable=too-many-arguments
     def __init__(self, channel, managed_call, method, request_serializer,
-                 response_deserializer):
+                 response_deserializer, response_prefetch_depth,
+                 zero_copy_receive):
         self._channel = channel
         self._managed_call = managed_call
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._response_prefetch_depth = response_prefetch_depth
+        self._zero_copy_receive = zero_copy_receive
 
     def __call__(self, request, timeout=None, metadata=None, credentials=None):
         deadline, serialized_request, rendezvous = (_start_unary_request(
@@ -530,6 +774,8 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
             raise rendezvous
         else:
             state = _RPCState(_UNARY_STREAM_INITIAL_DUE, None, None, None, None)
+            state.prefetch_depth = self._response_prefetch_depth
+            state.zero_copy_receive = self._zero_copy_receive
             call, drive_call = self._managed_call(None, 0, self._method, None,
                                                   deadline)
             if credentials is not None:
@@ -540,36 +786,49 @@ class _UnaryStreamMultiCallable(grpc.UnaryStreamMultiCallable):
                 call.start_client_batch(
                     (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
                     event_handler)
-                operations = (
-                    cygrpc.SendInitialMetadataOperation(metadata, _EMPTY_FLAGS),
-                    cygrpc.SendMessageOperation(serialized_request,
-                                                _EMPTY_FLAGS),
-                    cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
-                    cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
-                )
+                operations = cygrpc.UnaryStreamClientBatch()
+                operations.fill(metadata, serialized_request)
                 call_error = call.start_client_batch(operations, event_handler)
                 if call_error != cygrpc.CallError.ok:
                     _call_error_set_RPCstate(state, call_error, metadata)
                     return _Rendezvous(state, None, None, deadline)
                 drive_call()
+                _receive_ahead(state, call, self._response_deserializer)
             return _Rendezvous(state, call, self._response_deserializer,
                                deadline)
 
 
 class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
 
+    # pylint: disable=too-many-arguments
     def __init__(self, channel, managed_call, method, request_serializer,
-                 response_deserializer):
+                 response_deserializer, request_send_window,
+                 zero_copy_receive):
         self._channel = channel
         self._managed_call = managed_call
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._request_send_window = request_send_window
+        self._zero_copy_receive = zero_copy_receive
+        # Batches of completed blocking calls, ready to be filled again.
+        self._idle_batches = collections.deque()
+
+    def _batch(self, metadata):
+        try:
+            batch = self._idle_batches.pop()
+        except IndexError:
+            batch = cygrpc.StreamUnaryClientBatch(self._zero_copy_receive)
+        batch.fill(metadata)
+        return batch
 
     def _blocking(self, request_iterator, timeout, metadata, credentials):
+        if request_iterator is None:
+            raise ValueError(
+                'A request iterator is required for a blocking invocation!')
         deadline = _deadline(timeout)
         state = _RPCState(_STREAM_UNARY_INITIAL_DUE, None, None, None, None)
-        completion_queue = cygrpc.CompletionQueue()
+        completion_queue = _acquire_blocking_completion_queue()
         call = self._channel.create_call(None, 0, completion_queue,
                                          self._method, None, deadline)
         if credentials is not None:
@@ -577,22 +836,24 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
         with state.condition:
             call.start_client_batch(
                 (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),), None)
-            operations = (
-                cygrpc.SendInitialMetadataOperation(metadata, _EMPTY_FLAGS),
-                cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
-                cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
-            )
+            operations = self._batch(metadata)
             call_error = call.start_client_batch(operations, None)
             _check_call_error(call_error, metadata)
             _consume_request_iterator(request_iterator, state, call,
-                                      self._request_serializer)
+                                      self._request_serializer,
+                                      self._response_deserializer,
+                                      self._request_send_window)
         while True:
             event = completion_queue.poll()
             with state.condition:
                 _handle_event(event, state, self._response_deserializer)
+                _send_unsent_requests(state, call,
+                                      self._response_deserializer)
                 state.condition.notify_all()
                 if not state.due:
                     break
+        _release_blocking_completion_queue(completion_queue)
+        self._idle_batches.append(operations)
         return state, call, deadline
 
     def __call__(self,
@@ -629,30 +890,41 @@ class _StreamUnaryMultiCallable(grpc.StreamUnaryMultiCallable):
             call.start_client_batch(
                 (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
                 event_handler)
-            operations = (
-                cygrpc.SendInitialMetadataOperation(metadata, _EMPTY_FLAGS),
-                cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
-                cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
-            )
+            operations = self._batch(metadata)
             call_error = call.start_client_batch(operations, event_handler)
             if call_error != cygrpc.CallError.ok:
                 _call_error_set_RPCstate(state, call_error, metadata)
+                if request_iterator is None:
+                    return _RequestStreamingRendezvous(
+                        state, None, None, deadline, None,
+                        self._request_send_window)
                 return _Rendezvous(state, None, None, deadline)
             drive_call()
+            if request_iterator is None:
+                return _RequestStreamingRendezvous(
+                    state, call, self._response_deserializer, deadline,
+                    self._request_serializer, self._request_send_window)
             _consume_request_iterator(request_iterator, state, call,
-                                      self._request_serializer)
+                                      self._request_serializer,
+                                      self._response_deserializer,
+                                      self._request_send_window)
         return _Rendezvous(state, call, self._response_deserializer, deadline)
 
 
 class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
 
+    # pylint: disable=too-many-arguments
     def __init__(self, channel, managed_call, method, request_serializer,
-                 response_deserializer):
+                 response_deserializer, request_send_window,
+                 response_prefetch_depth, zero_copy_receive):
         self._channel = channel
         self._managed_call = managed_call
         self._method = method
         self._request_serializer = request_serializer
         self._response_deserializer = response_deserializer
+        self._request_send_window = request_send_window
+        self._response_prefetch_depth = response_prefetch_depth
+        self._zero_copy_receive = zero_copy_receive
 
     def __call__(self,
                  request_iterator,
@@ -661,6 +933,8 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
                  credentials=None):
         deadline = _deadline(timeout)
         state = _RPCState(_STREAM_STREAM_INITIAL_DUE, None, None, None, None)
+        state.prefetch_depth = self._response_prefetch_depth
+        state.zero_copy_receive = self._zero_copy_receive
         call, drive_call = self._managed_call(None, 0, self._method, None,
                                               deadline)
         if credentials is not None:
@@ -677,10 +951,21 @@ class _StreamStreamMultiCallable(grpc.StreamStreamMultiCallable):
             call_error = call.start_client_batch(operations, event_handler)
             if call_error != cygrpc.CallError.ok:
                 _call_error_set_RPCstate(state, call_error, metadata)
+                if request_iterator is None:
+                    return _RequestStreamingRendezvous(
+                        state, None, None, deadline, None,
+                        self._request_send_window)
                 return _Rendezvous(state, None, None, deadline)
             drive_call()
+            _receive_ahead(state, call, self._response_deserializer)
+            if request_iterator is None:
+                return _RequestStreamingRendezvous(
+                    state, call, self._response_deserializer, deadline,
+                    self._request_serializer, self._request_send_window)
             _consume_request_iterator(request_iterator, state, call,
-                                      self._request_serializer)
+                                      self._request_serializer,
+                                      self._response_deserializer,
+                                      self._request_send_window)
         return _Rendezvous(state, call, self._response_deserializer, deadline)
 
 
@@ -697,11 +982,18 @@ def _run_channel_spin_thread(state):
 
     def channel_spin():
         while True:
-            event = state.completion_queue.poll()
-            completed_call = event.tag(event)
-            if completed_call is not None:
+            any_call_completed = False
+            for event in state.completion_queue.poll_many(
+                    _MAXIMUM_EVENTS_PER_POLL):
+                completed_call = event.tag(event)
+                if completed_call is not None:
+                    any_call_completed = True
+                    with state.lock:
+                        state.managed_calls.remove(completed_call)
+            # A burst may hold events of calls started after the last managed
+            # call in it completed, so only a whole burst may empty the set.
+            if any_call_completed:
                 with state.lock:
-                    state.managed_calls.remove(completed_call)
                     if not state.managed_calls:
                         state.managed_calls = None
                         return
@@ -754,14 +1046,54 @@ def _channel_managed_call_management(state):
     return create
 
 
+def _channel_managed_calls_management(state):
+
+    def create(parent, flags, method, host, deadline, count):
+        """Creates several managed cygrpc.Calls and a function to drive them.
+
+    The returned function must be called with the list of those returned
+    cygrpc.Calls to which operations were successfully added.
+
+    Args:
+      parent: A cygrpc.Call to be used as the parent of the created calls.
+      flags: An integer bitfield of call flags.
+      method: The RPC method.
+      host: A host string for the created calls.
+      deadline: A float to be the deadline of the created calls or None if the
+        calls are to have an infinite deadline.
+      count: The number of calls to create.
+
+    Returns:
+      A list of cygrpc.Calls with which to conduct RPCs and a function to call
+        with those on which operations were successfully started.
+    """
+        calls = state.channel.create_calls(parent, flags,
+                                           state.completion_queue, method, host,
+                                           deadline, count)
+
+        def drive(started_calls):
+            if not started_calls:
+                return
+            with state.lock:
+                if state.managed_calls is None:
+                    state.managed_calls = set(started_calls)
+                    _run_channel_spin_thread(state)
+                else:
+                    state.managed_calls.update(started_calls)
+
+        return calls, drive
+
+    return create
+
+
 class _ChannelConnectivityState(object):
 
     def __init__(self, channel):
         self.lock = threading.RLock()
         self.channel = channel
+        # Whether a watch of the channel's connectivity is pending.
         self.polling = False
         self.connectivity = None
-        self.try_to_connect = False
         self.callbacks_and_connectivities = []
         self.delivering = False
 
@@ -804,47 +1136,83 @@ def _spawn_delivery(state, callbacks):
     state.delivering = True
 
 
-# NOTE(https://github.com/grpc/grpc/issues/3064): We'd rather not poll.
-def _poll_connectivity(state, channel, initial_try_to_connect):
-    try_to_connect = initial_try_to_connect
-    connectivity = channel.check_connectivity_state(try_to_connect)
-    with state.lock:
-        state.connectivity = (
-            _common.CYGRPC_CONNECTIVITY_STATE_TO_CHANNEL_CONNECTIVITY[
-                connectivity])
-        callbacks = tuple(callback
-                          for callback, unused_but_known_to_be_none_connectivity
-                          in state.callbacks_and_connectivities)
-        for callback_and_connectivity in state.callbacks_and_connectivities:
-            callback_and_connectivity[1] = state.connectivity
+def _update_connectivity(state, connectivity):
+    """Records a channel's connectivity and delivers it to subscribers.
+
+    Must be called with state.lock held.
+    """
+    state.connectivity = (
+        _common.CYGRPC_CONNECTIVITY_STATE_TO_CHANNEL_CONNECTIVITY[connectivity])
+    if not state.delivering:
+        # NOTE(nathaniel): The field is only ever used as a
+        # sequence so it's fine that both lists and tuples are
+        # assigned to it.
+        callbacks = _deliveries(state)  # pylint: disable=redefined-variable-type
         if callbacks:
             _spawn_delivery(state, callbacks)
-    completion_queue = cygrpc.CompletionQueue()
-    while True:
-        channel.watch_connectivity_state(connectivity,
-                                         time.time() + 0.2, completion_queue,
-                                         None)
-        event = completion_queue.poll()
-        with state.lock:
-            if not state.callbacks_and_connectivities and not state.try_to_connect:
-                state.polling = False
-                state.connectivity = None
-                break
-            try_to_connect = state.try_to_connect
-            state.try_to_connect = False
-        if event.success or try_to_connect:
-            connectivity = channel.check_connectivity_state(try_to_connect)
-            with state.lock:
-                state.connectivity = (
-                    _common.CYGRPC_CONNECTIVITY_STATE_TO_CHANNEL_CONNECTIVITY[
-                        connectivity])
-                if not state.delivering:
-                    # NOTE(nathaniel): The field is only ever used as a
-                    # sequence so it's fine that both lists and tuples are
-                    # assigned to it.
-                    callbacks = _deliveries(state)  # pylint: disable=redefined-variable-type
-                    if callbacks:
-                        _spawn_delivery(state, callbacks)
+
+
+class _ConnectivityWatcher(object):
+    """Watches the connectivity of every subscribed-to channel in the process.
+
+    A single completion queue and daemon thread serve all channels. Watches
+    are registered without a deadline, so the thread wakes only when some
+    channel's connectivity actually changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._completion_queue = None
+
+    def _serve(self, completion_queue):
+        while True:
+            event = completion_queue.poll()
+            if event.tag is None:
+                continue
+            # The tag is a weak reference so that a pending watch does not keep
+            # its channel alive; the watch of a channel that has been garbage
+            # collected completes with no state to update.
+            state = event.tag()
+            event = None
+            if state is None:
+                continue
+            _on_connectivity_change(state)
+            state = None
+
+    def watch(self, state, connectivity):
+        with self._lock:
+            if self._completion_queue is None:
+                self._completion_queue = cygrpc.CompletionQueue()
+                watching_thread = threading.Thread(
+                    target=self._serve, args=(self._completion_queue,))
+                watching_thread.daemon = True
+                watching_thread.start()
+            completion_queue = self._completion_queue
+        state.channel.watch_connectivity_state(connectivity, None,
+                                               completion_queue,
+                                               weakref.ref(state))
+
+
+_CONNECTIVITY_WATCHER = _ConnectivityWatcher()
+
+
+def _start_watching_connectivity(state, try_to_connect):
+    """Must be called with state.lock held."""
+    connectivity = state.channel.check_connectivity_state(try_to_connect)
+    state.polling = True
+    _update_connectivity(state, connectivity)
+    _CONNECTIVITY_WATCHER.watch(state, connectivity)
+
+
+def _on_connectivity_change(state):
+    with state.lock:
+        if not state.callbacks_and_connectivities:
+            state.polling = False
+            state.connectivity = None
+        else:
+            connectivity = state.channel.check_connectivity_state(False)
+            _update_connectivity(state, connectivity)
+            _CONNECTIVITY_WATCHER.watch(state, connectivity)
 
 
 def _moot(state):
@@ -854,22 +1222,20 @@ def _moot(state):
 
 def _subscribe(state, callback, try_to_connect):
     with state.lock:
-        if not state.callbacks_and_connectivities and not state.polling:
-            polling_thread = _common.CleanupThread(
-                lambda timeout: _moot(state),
-                target=_poll_connectivity,
-                args=(state, state.channel, bool(try_to_connect)))
-            polling_thread.start()
-            state.polling = True
+        if not state.polling:
             state.callbacks_and_connectivities.append([callback, None])
-        elif not state.delivering and state.connectivity is not None:
-            _spawn_delivery(state, (callback,))
-            state.try_to_connect |= bool(try_to_connect)
-            state.callbacks_and_connectivities.append(
-                [callback, state.connectivity])
+            _start_watching_connectivity(state, bool(try_to_connect))
         else:
-            state.try_to_connect |= bool(try_to_connect)
-            state.callbacks_and_connectivities.append([callback, None])
+            if try_to_connect:
+                # A resulting change of connectivity completes the pending
+                # watch, so nothing further need be done to observe it.
+                state.channel.check_connectivity_state(True)
+            if not state.delivering and state.connectivity is not None:
+                _spawn_delivery(state, (callback,))
+                state.callbacks_and_connectivities.append(
+                    [callback, state.connectivity])
+            else:
+                state.callbacks_and_connectivities.append([callback, None])
 
 
 def _unsubscribe(state, callback):
@@ -903,6 +1269,18 @@ class Channel(grpc.Channel):
         """
         self._channel = cygrpc.Channel(
             _common.encode(target), _options(options), credentials)
+        self._request_send_window = max(
+            1,
+            _common.python_option(options, ChannelOptions.RequestSendWindow,
+                                  _DEFAULT_REQUEST_SEND_WINDOW))
+        self._response_prefetch_depth = max(
+            0,
+            _common.python_option(options,
+                                  ChannelOptions.ResponsePrefetchDepth,
+                                  _DEFAULT_RESPONSE_PREFETCH_DEPTH))
+        self._zero_copy_receive = bool(
+            _common.python_option(options, ChannelOptions.ZeroCopyReceive,
+                                  False))
         self._call_state = _ChannelCallState(self._channel)
         self._connectivity_state = _ChannelConnectivityState(self._channel)
 
@@ -923,7 +1301,9 @@ class Channel(grpc.Channel):
                     response_deserializer=None):
         return _UnaryUnaryMultiCallable(
             self._channel, _channel_managed_call_management(self._call_state),
-            _common.encode(method), request_serializer, response_deserializer)
+            _channel_managed_calls_management(self._call_state),
+            _common.encode(method), request_serializer, response_deserializer,
+            self._zero_copy_receive)
 
     def unary_stream(self,
                      method,
@@ -931,7 +1311,8 @@ class Channel(grpc.Channel):
                      response_deserializer=None):
         return _UnaryStreamMultiCallable(
             self._channel, _channel_managed_call_management(self._call_state),
-            _common.encode(method), request_serializer, response_deserializer)
+            _common.encode(method), request_serializer, response_deserializer,
+            self._response_prefetch_depth, self._zero_copy_receive)
 
     def stream_unary(self,
                      method,
@@ -939,7 +1320,8 @@ class Channel(grpc.Channel):
                      response_deserializer=None):
         return _StreamUnaryMultiCallable(
             self._channel, _channel_managed_call_management(self._call_state),
-            _common.encode(method), request_serializer, response_deserializer)
+            _common.encode(method), request_serializer, response_deserializer,
+            self._request_send_window, self._zero_copy_receive)
 
     def stream_stream(self,
                       method,
@@ -947,7 +1329,9 @@ class Channel(grpc.Channel):
                       response_deserializer=None):
         return _StreamStreamMultiCallable(
             self._channel, _channel_managed_call_management(self._call_state),
-            _common.encode(method), request_serializer, response_deserializer)
+            _common.encode(method), request_serializer, response_deserializer,
+            self._request_send_window, self._response_prefetch_depth,
+            self._zero_copy_receive)
 
     def __del__(self):
         _moot(self._connectivity_state)
@@ -103,6 +103,23 @@ def fully_qualified_method(group, method):
     return '/{}/{}'.format(group, method)
 
 
+def python_option(options, key, default):
+    """Looks up an option unique to gRPC Python among channel or server options.
+
+    Args:
+      options: A sequence of key-value pairs.
+      key: One of the grpc.experimental.ChannelOptions keys.
+      default: The value to return if options contains no value for key.
+
+    Returns:
+      The value given for key in options, or default.
+    """
+    for option_key, option_value in options:
+        if option_key == key:
+            return option_value
+    return default
+
+
 class CleanupThread(threading.Thread):
     """A threading.Thread subclass supporting custom behavior on join().
 
@@ -13,6 +13,10 @@
 # limitations under the License.
 
 
+cdef void _hold_runtime()
+cdef void _release_runtime()
+
+
 cdef class Call:
 
   cdef grpc_call *c_call
@@ -13,26 +13,54 @@
 # limitations under the License.
 
 cimport cpython
+cimport cython
 
 
+# The number of live objects sharing one reference on the gRPC runtime. The
+# count is kept under the GIL, so that creating and destroying a call takes
+# the runtime's global lock only when the first holder is created or the last
+# is destroyed.
+cdef size_t _runtime_holders = 0
+
+
+cdef void _hold_runtime():
+  global _runtime_holders
+  if _runtime_holders == 0:
+    grpc_init()
+  _runtime_holders += 1
+
+
+cdef void _release_runtime():
+  global _runtime_holders
+  _runtime_holders -= 1
+  if _runtime_holders == 0:
+    grpc_shutdown()
+
+
+@cython.freelist(64)
 cdef class Call:
 
   def __cinit__(self):
     # Create an *empty* call
-    grpc_init()
+    _hold_runtime()
     self.c_call = NULL
     self.references = []
 
   def _start_batch(self, operations, tag, retain_self):
     if not self.is_valid:
       raise ValueError("invalid call object cannot be used from Python")
-    cdef _BatchOperationTag batch_operation_tag = _BatchOperationTag(
+    cdef _BatchOperationTag batch_operation_tag = _batch_operation_tag(
         tag, operations, self if retain_self else None)
     batch_operation_tag.prepare()
     cpython.Py_INCREF(batch_operation_tag)
-    return grpc_call_start_batch(
+    cdef grpc_call_error result = grpc_call_start_batch(
           self.c_call, batch_operation_tag.c_ops, batch_operation_tag.c_nops,
           <cpython.PyObject *>batch_operation_tag, NULL)
+    if result != GRPC_CALL_OK:
+      # The core will deliver no event for a batch it did not start.
+      batch_operation_tag.unprepare()
+      cpython.Py_DECREF(batch_operation_tag)
+    return result
 
   def start_client_batch(self, operations, tag):
     # We don't reference this call in the operations tag because
@@ -84,10 +112,94 @@ cdef class Call:
   def __dealloc__(self):
     if self.c_call != NULL:
       grpc_call_unref(self.c_call)
-    grpc_shutdown()
+    _release_runtime()
 
   # The object *should* always be valid from Python. Used for debugging.
   @property
   def is_valid(self):
     return self.c_call != NULL
 
+
+def start_client_batches(calls, operations, tags):
+  """Starts one batch of operations on each of several client calls.
+
+  The batches are prepared with the GIL held and then started on the core in
+  a single loop with the GIL released.
+
+  Args:
+    calls: A sequence of Calls.
+    operations: A sequence, parallel to calls, of sequences of Operations or
+      of ClientBatches.
+    tags: A sequence, parallel to calls, of user tags.
+
+  Returns:
+    A list, parallel to calls, of the grpc_call_error results of starting each
+    batch. A batch that cannot be prepared, or whose call is invalid, is not
+    started and is reported as GRPC_CALL_ERROR.
+  """
+  cdef size_t count = len(calls)
+  if count == 0:
+    return []
+  cdef Call call
+  cdef _BatchOperationTag batch_operation_tag
+  cdef size_t index
+  cdef bint started = False
+  cdef grpc_call **c_calls = <grpc_call **>gpr_malloc(
+      sizeof(grpc_call *) * count)
+  cdef grpc_call_error *c_call_errors = <grpc_call_error *>gpr_malloc(
+      sizeof(grpc_call_error) * count)
+  cdef void **c_tag_pointers = <void **>gpr_malloc(sizeof(void *) * count)
+  cdef grpc_op **c_ops = <grpc_op **>gpr_malloc(sizeof(grpc_op *) * count)
+  cdef size_t *c_nops = <size_t *>gpr_malloc(sizeof(size_t) * count)
+  call_errors = [GRPC_CALL_OK] * count
+  batch_operation_tags = [None] * count
+  try:
+    for index in range(count):
+      # A call whose batch cannot be prepared is reported as failing to start
+      # and left out of the batches started.
+      c_calls[index] = NULL
+      call = calls[index]
+      if not call.is_valid:
+        call_errors[index] = GRPC_CALL_ERROR
+        continue
+      batch_operation_tag = _batch_operation_tag(
+          tags[index], operations[index], None)
+      try:
+        batch_operation_tag.prepare()
+      except Exception:
+        call_errors[index] = GRPC_CALL_ERROR
+        continue
+      cpython.Py_INCREF(batch_operation_tag)
+      batch_operation_tags[index] = batch_operation_tag
+      c_calls[index] = call.c_call
+      c_tag_pointers[index] = <void *>batch_operation_tag
+      c_ops[index] = batch_operation_tag.c_ops
+      c_nops[index] = batch_operation_tag.c_nops
+    with nogil:
+      for index in range(count):
+        if c_calls[index] != NULL:
+          c_call_errors[index] = grpc_call_start_batch(
+              c_calls[index], c_ops[index], c_nops[index],
+              c_tag_pointers[index], NULL)
+    started = True
+    for index in range(count):
+      if c_calls[index] != NULL:
+        call_errors[index] = c_call_errors[index]
+        if c_call_errors[index] != GRPC_CALL_OK:
+          # The core will never complete this batch, so its tag is released
+          # here.
+          batch_operation_tag = batch_operation_tags[index]
+          batch_operation_tag.unprepare()
+          cpython.Py_DECREF(batch_operation_tag)
+  finally:
+    if not started:
+      for batch_operation_tag in batch_operation_tags:
+        if batch_operation_tag is not None:
+          batch_operation_tag.unprepare()
+          cpython.Py_DECREF(batch_operation_tag)
+    gpr_free(c_calls)
+    gpr_free(c_call_errors)
+    gpr_free(c_tag_pointers)
+    gpr_free(c_ops)
+    gpr_free(c_nops)
+  return call_errors
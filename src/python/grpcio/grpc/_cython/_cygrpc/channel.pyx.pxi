@@ -64,6 +64,49 @@ cdef class Channel:
       grpc_slice_unref(host_slice)
     return operation_call
 
+  def create_calls(self, Call parent, int flags,
+                   CompletionQueue queue not None,
+                   method, host, object deadline, int count):
+    """Creates count calls sharing a method, host and deadline.
+
+    The core calls are created in a single loop with the GIL released.
+    """
+    if queue.is_shutting_down:
+      raise ValueError("queue must not be shutting down or shutdown")
+    if count <= 0:
+      return []
+    cdef grpc_slice method_slice = _slice_from_bytes(method)
+    cdef grpc_slice host_slice
+    cdef grpc_slice *host_slice_ptr = NULL
+    if host is not None:
+      host_slice = _slice_from_bytes(host)
+      host_slice_ptr = &host_slice
+    cdef grpc_call *parent_call = NULL
+    if parent is not None:
+      parent_call = parent.c_call
+    cdef gpr_timespec c_deadline = _timespec_from_time(deadline)
+    cdef grpc_call **c_calls = <grpc_call **>gpr_malloc(
+        sizeof(grpc_call *) * count)
+    cdef int index
+    with nogil:
+      for index in range(count):
+        c_calls[index] = grpc_channel_create_call(
+            self.c_channel, parent_call, flags,
+            queue.c_completion_queue, method_slice, host_slice_ptr,
+            c_deadline, NULL)
+    grpc_slice_unref(method_slice)
+    if host_slice_ptr:
+      grpc_slice_unref(host_slice)
+    cdef Call operation_call
+    calls = []
+    for index in range(count):
+      operation_call = Call()
+      operation_call.references = [self, queue]
+      operation_call.c_call = c_calls[index]
+      calls.append(operation_call)
+    gpr_free(c_calls)
+    return calls
+
   def check_connectivity_state(self, bint try_to_connect):
     cdef grpc_connectivity_state result
     with nogil:
@@ -18,5 +18,8 @@ cdef class CompletionQueue:
   cdef grpc_completion_queue *c_completion_queue
   cdef bint is_shutting_down
   cdef bint is_shutdown
+  # Events interpreted by a poll_many that raised, yet to be returned.
+  cdef list _pending_events
 
   cdef _interpret_event(self, grpc_event event)
+  cdef grpc_event _poll(self, deadline) except *
@@ -17,7 +17,36 @@ cimport cpython
 import threading
 import time
 
-cdef int _INTERRUPT_CHECK_PERIOD_MS = 200
+# The period with which a poll on the main thread wakes up to let Python handle
+# signals.
+cdef int _interrupt_check_period_ms = 200
+
+
+def set_interrupt_check_period(period):
+  """Sets how often a poll on the main thread wakes to handle signals.
+
+  Args:
+    period: The number of seconds, at least one millisecond, between wake-ups.
+  """
+  global _interrupt_check_period_ms
+  cdef int period_ms = int(period * 1000)
+  if period_ms < 1:
+    raise ValueError(
+        'interrupt check period must be at least one millisecond')
+  _interrupt_check_period_ms = period_ms
+
+
+try:
+  _main_thread = threading.main_thread
+except AttributeError:
+  # Python 2 has no threading.main_thread. The thread that imports this module
+  # stands in for it, since grpc is normally first imported on the main thread.
+  _MAIN_THREAD = threading.current_thread()
+  _main_thread = lambda: _MAIN_THREAD
+
+
+cdef bint _on_main_thread():
+  return threading.current_thread() is _main_thread()
 
 
 cdef class CompletionQueue:
@@ -35,9 +64,11 @@ cdef class CompletionQueue:
       self.c_completion_queue = grpc_completion_queue_create_for_next(NULL)
     self.is_shutting_down = False
     self.is_shutdown = False
+    self._pending_events = []
 
   cdef _interpret_event(self, grpc_event event):
     cdef _Tag tag = None
+    _release_deferred_message_buffers()
     if event.type == GRPC_QUEUE_TIMEOUT:
       # NOTE(nathaniel): For now we coopt ConnectivityEvent here.
       return ConnectivityEvent(GRPC_QUEUE_TIMEOUT, False, None)
@@ -52,18 +83,24 @@ cdef class CompletionQueue:
       cpython.Py_DECREF(tag)
       return tag.event(event)
 
-  def poll(self, deadline=None):
-    # We name this 'poll' to avoid problems with CPython's expectations for
-    # 'special' methods (like next and __next__).
+  cdef grpc_event _poll(self, deadline) except *:
     cdef gpr_timespec c_increment
     cdef gpr_timespec c_timeout
     cdef gpr_timespec c_deadline
+    cdef grpc_event event
     if deadline is None:
       c_deadline = gpr_inf_future(GPR_CLOCK_REALTIME)
     else:
       c_deadline = _timespec_from_time(deadline)
+    if not _on_main_thread():
+      # Python delivers signals only to the main thread, so there is nothing
+      # to wake up for before the deadline.
+      with nogil:
+        event = grpc_completion_queue_next(
+            self.c_completion_queue, c_deadline, NULL)
+      return event
     with nogil:
-      c_increment = gpr_time_from_millis(_INTERRUPT_CHECK_PERIOD_MS, GPR_TIMESPAN)
+      c_increment = gpr_time_from_millis(_interrupt_check_period_ms, GPR_TIMESPAN)
 
       while True:
         c_timeout = gpr_time_add(gpr_now(GPR_CLOCK_REALTIME), c_increment)
@@ -77,7 +114,71 @@ cdef class CompletionQueue:
         # Handle any signals
         with gil:
           cpython.PyErr_CheckSignals()
-    return self._interpret_event(event)
+    return event
+
+  def poll(self, deadline=None):
+    # We name this 'poll' to avoid problems with CPython's expectations for
+    # 'special' methods (like next and __next__).
+    if self._pending_events:
+      return self._pending_events.pop(0)
+    return self._interpret_event(self._poll(deadline))
+
+  def poll_many(self, int max_events, deadline=None):
+    """Polls for a burst of events.
+
+    Blocks as poll does until an event is ready or deadline passes, then
+    takes every further event already ready, up to max_events in all,
+    without blocking and without holding the GIL.
+
+    Args:
+      max_events: The maximum number of events to return; at least one.
+      deadline: The deadline, as for poll.
+
+    Returns:
+      A nonempty list of events, of which only the first may be a timeout and
+        only the last may be the queue's shutdown.
+    """
+    if max_events < 1:
+      raise ValueError('max_events must be at least one')
+    if self._pending_events:
+      events = self._pending_events[:max_events]
+      del self._pending_events[:max_events]
+      return events
+    cdef grpc_event event = self._poll(deadline)
+    if event.type != GRPC_OP_COMPLETE or max_events == 1:
+      return [self._interpret_event(event)]
+    cdef gpr_timespec c_past = gpr_inf_past(GPR_CLOCK_REALTIME)
+    cdef grpc_event *c_events = <grpc_event *>gpr_malloc(
+        sizeof(grpc_event) * max_events)
+    cdef int count = 1
+    c_events[0] = event
+    with nogil:
+      while count < max_events:
+        event = grpc_completion_queue_next(
+            self.c_completion_queue, c_past, NULL)
+        if event.type == GRPC_QUEUE_TIMEOUT:
+          break
+        c_events[count] = event
+        count += 1
+        if event.type == GRPC_QUEUE_SHUTDOWN:
+          break
+    # Every event taken from the core must reach Python, or its tag would
+    # never be released and its RPC never progress. An exception raised in
+    # interpreting one event is raised only after all have been interpreted,
+    # and the interpreted events are then returned by the next poll.
+    events = []
+    first_exception = None
+    for index in range(count):
+      try:
+        events.append(self._interpret_event(c_events[index]))
+      except Exception as exception:
+        if first_exception is None:
+          first_exception = exception
+    gpr_free(c_events)
+    if first_exception is not None:
+      self._pending_events.extend(events)
+      raise first_exception
+    return events
 
   def shutdown(self):
     with nogil:
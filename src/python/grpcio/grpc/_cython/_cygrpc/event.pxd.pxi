@@ -27,7 +27,7 @@ cdef class RequestCallEvent:
   cdef readonly object tag
   cdef readonly Call call
   cdef readonly CallDetails call_details
-  cdef readonly tuple invocation_metadata
+  cdef readonly object invocation_metadata
 
 
 cdef class BatchOperationEvent:
@@ -31,6 +31,17 @@ cdef extern from "grpc/support/alloc.h":
   void *gpr_realloc(void *p, size_t size) nogil
 
 
+cdef extern from "grpc/support/sync.h":
+
+  ctypedef struct gpr_mu:
+    # We don't care about the internals
+    pass
+
+  void gpr_mu_init(gpr_mu *mu) nogil
+  void gpr_mu_lock(gpr_mu *mu) nogil
+  void gpr_mu_unlock(gpr_mu *mu) nogil
+
+
 cdef extern from "grpc/byte_buffer_reader.h":
 
   struct grpc_byte_buffer_reader:
@@ -51,10 +62,13 @@ cdef extern from "grpc/grpc.h":
   grpc_slice grpc_slice_new(void *p, size_t len, void (*destroy)(void *)) nogil
   grpc_slice grpc_slice_new_with_len(
       void *p, size_t len, void (*destroy)(void *, size_t)) nogil
+  grpc_slice grpc_slice_new_with_user_data(
+      void *p, size_t len, void (*destroy)(void *), void *user_data) nogil
   grpc_slice grpc_slice_malloc(size_t length) nogil
   grpc_slice grpc_slice_from_copied_string(const char *source) nogil
   grpc_slice grpc_slice_from_copied_buffer(const char *source, size_t len) nogil
   grpc_slice grpc_slice_copy(grpc_slice s) nogil
+  grpc_slice grpc_slice_intern(grpc_slice s) nogil
 
   # Declare functions for function-like macros (because Cython)...
   void *grpc_slice_start_ptr "GRPC_SLICE_START_PTR" (grpc_slice s) nogil
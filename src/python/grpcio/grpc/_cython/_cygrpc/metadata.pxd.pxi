@@ -13,6 +13,19 @@
 # limitations under the License.
 
 
+cdef class _InternedSlice:
+
+  cdef grpc_slice c_slice
+
+
+cdef class _Metadata:
+
+  cdef tuple _entries
+  cdef list _metadata
+
+  cdef object _metadatum(self, Py_ssize_t index)
+
+
 cdef void _store_c_metadata(
     metadata, grpc_metadata **c_metadata, size_t *c_count)
 
@@ -20,7 +33,4 @@ cdef void _store_c_metadata(
 cdef void _release_c_metadata(grpc_metadata *c_metadata, int count)
 
 
-cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice)
-
-
-cdef tuple _metadata(grpc_metadata_array *c_metadata_array)
+cdef _Metadata _metadata(grpc_metadata_array *c_metadata_array)
@@ -13,13 +13,59 @@
 # limitations under the License.
 
 import collections
+try:
+  from collections import abc as collections_abc
+except ImportError:
+  # Python 2 keeps the abstract base classes in collections itself.
+  collections_abc = collections
 
 
 _Metadatum = collections.namedtuple('_Metadatum', ('key', 'value',))
 
+# Keys common enough in application metadata that their slices are interned
+# once and shared by every call that sends them.
+_STATIC_METADATA_KEYS = {
+    key: _encode(key)
+    for key in (
+        'authorization', b'authorization',
+        'user-agent', b'user-agent',
+        'x-request-id', b'x-request-id',
+    )
+}
+_interned_metadata_keys = {}
+
+
+cdef class _InternedSlice:
+
+  def __cinit__(self, bytes value):
+    _hold_runtime()
+    cdef grpc_slice value_slice = _slice_from_bytes(value)
+    with nogil:
+      self.c_slice = grpc_slice_intern(value_slice)
+      grpc_slice_unref(value_slice)
+
+  def __dealloc__(self):
+    with nogil:
+      grpc_slice_unref(self.c_slice)
+    _release_runtime()
+
+
+cdef _InternedSlice _interned_metadata_key(key):
+  try:
+    return _interned_metadata_keys[key]
+  except (KeyError, TypeError):
+    encoded_key = _STATIC_METADATA_KEYS.get(key) if isinstance(
+        key, (bytes, str, unicode)) else None
+    if encoded_key is None:
+      return None
+    else:
+      return _interned_metadata_keys.setdefault(
+          key, _InternedSlice(encoded_key))
+
 
 cdef void _store_c_metadata(
     metadata, grpc_metadata **c_metadata, size_t *c_count):
+  cdef _InternedSlice interned_key
   if metadata is None:
     c_count[0] = 0
     c_metadata[0] = NULL
@@ -33,9 +79,15 @@ cdef void _store_c_metadata(
       c_metadata[0] = <grpc_metadata *>gpr_malloc(
           metadatum_count * sizeof(grpc_metadata))
       for index, (key, value) in enumerate(metadata):
-        encoded_key = _encode(key)
-        encoded_value = value if encoded_key[-4:] == b'-bin' else _encode(value)
-        c_metadata[0][index].key = _slice_from_bytes(encoded_key)
+        interned_key = _interned_metadata_key(key)
+        if interned_key is None:
+          encoded_key = _encode(key)
+          encoded_value = (
+              value if encoded_key[-4:] == b'-bin' else _encode(value))
+          c_metadata[0][index].key = _slice_from_bytes(encoded_key)
+        else:
+          encoded_value = _encode(value)
+          c_metadata[0][index].key = grpc_slice_ref(interned_key.c_slice)
         c_metadata[0][index].value = _slice_from_bytes(encoded_value)
 
 
@@ -47,16 +99,86 @@ cdef void _release_c_metadata(grpc_metadata *c_metadata, int count):
     gpr_free(c_metadata)
 
 
-cdef tuple _metadatum(grpc_slice key_slice, grpc_slice value_slice):
-  cdef bytes key = _slice_bytes(key_slice)
-  cdef bytes value = _slice_bytes(value_slice)
-  return <tuple>_Metadatum(
-      _decode(key), value if key[-4:] == b'-bin' else _decode(value))
+cdef class _Metadata:
+  """A sequence of received metadata decoded only as it is accessed.
+
+  The raw keys and values are held in a single flat tuple; each metadatum is
+  decoded into a (key, value) pair the first time it is read.
+  """
+
+  def __cinit__(self, tuple entries):
+    self._entries = entries
+    self._metadata = [None] * (len(entries) // 2)
+
+  cdef object _metadatum(self, Py_ssize_t index):
+    metadatum = self._metadata[index]
+    if metadatum is None:
+      key = self._entries[2 * index]
+      value = self._entries[2 * index + 1]
+      metadatum = _Metadatum(
+          _decode(key), value if key[-4:] == b'-bin' else _decode(value))
+      self._metadata[index] = metadatum
+    return metadatum
+
+  def __len__(self):
+    return len(self._metadata)
+
+  def __getitem__(self, index):
+    if isinstance(index, slice):
+      return tuple(
+          self._metadatum(item_index)
+          for item_index in range(*index.indices(len(self._metadata))))
+    elif index < 0:
+      index += len(self._metadata)
+    if index < 0 or len(self._metadata) <= index:
+      raise IndexError('metadata index out of range')
+    return self._metadatum(index)
+
+  def __iter__(self):
+    for index in range(len(self._metadata)):
+      yield self._metadatum(index)
+
+  def __reversed__(self):
+    for index in reversed(range(len(self._metadata))):
+      yield self._metadatum(index)
+
+  def __contains__(self, metadatum):
+    return any(metadatum == candidate for candidate in self)
+
+  def index(self, metadatum):
+    return tuple(self).index(metadatum)
+
+  def count(self, metadatum):
+    return tuple(self).count(metadatum)
+
+  def __add__(left, right):
+    # Cython calls __add__ of an extension type for either operand order, so
+    # self may be on either side.
+    if (isinstance(left, (_Metadata, tuple)) and
+        isinstance(right, (_Metadata, tuple))):
+      return tuple(left) + tuple(right)
+    else:
+      return NotImplemented
+
+  def __richcmp__(self, other, int op):
+    if isinstance(other, (_Metadata, tuple)):
+      return cpython.PyObject_RichCompare(tuple(self), tuple(other), op)
+    else:
+      return NotImplemented
+
+  def __hash__(self):
+    return hash(tuple(self))
+
+  def __repr__(self):
+    return repr(tuple(self))
+
+
+collections_abc.Sequence.register(_Metadata)
 
 
-cdef tuple _metadata(grpc_metadata_array *c_metadata_array):
-  return tuple(
-      _metadatum(
-          c_metadata_array.metadata[index].key,
-          c_metadata_array.metadata[index].value)
-      for index in range(c_metadata_array.count))
+cdef _Metadata _metadata(grpc_metadata_array *c_metadata_array):
+  cdef list entries = []
+  for index in range(c_metadata_array.count):
+    entries.append(_slice_bytes(c_metadata_array.metadata[index].key))
+    entries.append(_slice_bytes(c_metadata_array.metadata[index].value))
+  return _Metadata(tuple(entries))
@@ -33,10 +33,36 @@ cdef class SendInitialMetadataOperation(Operation):
   cdef void un_c(self)
 
 
+cdef struct _MessageBuffer:
+
+  Py_buffer view
+  # The next of the buffers whose slices the core has dropped.
+  _MessageBuffer *next
+
+
+cdef void _release_message_buffer(_MessageBuffer *message_buffer)
+
+
+cdef void _defer_message_buffer_release(void *user_data) nogil
+
+
+cdef void _release_deferred_message_buffers()
+
+
+cdef _MessageBuffer *_acquire_message_buffer(object message) except *
+
+
+cdef grpc_byte_buffer *_message_byte_buffer(
+    object message, _MessageBuffer *message_buffer)
+
+
 cdef class SendMessageOperation(Operation):
 
-  cdef readonly bytes _message
+  cdef readonly object _message
   cdef readonly int _flags
+  # The exported buffer of a message large enough to be sent without copying,
+  # owned by this operation until c() hands it to the message's grpc_slice.
+  cdef _MessageBuffer *_c_message_buffer
   cdef grpc_byte_buffer *_c_message_byte_buffer
 
   cdef void c(self)
@@ -68,18 +94,31 @@ cdef class SendStatusFromServerOperation(Operation):
 cdef class ReceiveInitialMetadataOperation(Operation):
 
   cdef readonly int _flags
-  cdef tuple _initial_metadata
+  cdef object _initial_metadata
   cdef grpc_metadata_array _c_initial_metadata
 
   cdef void c(self)
   cdef void un_c(self)
 
 
+cdef class SliceBuffer:
+
+  cdef grpc_slice _c_slice
+
+
+cdef object _zero_copy_message(grpc_byte_buffer_reader *message_reader)
+
+
+cdef object _received_message(
+    grpc_byte_buffer *message_byte_buffer, bint zero_copy)
+
+
 cdef class ReceiveMessageOperation(Operation):
 
   cdef readonly int _flags
+  cdef bint _zero_copy
   cdef grpc_byte_buffer *_c_message_byte_buffer
-  cdef bytes _message
+  cdef object _message
 
   cdef void c(self)
   cdef void un_c(self)
@@ -91,7 +130,7 @@ cdef class ReceiveStatusOnClientOperation(Operation):
   cdef grpc_metadata_array _c_trailing_metadata
   cdef grpc_status_code _c_code
   cdef grpc_slice _c_details
-  cdef tuple _trailing_metadata
+  cdef object _trailing_metadata
   cdef object _code
   cdef str _details
 
@@ -107,3 +146,51 @@ cdef class ReceiveCloseOnServerOperation(Operation):
 
   cdef void c(self)
   cdef void un_c(self)
+
+
+cdef class ClientBatch:
+
+  cdef grpc_op c_ops[6]
+  cdef size_t c_nops
+  cdef bint _zero_copy
+  cdef bint _sends_request
+  cdef bint _receives_initial_metadata
+  cdef bint _receives_response
+  cdef tuple _operation_types
+  cdef object _invocation_metadata
+  cdef object _request
+  cdef _MessageBuffer *_c_message_buffer
+  cdef grpc_metadata *_c_invocation_metadata
+  cdef size_t _c_invocation_metadata_count
+  cdef grpc_byte_buffer *_c_request_byte_buffer
+  cdef grpc_metadata_array _c_initial_metadata
+  cdef grpc_byte_buffer *_c_response_byte_buffer
+  cdef grpc_metadata_array _c_trailing_metadata
+  cdef grpc_status_code _c_code
+  cdef grpc_slice _c_details
+  cdef object _initial_metadata
+  cdef object _response
+  cdef object _trailing_metadata
+  cdef object _code
+  cdef str _details
+
+  cdef void _lay_out(
+      self, bint sends_request, bint receives_initial_metadata,
+      bint receives_response)
+  cdef void c(self)
+  cdef void un_c(self)
+
+
+cdef class UnaryUnaryClientBatch(ClientBatch):
+
+  pass
+
+
+cdef class UnaryStreamClientBatch(ClientBatch):
+
+  pass
+
+
+cdef class StreamUnaryClientBatch(ClientBatch):
+
+  pass
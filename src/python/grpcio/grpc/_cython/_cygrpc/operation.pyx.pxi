@@ -46,11 +46,103 @@ cdef class SendInitialMetadataOperation(Operation):
         self._c_initial_metadata, self._c_initial_metadata_count)
 
 
+# Messages at least this long are sent from the application's own memory
+# rather than copied into a slice; below it the copy is cheaper than the
+# bookkeeping.
+cdef Py_ssize_t _ZERO_COPY_SEND_THRESHOLD = 16 * 1024
+
+
+# The buffers of dropped zero-copy slices, awaiting release with the GIL held.
+# The core may drop a slice on one of its own threads, or while the
+# interpreter is finalizing, so the slice's destructor must not take the GIL.
+cdef gpr_mu _deferred_message_buffers_mu
+cdef _MessageBuffer *_deferred_message_buffers = NULL
+gpr_mu_init(&_deferred_message_buffers_mu)
+
+
+cdef void _release_message_buffer(_MessageBuffer *message_buffer):
+  cpython.PyBuffer_Release(&message_buffer.view)
+  gpr_free(message_buffer)
+
+
+cdef void _defer_message_buffer_release(void *user_data) nogil:
+  global _deferred_message_buffers
+  cdef _MessageBuffer *message_buffer = <_MessageBuffer *>user_data
+  gpr_mu_lock(&_deferred_message_buffers_mu)
+  message_buffer.next = _deferred_message_buffers
+  _deferred_message_buffers = message_buffer
+  gpr_mu_unlock(&_deferred_message_buffers_mu)
+
+
+cdef void _release_deferred_message_buffers():
+  """Releases the buffers of dropped slices; must be called with the GIL."""
+  global _deferred_message_buffers
+  gpr_mu_lock(&_deferred_message_buffers_mu)
+  cdef _MessageBuffer *message_buffer = _deferred_message_buffers
+  _deferred_message_buffers = NULL
+  gpr_mu_unlock(&_deferred_message_buffers_mu)
+  cdef _MessageBuffer *next_message_buffer
+  while message_buffer != NULL:
+    next_message_buffer = message_buffer.next
+    _release_message_buffer(message_buffer)
+    message_buffer = next_message_buffer
+
+
+cdef _MessageBuffer *_acquire_message_buffer(object message) except *:
+  """Exports message's buffer, or returns NULL if message is to be copied."""
+  _release_deferred_message_buffers()
+  if isinstance(message, bytes) and len(message) < _ZERO_COPY_SEND_THRESHOLD:
+    return NULL
+  cdef _MessageBuffer *message_buffer = <_MessageBuffer *>gpr_malloc(
+      sizeof(_MessageBuffer))
+  try:
+    cpython.PyObject_GetBuffer(
+        message, &message_buffer.view, cpython.PyBUF_SIMPLE)
+  except:
+    gpr_free(message_buffer)
+    raise
+  return message_buffer
+
+
+cdef grpc_byte_buffer *_message_byte_buffer(
+    object message, _MessageBuffer *message_buffer):
+  """Makes a byte buffer of message, taking ownership of message_buffer.
+
+  A large message's slice refers to the message's own memory and holds
+  message_buffer until the core drops the slice, which may be after the
+  send has completed.
+  """
+  cdef grpc_slice message_slice
+  if message_buffer == NULL:
+    message_slice = grpc_slice_from_copied_buffer(message, len(message))
+  elif message_buffer.view.len < _ZERO_COPY_SEND_THRESHOLD:
+    message_slice = grpc_slice_from_copied_buffer(
+        <const char *>message_buffer.view.buf, message_buffer.view.len)
+    _release_message_buffer(message_buffer)
+  else:
+    message_slice = grpc_slice_new_with_user_data(
+        message_buffer.view.buf, message_buffer.view.len,
+        _defer_message_buffer_release, message_buffer)
+  cdef grpc_byte_buffer *message_byte_buffer = grpc_raw_byte_buffer_create(
+      &message_slice, 1)
+  grpc_slice_unref(message_slice)
+  return message_byte_buffer
+
+
 cdef class SendMessageOperation(Operation):
 
-  def __cinit__(self, bytes message, int flags):
+  def __cinit__(self, object message, int flags):
+    """Constructor.
+
+    Args:
+      message: The serialized message; bytes or any other object exporting a
+        contiguous buffer. A large non-bytes message's memory is sent in place
+        and so must not be modified until the RPC has completed.
+      flags: An integer bitfield of write flags.
+    """
     self._message = message
     self._flags = flags
+    self._c_message_buffer = _acquire_message_buffer(message)
 
   def type(self):
     return GRPC_OP_SEND_MESSAGE
@@ -58,16 +150,18 @@ cdef class SendMessageOperation(Operation):
   cdef void c(self):
     self.c_op.type = GRPC_OP_SEND_MESSAGE
     self.c_op.flags = self._flags
-    cdef grpc_slice message_slice = grpc_slice_from_copied_buffer(
-        self._message, len(self._message))
-    self._c_message_byte_buffer = grpc_raw_byte_buffer_create(
-        &message_slice, 1)
-    grpc_slice_unref(message_slice)
+    self._c_message_byte_buffer = _message_byte_buffer(
+        self._message, self._c_message_buffer)
+    self._c_message_buffer = NULL
     self.c_op.data.send_message.send_message = self._c_message_byte_buffer
 
   cdef void un_c(self):
     grpc_byte_buffer_destroy(self._c_message_byte_buffer)
 
+  def __dealloc__(self):
+    if self._c_message_buffer != NULL:
+      _release_message_buffer(self._c_message_buffer)
+
 
 cdef class SendCloseFromClientOperation(Operation):
 
@@ -139,10 +233,89 @@ cdef class ReceiveInitialMetadataOperation(Operation):
     return self._initial_metadata
 
 
+cdef class SliceBuffer:
+  """A read-only buffer-protocol view of a received message's memory.
+
+  The view holds a reference on the underlying grpc_slice, so the message's
+  bytes are neither copied out of the slice nor freed while the view (or any
+  memoryview taken of it) is alive.
+  """
+
+  def __dealloc__(self):
+    grpc_slice_unref(self._c_slice)
+
+  def __getbuffer__(self, Py_buffer *buffer, int flags):
+    cpython.PyBuffer_FillInfo(
+        buffer, self, grpc_slice_start_ptr(self._c_slice),
+        grpc_slice_length(self._c_slice), 1, flags)
+
+  def __releasebuffer__(self, Py_buffer *buffer):
+    pass
+
+  def __len__(self):
+    return grpc_slice_length(self._c_slice)
+
+
+cdef SliceBuffer _slice_buffer(grpc_slice c_slice):
+  """Wraps c_slice, taking ownership of the caller's reference to it."""
+  cdef SliceBuffer slice_buffer = SliceBuffer.__new__(SliceBuffer)
+  slice_buffer._c_slice = c_slice
+  return slice_buffer
+
+
+cdef object _zero_copy_message(grpc_byte_buffer_reader *message_reader):
+  cdef grpc_slice message_slice
+  slice_buffers = []
+  while grpc_byte_buffer_reader_next(message_reader, &message_slice):
+    slice_buffers.append(_slice_buffer(message_slice))
+  if not slice_buffers:
+    return memoryview(b'')
+  elif len(slice_buffers) == 1:
+    return memoryview(slice_buffers[0])
+  else:
+    # The message did not arrive contiguously; gather it with the one copy
+    # that presenting it as a single buffer requires.
+    message = bytearray()
+    for slice_buffer in slice_buffers:
+      message += slice_buffer
+    return memoryview(message)
+
+
+cdef object _received_message(
+    grpc_byte_buffer *message_byte_buffer, bint zero_copy):
+  """Reads a received message, destroying message_byte_buffer."""
+  cdef grpc_byte_buffer_reader message_reader
+  cdef bint message_reader_status
+  cdef grpc_slice message_slice
+  cdef size_t message_slice_length
+  cdef void *message_slice_pointer
+  if message_byte_buffer == NULL:
+    return None
+  message_reader_status = grpc_byte_buffer_reader_init(
+      &message_reader, message_byte_buffer)
+  if message_reader_status:
+    if zero_copy:
+      received_message = _zero_copy_message(&message_reader)
+    else:
+      message = bytearray()
+      while grpc_byte_buffer_reader_next(&message_reader, &message_slice):
+        message_slice_pointer = grpc_slice_start_ptr(message_slice)
+        message_slice_length = grpc_slice_length(message_slice)
+        message += (<char *>message_slice_pointer)[:message_slice_length]
+        grpc_slice_unref(message_slice)
+      received_message = bytes(message)
+    grpc_byte_buffer_reader_destroy(&message_reader)
+  else:
+    received_message = None
+  grpc_byte_buffer_destroy(message_byte_buffer)
+  return received_message
+
+
 cdef class ReceiveMessageOperation(Operation):
 
-  def __cinit__(self, flags):
+  def __cinit__(self, flags, zero_copy=False):
     self._flags = flags
+    self._zero_copy = zero_copy
 
   def type(self):
     return GRPC_OP_RECV_MESSAGE
@@ -150,32 +323,13 @@ cdef class ReceiveMessageOperation(Operation):
   cdef void c(self):
     self.c_op.type = GRPC_OP_RECV_MESSAGE
     self.c_op.flags = self._flags
+    self._c_message_byte_buffer = NULL
     self.c_op.data.receive_message.receive_message = (
         &self._c_message_byte_buffer)
 
   cdef void un_c(self):
-    cdef grpc_byte_buffer_reader message_reader
-    cdef bint message_reader_status
-    cdef grpc_slice message_slice
-    cdef size_t message_slice_length
-    cdef void *message_slice_pointer
-    if self._c_message_byte_buffer != NULL:
-      message_reader_status = grpc_byte_buffer_reader_init(
-          &message_reader, self._c_message_byte_buffer)
-      if message_reader_status:
-        message = bytearray()
-        while grpc_byte_buffer_reader_next(&message_reader, &message_slice):
-          message_slice_pointer = grpc_slice_start_ptr(message_slice)
-          message_slice_length = grpc_slice_length(message_slice)
-          message += (<char *>message_slice_pointer)[:message_slice_length]
-          grpc_slice_unref(message_slice)
-        grpc_byte_buffer_reader_destroy(&message_reader)
-        self._message = bytes(message)
-      else:
-        self._message = None
-      grpc_byte_buffer_destroy(self._c_message_byte_buffer)
-    else:
-      self._message = None
+    self._message = _received_message(
+        self._c_message_byte_buffer, self._zero_copy)
 
   def message(self):
     return self._message
@@ -193,6 +347,7 @@ cdef class ReceiveStatusOnClientOperation(Operation):
     self.c_op.type = GRPC_OP_RECV_STATUS_ON_CLIENT
     self.c_op.flags = self._flags
     grpc_metadata_array_init(&self._c_trailing_metadata)
+    self._c_details = grpc_empty_slice()
     self.c_op.data.receive_status_on_client.trailing_metadata = (
         &self._c_trailing_metadata)
     self.c_op.data.receive_status_on_client.status = (
@@ -235,3 +390,166 @@ cdef class ReceiveCloseOnServerOperation(Operation):
 
   def cancelled(self):
     return self._cancelled
+
+
+cdef class ClientBatch:
+  """A batch of operations that starts an RPC on the client.
+
+  Up to six operations are laid out once in an array owned by this object and
+  are filled in place from the invocation metadata and request given to
+  fill, so that starting the batch allocates neither Operation objects nor
+  an operation array. After the batch's event has been delivered its results
+  are available from this object and it may be filled again for another
+  call. The operations carry no flags.
+
+  The batch always sends the invocation metadata and receives the status;
+  each subclass fixes which of the other operations it carries.
+  """
+
+  def __cinit__(self, bint zero_copy=False):
+    self._zero_copy = zero_copy
+    self._c_message_buffer = NULL
+
+  cdef void _lay_out(
+      self, bint sends_request, bint receives_initial_metadata,
+      bint receives_response):
+    self._sends_request = sends_request
+    self._receives_initial_metadata = receives_initial_metadata
+    self._receives_response = receives_response
+    operation_types = [GRPC_OP_SEND_INITIAL_METADATA]
+    if sends_request:
+      operation_types.extend(
+          (GRPC_OP_SEND_MESSAGE, GRPC_OP_SEND_CLOSE_FROM_CLIENT))
+    if receives_initial_metadata:
+      operation_types.append(GRPC_OP_RECV_INITIAL_METADATA)
+    if receives_response:
+      operation_types.append(GRPC_OP_RECV_MESSAGE)
+    operation_types.append(GRPC_OP_RECV_STATUS_ON_CLIENT)
+    self._operation_types = tuple(operation_types)
+    self.c_nops = len(self._operation_types)
+
+  def operation_types(self):
+    """Returns the cygrpc.OperationType of each of this batch's operations."""
+    return self._operation_types
+
+  def fill(self, invocation_metadata, object request=None):
+    """Prepares this batch to start another call.
+
+    Args:
+      invocation_metadata: The metadata to send to the server.
+      request: The serialized request, for a batch that sends one; any object
+        SendMessageOperation accepts as a message.
+    """
+    cdef _MessageBuffer *request_buffer = NULL
+    if self._sends_request:
+      request_buffer = _acquire_message_buffer(request)
+    if self._c_message_buffer != NULL:
+      _release_message_buffer(self._c_message_buffer)
+    self._invocation_metadata = invocation_metadata
+    self._request = request
+    self._c_message_buffer = request_buffer
+
+  cdef void c(self):
+    cdef grpc_op *c_op = self.c_ops
+    _store_c_metadata(
+        self._invocation_metadata, &self._c_invocation_metadata,
+        &self._c_invocation_metadata_count)
+    c_op.type = GRPC_OP_SEND_INITIAL_METADATA
+    c_op.data.send_initial_metadata.metadata = self._c_invocation_metadata
+    c_op.data.send_initial_metadata.count = self._c_invocation_metadata_count
+    c_op.data.send_initial_metadata.maybe_compression_level.is_set = 0
+    c_op += 1
+    if self._sends_request:
+      self._c_request_byte_buffer = _message_byte_buffer(
+          self._request, self._c_message_buffer)
+      self._c_message_buffer = NULL
+      c_op.type = GRPC_OP_SEND_MESSAGE
+      c_op.data.send_message.send_message = self._c_request_byte_buffer
+      c_op += 1
+      c_op.type = GRPC_OP_SEND_CLOSE_FROM_CLIENT
+      c_op += 1
+    if self._receives_initial_metadata:
+      grpc_metadata_array_init(&self._c_initial_metadata)
+      c_op.type = GRPC_OP_RECV_INITIAL_METADATA
+      c_op.data.receive_initial_metadata.receive_initial_metadata = (
+          &self._c_initial_metadata)
+      c_op += 1
+    if self._receives_response:
+      self._c_response_byte_buffer = NULL
+      c_op.type = GRPC_OP_RECV_MESSAGE
+      c_op.data.receive_message.receive_message = (
+          &self._c_response_byte_buffer)
+      c_op += 1
+    grpc_metadata_array_init(&self._c_trailing_metadata)
+    self._c_details = grpc_empty_slice()
+    c_op.type = GRPC_OP_RECV_STATUS_ON_CLIENT
+    c_op.data.receive_status_on_client.trailing_metadata = (
+        &self._c_trailing_metadata)
+    c_op.data.receive_status_on_client.status = &self._c_code
+    c_op.data.receive_status_on_client.status_details = &self._c_details
+
+  cdef void un_c(self):
+    _release_c_metadata(
+        self._c_invocation_metadata, self._c_invocation_metadata_count)
+    self._invocation_metadata = None
+    if self._sends_request:
+      grpc_byte_buffer_destroy(self._c_request_byte_buffer)
+      self._request = None
+    if self._receives_initial_metadata:
+      self._initial_metadata = _metadata(&self._c_initial_metadata)
+      grpc_metadata_array_destroy(&self._c_initial_metadata)
+    if self._receives_response:
+      self._response = _received_message(
+          self._c_response_byte_buffer, self._zero_copy)
+    self._trailing_metadata = _metadata(&self._c_trailing_metadata)
+    grpc_metadata_array_destroy(&self._c_trailing_metadata)
+    self._code = self._c_code
+    self._details = _decode(_slice_bytes(self._c_details))
+    grpc_slice_unref(self._c_details)
+
+  def initial_metadata(self):
+    return self._initial_metadata
+
+  def message(self):
+    return self._response
+
+  def trailing_metadata(self):
+    return self._trailing_metadata
+
+  def code(self):
+    return self._code
+
+  def details(self):
+    return self._details
+
+  def __dealloc__(self):
+    if self._c_message_buffer != NULL:
+      _release_message_buffer(self._c_message_buffer)
+
+
+cdef class UnaryUnaryClientBatch(ClientBatch):
+  """The batch of all six operations of a unary-unary RPC."""
+
+  def __cinit__(self, bint zero_copy=False):
+    self._lay_out(True, True, True)
+
+
+cdef class UnaryStreamClientBatch(ClientBatch):
+  """The batch that sends the request of a unary-stream RPC.
+
+  The initial metadata and responses are received by batches of their own.
+  """
+
+  def __cinit__(self, bint zero_copy=False):
+    self._lay_out(True, False, False)
+
+
+cdef class StreamUnaryClientBatch(ClientBatch):
+  """The batch that receives the response of a stream-unary RPC.
+
+  The initial metadata is received and the requests are sent by batches of
+  their own. StreamUnaryClientBatch.fill takes no request.
+  """
+
+  def __cinit__(self, bint zero_copy=False):
+    self._lay_out(False, False, True)
@@ -123,17 +123,18 @@ class CompressionLevel:
   high = GRPC_COMPRESS_LEVEL_HIGH
 
 
+@cython.freelist(64)
 cdef class CallDetails:
 
   def __cinit__(self):
-    grpc_init()
+    _hold_runtime()
     with nogil:
       grpc_call_details_init(&self.c_details)
 
   def __dealloc__(self):
     with nogil:
       grpc_call_details_destroy(&self.c_details)
-    grpc_shutdown()
+    _release_runtime()
 
   @property
   def method(self):
@@ -81,15 +81,20 @@ cdef class Server:
       raise ValueError("server must be started and not shutting down")
     if server_queue not in self.registered_completion_queues:
       raise ValueError("server_queue must be a registered completion queue")
-    cdef _RequestCallTag request_call_tag = _RequestCallTag(tag)
+    cdef _RequestCallTag request_call_tag = _request_call_tag(tag)
     request_call_tag.prepare()
     cpython.Py_INCREF(request_call_tag)
-    return grpc_server_request_call(
+    cdef grpc_call_error result = grpc_server_request_call(
         self.c_server, &request_call_tag.call.c_call,
         &request_call_tag.call_details.c_details,
         &request_call_tag.c_invocation_metadata,
         call_queue.c_completion_queue, server_queue.c_completion_queue,
         <cpython.PyObject *>request_call_tag)
+    if result != GRPC_CALL_OK:
+      # The core will deliver no event for a request it did not accept.
+      request_call_tag.unprepare()
+      cpython.Py_DECREF(request_call_tag)
+    return result
 
   def register_completion_queue(
       self, CompletionQueue queue not None):
@@ -33,9 +33,15 @@ cdef class _RequestCallTag(_Tag):
   cdef grpc_metadata_array c_invocation_metadata
 
   cdef void prepare(self)
+  # Releases a prepared tag whose request the core did not accept.
+  cdef void unprepare(self)
+  cdef void _recycle(self)
   cdef RequestCallEvent event(self, grpc_event c_event)
 
 
+cdef _RequestCallTag _request_call_tag(user_tag)
+
+
 cdef class _BatchOperationTag(_Tag):
 
   cdef object _user_tag
@@ -44,10 +50,20 @@ cdef class _BatchOperationTag(_Tag):
   cdef grpc_op *c_ops
   cdef size_t c_nops
 
-  cdef void prepare(self)
+  cdef int prepare(self) except -1
+  # Releases the resources of a prepared batch that the core did not start.
+  cdef void unprepare(self)
   cdef BatchOperationEvent event(self, grpc_event c_event)
 
 
+cdef class _ClientBatchTag(_BatchOperationTag):
+
+  pass
+
+
+cdef _BatchOperationTag _batch_operation_tag(user_tag, operations, call)
+
+
 cdef class _ServerShutdownTag(_Tag):
 
   cdef readonly object _user_tag
@@ -28,6 +28,21 @@ cdef class _ConnectivityTag(_Tag):
     return ConnectivityEvent(c_event.type, c_event.success, self._user_tag)
 
 
+# The most _RequestCallTags kept for reuse once their events are delivered.
+cdef int _MAXIMUM_IDLE_REQUEST_CALL_TAGS = 64
+cdef list _idle_request_call_tags = []
+
+
+cdef _RequestCallTag _request_call_tag(user_tag):
+  cdef _RequestCallTag request_call_tag
+  if _idle_request_call_tags:
+    request_call_tag = _idle_request_call_tags.pop()
+    request_call_tag._user_tag = user_tag
+    return request_call_tag
+  else:
+    return _RequestCallTag(user_tag)
+
+
 cdef class _RequestCallTag(_Tag):
 
   def __cinit__(self, user_tag):
@@ -40,12 +55,26 @@ cdef class _RequestCallTag(_Tag):
     self.call_details = CallDetails()
     grpc_metadata_array_init(&self.c_invocation_metadata)
 
+  cdef void _recycle(self):
+    # The core is done with this tag, so it may be used again.
+    self._user_tag = None
+    self.call = None
+    self.call_details = None
+    if len(_idle_request_call_tags) < _MAXIMUM_IDLE_REQUEST_CALL_TAGS:
+      _idle_request_call_tags.append(self)
+
+  cdef void unprepare(self):
+    grpc_metadata_array_destroy(&self.c_invocation_metadata)
+    self._recycle()
+
   cdef RequestCallEvent event(self, grpc_event c_event):
-    cdef tuple invocation_metadata = _metadata(&self.c_invocation_metadata)
+    cdef _Metadata invocation_metadata = _metadata(&self.c_invocation_metadata)
     grpc_metadata_array_destroy(&self.c_invocation_metadata)
-    return RequestCallEvent(
+    request_call_event = RequestCallEvent(
         c_event.type, c_event.success, self._user_tag, self.call,
         self.call_details, invocation_metadata)
+    self._recycle()
+    return request_call_event
 
 
 cdef class _BatchOperationTag:
@@ -55,13 +84,27 @@ cdef class _BatchOperationTag:
     self._operations = operations
     self._retained_call = call
 
-  cdef void prepare(self):
+  cdef int prepare(self) except -1:
+    if self._operations is not None:
+      # Checked before any operation is converted, so that a failure leaves
+      # nothing to release.
+      self._operations = tuple(self._operations)
+      for operation in self._operations:
+        if not isinstance(operation, Operation):
+          raise TypeError('{} is not an Operation'.format(operation))
     self.c_nops = 0 if self._operations is None else len(self._operations)
     if 0 < self.c_nops:
       self.c_ops = <grpc_op *>gpr_malloc(sizeof(grpc_op) * self.c_nops)
       for index, operation in enumerate(self._operations):
         (<Operation>operation).c()
         self.c_ops[index] = (<Operation>operation).c_op
+    return 0
+
+  cdef void unprepare(self):
+    if 0 < self.c_nops:
+      for operation in self._operations:
+        (<Operation>operation).un_c()
+      gpr_free(self.c_ops)
 
   cdef BatchOperationEvent event(self, grpc_event c_event):
     if 0 < self.c_nops:
@@ -76,6 +119,35 @@ cdef class _BatchOperationTag:
           c_event.type, c_event.success, self._user_tag, ())
 
 
+cdef class _ClientBatchTag(_BatchOperationTag):
+  """The tag of a batch whose operations are a ClientBatch.
+
+  The batch's operations are filled in place and are read in place.
+  """
+
+  cdef int prepare(self) except -1:
+    cdef ClientBatch batch = self._operations
+    batch.c()
+    self.c_ops = batch.c_ops
+    self.c_nops = batch.c_nops
+    return 0
+
+  cdef void unprepare(self):
+    (<ClientBatch>self._operations).un_c()
+
+  cdef BatchOperationEvent event(self, grpc_event c_event):
+    (<ClientBatch>self._operations).un_c()
+    return BatchOperationEvent(
+        c_event.type, c_event.success, self._user_tag, self._operations)
+
+
+cdef _BatchOperationTag _batch_operation_tag(user_tag, operations, call):
+  if isinstance(operations, ClientBatch):
+    return _ClientBatchTag(user_tag, operations, call)
+  else:
+    return _BatchOperationTag(user_tag, operations, call)
+
+
 cdef class _ServerShutdownTag(_Tag):
 
   def __cinit__(self, user_tag, shutting_down_server):
@@ -0,0 +1,166 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A server thread pool sized to its load and guarded by CoDel admission."""
+
+import collections
+import threading
+import time
+
+from concurrent import futures
+
+
+class _WorkItem(object):
+
+    def __init__(self, future, fn, args, kwargs, submission_time):
+        self.future = future
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.submission_time = submission_time
+
+    def run(self):
+        if not self.future.set_running_or_notify_cancel():
+            return
+        try:
+            result = self.fn(*self.args, **self.kwargs)
+        except BaseException as exception:  # pylint: disable=broad-except
+            # As in concurrent.futures.thread, even a KeyboardInterrupt or
+            # SystemExit raised by the task is the future's to report.
+            self.future.set_exception(exception)
+        else:
+            self.future.set_result(result)
+
+
+class AdaptiveThreadPoolExecutor(futures.Executor):
+    """A thread pool whose size follows its load and that detects overload.
+
+    Workers are started as work arrives and no worker is idle, up to
+    max_workers, and exit after idling for idle_timeout while more than
+    min_workers remain.
+
+    The time each task waits in the queue is measured and fed to a CoDel
+    (controlled delay) detector: once every task taken from the queue for a
+    whole interval, and the task waiting at its head, has waited longer than
+    target_delay, the pool reports itself overloaded until a task waits less
+    than target_delay or the queue drains. A server given this pool rejects
+    new RPCs with RESOURCE_EXHAUSTED while it is overloaded.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, min_workers, max_workers, idle_timeout, target_delay,
+                 interval):
+        if min_workers < 0 or max_workers < 1 or max_workers < min_workers:
+            raise ValueError(
+                'Must have 0 <= min_workers <= max_workers and 1 <= max_workers!'
+            )
+        self._min_workers = min_workers
+        self._max_workers = max_workers
+        self._idle_timeout = idle_timeout
+        self._target_delay = target_delay
+        self._interval = interval
+        self._condition = threading.Condition()
+        self._work_items = collections.deque()
+        self._threads = set()
+        self._idle_worker_count = 0
+        self._shutdown = False
+        self._first_above_target_time = None
+        self._overloaded = False
+
+    def _observe_delay(self, delay, now):
+        """Must be called with self._condition held."""
+        if delay < self._target_delay:
+            self._first_above_target_time = None
+            self._overloaded = False
+        elif self._first_above_target_time is None:
+            self._first_above_target_time = now
+        elif self._interval <= now - self._first_above_target_time:
+            self._overloaded = True
+
+    def _next_work_item(self):
+        with self._condition:
+            idle_deadline = time.time() + self._idle_timeout
+            while not self._work_items:
+                now = time.time()
+                # An empty queue means that no standing queue has built up.
+                self._first_above_target_time = None
+                self._overloaded = False
+                if self._shutdown or (
+                        idle_deadline <= now and
+                        self._min_workers < len(self._threads)):
+                    self._threads.remove(threading.current_thread())
+                    return None
+                self._idle_worker_count += 1
+                self._condition.wait(idle_deadline - now
+                                     if now < idle_deadline else
+                                     self._idle_timeout)
+                self._idle_worker_count -= 1
+            work_item = self._work_items.popleft()
+            now = time.time()
+            self._observe_delay(now - work_item.submission_time, now)
+            return work_item
+
+    def _work(self):
+        try:
+            while True:
+                work_item = self._next_work_item()
+                if work_item is None:
+                    return
+                work_item.run()
+                work_item = None
+        finally:
+            # A worker leaving other than through _next_work_item must still
+            # stop being counted.
+            with self._condition:
+                self._threads.discard(threading.current_thread())
+
+    def submit(self, fn, *args, **kwargs):
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError('Cannot schedule new futures after shutdown!')
+            future = futures.Future()
+            self._work_items.append(
+                _WorkItem(future, fn, args, kwargs, time.time()))
+            if (self._idle_worker_count < len(self._work_items) and
+                    len(self._threads) < self._max_workers):
+                thread = threading.Thread(target=self._work)
+                thread.daemon = True
+                self._threads.add(thread)
+                thread.start()
+            self._condition.notify()
+            return future
+
+    def overloaded(self):
+        """Describes whether tasks have waited too long in the queue.
+
+        Returns:
+          True if every task taken from the queue over the last interval or
+            more waited longer than the target delay and tasks remain queued.
+        """
+        with self._condition:
+            if not self._work_items:
+                return False
+            # The task at the head of the queue counts as though taken now so
+            # that overload is detected even while every worker is stuck.
+            now = time.time()
+            self._observe_delay(now - self._work_items[0].submission_time, now)
+            return self._overloaded
+
+    def shutdown(self, wait=True):
+        with self._condition:
+            self._shutdown = True
+            self._condition.notify_all()
+            threads = tuple(self._threads)
+        if wait:
+            for thread in threads:
+                thread.join()
@@ -17,26 +17,67 @@ import collections
 import sys
 
 import grpc
+from grpc import experimental
 
 
 class _ServicePipeline(object):
 
     def __init__(self, interceptors):
         self.interceptors = tuple(interceptors)
-
-    def _continuation(self, thunk, index):
-        return lambda context: self._intercept_at(thunk, index, context)
-
-    def _intercept_at(self, thunk, index, context):
-        if index < len(self.interceptors):
+        # The interceptors from this index on are all static.
+        self.static_index = len(self.interceptors)
+        while (0 < self.static_index and isinstance(
+                self.interceptors[self.static_index - 1],
+                experimental.StaticServerInterceptor)):
+            self.static_index -= 1
+
+    def _continuation(self, thunk, index, end):
+        return lambda context: self._intercept_at(thunk, index, end, context)
+
+    def _intercept_at(self, thunk, index, end, context):
+        if index < end:
             interceptor = self.interceptors[index]
-            thunk = self._continuation(thunk, index + 1)
+            thunk = self._continuation(thunk, index + 1, end)
             return interceptor.intercept_service(thunk, context)
         else:
             return thunk(context)
 
-    def execute(self, thunk, context):
-        return self._intercept_at(thunk, 0, context)
+    def _memoizing(self, thunk, memo, method):
+
+        def memoizing(context):
+            if context.method != method:
+                # An interceptor that runs for every RPC has changed its
+                # method, so the result is not that memoized for the method.
+                return self._intercept_at(thunk, self.static_index,
+                                          len(self.interceptors), context)
+            try:
+                return memo[method]
+            except KeyError:
+                result = self._intercept_at(thunk, self.static_index,
+                                            len(self.interceptors), context)
+                memo[method] = result
+                return result
+
+        return memoizing
+
+    def execute(self, thunk, context, memo=None):
+        """Runs the interceptors around thunk.
+
+        Args:
+          thunk: The handler lookup behind the interceptors.
+          context: The HandlerCallDetails of the RPC.
+          memo: An optional dictionary from the method of context to the
+            result of the static interceptors ending the pipeline, in which
+            case thunk must depend only on the method of the
+            HandlerCallDetails given it.
+        """
+        if memo is None:
+            return self._intercept_at(thunk, 0, len(self.interceptors),
+                                      context)
+        else:
+            return self._intercept_at(
+                self._memoizing(thunk, memo, context.method), 0,
+                self.static_index, context)
 
 
 def service_pipeline(interceptors):
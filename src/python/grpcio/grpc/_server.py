@@ -15,7 +15,11 @@
 
 import collections
 import enum
+import errno
 import logging
+import os
+import signal
+import socket
 import threading
 import time
 
@@ -23,12 +27,14 @@ import six
 
 import grpc
 from grpc import _common
+from grpc import _executor
 from grpc import _interceptor
+from grpc import _utilities
 from grpc._cython import cygrpc
+from grpc.experimental import ChannelOptions
 from grpc.framework.foundation import callable_util
 
 _SHUTDOWN_TAG = 'shutdown'
-_REQUEST_CALL_TAG = 'request_call'
 
 _RECEIVE_CLOSE_ON_SERVER_TOKEN = 'receive_close_on_server'
 _SEND_INITIAL_METADATA_TOKEN = 'send_initial_metadata'
@@ -48,6 +54,13 @@ _EMPTY_FLAGS = 0
 
 _UNEXPECTED_EXIT_SERVER_GRACE = 1.0
 
+_DEFAULT_REQUEST_CALLS_PER_COMPLETION_QUEUE = 1
+_DEFAULT_RESPONSE_SEND_WINDOW = 1
+_MAXIMUM_EVENTS_PER_POLL = 64
+
+_PREFORK_WORKER_OPTIONS = (('grpc.so_reuseport', 1),)
+_PREFORK_STOP_MESSAGE_SIZE = 64
+
 
 def _serialized_request(request_event):
     return request_event.batch_operations[0].message()
@@ -86,8 +99,10 @@ class _HandlerCallDetails(
 
 class _RPCState(object):
 
-    def __init__(self):
+    def __init__(self, zero_copy_receive=False, response_send_window=1):
         self.condition = threading.Condition()
+        self.zero_copy_receive = zero_copy_receive
+        self.response_send_window = response_send_window
         self.due = set()
         self.request = None
         self.client = _OPEN
@@ -100,6 +115,9 @@ class _RPCState(object):
         self.rpc_errors = []
         self.callbacks = []
         self.abortion = None
+        # Serialized response messages of a response-streaming RPC that are
+        # waiting for the send_message operation in progress to complete.
+        self.unsent_responses = collections.deque()
 
 
 def _raise_rpc_error(state):
@@ -198,16 +216,56 @@ def _send_initial_metadata(state):
     return send_initial_metadata
 
 
-def _send_message(state, token):
+def _send_message(state, call, token):
 
     def send_message(unused_send_message_event):
         with state.condition:
+            rpc_state, callbacks = _possibly_finish_call(state, token)
+            if rpc_state is None:
+                _send_unsent_responses(state, call)
             state.condition.notify_all()
-            return _possibly_finish_call(state, token)
+            return rpc_state, callbacks
 
     return send_message
 
 
+def _response_send_in_progress(state):
+    return (_SEND_MESSAGE_TOKEN in state.due or
+            _SEND_INITIAL_METADATA_AND_SEND_MESSAGE_TOKEN in state.due)
+
+
+def _responses_in_flight(state):
+    in_flight = len(state.unsent_responses)
+    if _response_send_in_progress(state):
+        in_flight += 1
+    return in_flight
+
+
+def _send_unsent_responses(state, call):
+    """Starts the next send of a response-streaming RPC if one may be started.
+
+    Must be called with state.condition held.
+    """
+    if (state.client is _CANCELLED or state.statused or
+            not state.unsent_responses or _response_send_in_progress(state)):
+        return
+    serialized_response = state.unsent_responses.popleft()
+    flags = (cygrpc.WriteFlag.buffer_hint
+             if state.unsent_responses else _EMPTY_FLAGS)
+    if state.initial_metadata_allowed:
+        operations = (
+            cygrpc.SendInitialMetadataOperation(None, _EMPTY_FLAGS),
+            cygrpc.SendMessageOperation(serialized_response, flags),
+        )
+        state.initial_metadata_allowed = False
+        token = _SEND_INITIAL_METADATA_AND_SEND_MESSAGE_TOKEN
+    else:
+        operations = (cygrpc.SendMessageOperation(serialized_response, flags),)
+        token = _SEND_MESSAGE_TOKEN
+    call.start_server_batch(operations, _send_message(state, call, token))
+    state.due.add(token)
+
+
 class _Context(grpc.ServicerContext):
 
     def __init__(self, rpc_event, state, request_deserializer):
@@ -312,7 +370,8 @@ class _RequestIterator(object):
             raise StopIteration()
         else:
             self._call.start_server_batch(
-                (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
+                (cygrpc.ReceiveMessageOperation(
+                    _EMPTY_FLAGS, self._state.zero_copy_receive),),
                 _receive_message(self._state, self._call,
                                  self._request_deserializer))
             self._state.due.add(_RECEIVE_MESSAGE_TOKEN)
@@ -347,34 +406,37 @@ class _RequestIterator(object):
         return self._next()
 
 
-def _unary_request(rpc_event, state, request_deserializer):
+def _receive_unary_request(rpc_event, state, request_deserializer):
+    """Starts receiving the request as soon as the RPC has been accepted.
+
+    Must be called with state.condition held.
+    """
+    rpc_event.call.start_server_batch(
+        (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS,
+                                        state.zero_copy_receive),),
+        _receive_message(state, rpc_event.call, request_deserializer))
+    state.due.add(_RECEIVE_MESSAGE_TOKEN)
+
+
+def _unary_request(rpc_event, state):
 
     def unary_request():
         with state.condition:
-            if state.client is _CANCELLED or state.statused:
-                return None
-            else:
-                rpc_event.call.start_server_batch(
-                    (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),),
-                    _receive_message(state, rpc_event.call,
-                                     request_deserializer))
-                state.due.add(_RECEIVE_MESSAGE_TOKEN)
-                while True:
-                    state.condition.wait()
-                    if state.request is None:
-                        if state.client is _CLOSED:
-                            details = '"{}" requires exactly one request message.'.format(
-                                rpc_event.call_details.method)
-                            _abort(state, rpc_event.call,
-                                   cygrpc.StatusCode.unimplemented,
-                                   _common.encode(details))
-                            return None
-                        elif state.client is _CANCELLED:
-                            return None
-                    else:
-                        request = state.request
-                        state.request = None
-                        return request
+            while state.request is None:
+                if state.client is _CANCELLED or state.statused:
+                    return None
+                elif (state.client is _CLOSED and
+                      _RECEIVE_MESSAGE_TOKEN not in state.due):
+                    details = '"{}" requires exactly one request message.'.format(
+                        rpc_event.call_details.method)
+                    _abort(state, rpc_event.call,
+                           cygrpc.StatusCode.unimplemented,
+                           _common.encode(details))
+                    return None
+                state.condition.wait()
+            request = state.request
+            state.request = None
+            return request
 
     return unary_request
 
@@ -430,29 +492,22 @@ def _send_response(rpc_event, state, serialized_response):
         if state.client is _CANCELLED or state.statused:
             return False
         else:
-            if state.initial_metadata_allowed:
-                operations = (
-                    cygrpc.SendInitialMetadataOperation(None, _EMPTY_FLAGS),
-                    cygrpc.SendMessageOperation(serialized_response,
-                                                _EMPTY_FLAGS),
-                )
-                state.initial_metadata_allowed = False
-                token = _SEND_INITIAL_METADATA_AND_SEND_MESSAGE_TOKEN
-            else:
-                operations = (cygrpc.SendMessageOperation(
-                    serialized_response, _EMPTY_FLAGS),)
-                token = _SEND_MESSAGE_TOKEN
-            rpc_event.call.start_server_batch(operations,
-                                              _send_message(state, token))
-            state.due.add(token)
+            state.unsent_responses.append(serialized_response)
+            _send_unsent_responses(state, rpc_event.call)
             while True:
+                if state.client is _CANCELLED or state.statused:
+                    return False
+                elif _responses_in_flight(state) < state.response_send_window:
+                    return True
                 state.condition.wait()
-                if token not in state.due:
-                    return state.client is not _CANCELLED and not state.statused
 
 
 def _status(rpc_event, state, serialized_response):
     with state.condition:
+        # The status must follow every response already given to _send_response.
+        while (state.client is not _CANCELLED and not state.statused and
+               _responses_in_flight(state)):
+            state.condition.wait()
         if state.client is not _CANCELLED:
             code = _completion_code(state)
             details = _details(state)
@@ -515,9 +570,57 @@ def _stream_response_in_pool(rpc_event, state, behavior, argument_thunk,
                     break
 
 
+def _receive_message_inline(rpc_event, state, method_handler):
+    receive_message = _receive_message(state, rpc_event.call,
+                                       method_handler.request_deserializer)
+
+    def receive_message_inline(receive_message_event):
+        rpc_state, callbacks = receive_message(receive_message_event)
+        if rpc_state is not None:
+            return rpc_state, callbacks
+        with state.condition:
+            request = state.request
+            state.request = None
+            if request is None:
+                if state.client is _CLOSED and not state.statused:
+                    details = '"{}" requires exactly one request message.'.format(
+                        rpc_event.call_details.method)
+                    _abort(state, rpc_event.call,
+                           cygrpc.StatusCode.unimplemented,
+                           _common.encode(details))
+                return None, ()
+        _unary_response_in_pool(rpc_event, state, method_handler.unary_unary,
+                                lambda: request,
+                                method_handler.request_deserializer,
+                                method_handler.response_serializer)
+        with state.condition:
+            # The client may have cancelled the RPC while behavior ran, in
+            # which case no further event will arrive to finish it.
+            if state.client is _CANCELLED and not state.due:
+                callbacks = state.callbacks
+                state.callbacks = None
+                return state, callbacks
+            else:
+                return None, ()
+
+    return receive_message_inline
+
+
+def _handle_unary_unary_inline(rpc_event, state, method_handler):
+    rpc_event.call.start_server_batch(
+        (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS,
+                                        state.zero_copy_receive),),
+        _receive_message_inline(rpc_event, state, method_handler))
+    state.due.add(_RECEIVE_MESSAGE_TOKEN)
+    return None
+
+
 def _handle_unary_unary(rpc_event, state, method_handler, thread_pool):
-    unary_request = _unary_request(rpc_event, state,
-                                   method_handler.request_deserializer)
+    if isinstance(method_handler, _utilities.InlineRpcMethodHandler):
+        return _handle_unary_unary_inline(rpc_event, state, method_handler)
+    _receive_unary_request(rpc_event, state,
+                           method_handler.request_deserializer)
+    unary_request = _unary_request(rpc_event, state)
     return thread_pool.submit(_unary_response_in_pool, rpc_event, state,
                               method_handler.unary_unary, unary_request,
                               method_handler.request_deserializer,
@@ -525,8 +628,9 @@ def _handle_unary_unary(rpc_event, state, method_handler, thread_pool):
 
 
 def _handle_unary_stream(rpc_event, state, method_handler, thread_pool):
-    unary_request = _unary_request(rpc_event, state,
-                                   method_handler.request_deserializer)
+    _receive_unary_request(rpc_event, state,
+                           method_handler.request_deserializer)
+    unary_request = _unary_request(rpc_event, state)
     return thread_pool.submit(_stream_response_in_pool, rpc_event, state,
                               method_handler.unary_stream, unary_request,
                               method_handler.request_deserializer,
@@ -551,24 +655,70 @@ def _handle_stream_stream(rpc_event, state, method_handler, thread_pool):
         method_handler.request_deserializer, method_handler.response_serializer)
 
 
-def _find_method_handler(rpc_event, generic_handlers, interceptor_pipeline):
+class _MethodRoutes(
+        collections.namedtuple('_MethodRoutes', (
+            'method_handlers',
+            'fallback_handlers',
+            'memoized_handlers',
+        ))):
+    pass
+
+
+def _route_methods(generic_handlers):
+    """Compiles generic handlers into a table keyed on raw method names.
+
+    Handlers are consulted in order, so only the DictionaryGenericHandlers
+    preceding the first handler of any other kind can be answered from the
+    table; that handler and all after it are kept as the fallback.
+    """
+    method_handlers = {}
+    for index, generic_handler in enumerate(generic_handlers):
+        # Subclasses may override service(), so they are not compiled.
+        if generic_handler.__class__ is not _utilities.DictionaryGenericHandler:
+            return _MethodRoutes(method_handlers,
+                                 tuple(generic_handlers[index:]), {})
+        for method, method_handler in six.iteritems(
+                generic_handler.method_handlers()):
+            method_handlers.setdefault(_common.encode(method), method_handler)
+    return _MethodRoutes(method_handlers, (), {})
+
+
+def _find_method_handler(rpc_event, routes, interceptor_pipeline):
 
     def query_handlers(handler_call_details):
-        for generic_handler in generic_handlers:
+        method_handler = routes.method_handlers.get(
+            _common.encode(handler_call_details.method))
+        if method_handler is not None:
+            return method_handler
+        for generic_handler in routes.fallback_handlers:
             method_handler = generic_handler.service(handler_call_details)
             if method_handler is not None:
                 return method_handler
         return None
 
+    if interceptor_pipeline is None:
+        method_handler = routes.method_handlers.get(
+            rpc_event.call_details.method)
+        if method_handler is not None or not routes.fallback_handlers:
+            return method_handler
+
     handler_call_details = _HandlerCallDetails(
         _common.decode(rpc_event.call_details.method),
         rpc_event.invocation_metadata)
 
-    if interceptor_pipeline is not None:
+    if interceptor_pipeline is None:
+        return query_handlers(handler_call_details)
+    elif (not routes.fallback_handlers and
+          rpc_event.call_details.method in routes.method_handlers):
+        # Handler lookup depends only on the method, so the results of static
+        # interceptors may be memoized; restricting memoization to registered
+        # methods keeps clients from growing the memo without bound.
         return interceptor_pipeline.execute(query_handlers,
-                                            handler_call_details)
+                                            handler_call_details,
+                                            routes.memoized_handlers)
     else:
-        return query_handlers(handler_call_details)
+        return interceptor_pipeline.execute(query_handlers,
+                                            handler_call_details)
 
 
 def _reject_rpc(rpc_event, status, details):
@@ -584,8 +734,9 @@ def _reject_rpc(rpc_event, status, details):
     return rpc_state
 
 
-def _handle_with_method_handler(rpc_event, method_handler, thread_pool):
-    state = _RPCState()
+def _handle_with_method_handler(rpc_event, method_handler, thread_pool,
+                                zero_copy_receive, response_send_window):
+    state = _RPCState(zero_copy_receive, response_send_window)
     with state.condition:
         rpc_event.call.start_server_batch(
             (cygrpc.ReceiveCloseOnServerOperation(_EMPTY_FLAGS),),
@@ -607,13 +758,13 @@ def _handle_with_method_handler(rpc_event, method_handler, thread_pool):
                                                   method_handler, thread_pool)
 
 
-def _handle_call(rpc_event, generic_handlers, interceptor_pipeline, thread_pool,
-                 concurrency_exceeded):
+def _handle_call(rpc_event, routes, interceptor_pipeline, thread_pool,
+                 exhaustion_details, zero_copy_receive, response_send_window):
     if not rpc_event.success:
         return None, None
     if rpc_event.call_details.method is not None:
         try:
-            method_handler = _find_method_handler(rpc_event, generic_handlers,
+            method_handler = _find_method_handler(rpc_event, routes,
                                                   interceptor_pipeline)
         except Exception as exception:  # pylint: disable=broad-except
             details = 'Exception servicing handler: {}'.format(exception)
@@ -623,16 +774,62 @@ def _handle_call(rpc_event, generic_handlers, interceptor_pipeline, thread_pool,
         if method_handler is None:
             return _reject_rpc(rpc_event, cygrpc.StatusCode.unimplemented,
                                b'Method not found!'), None
-        elif concurrency_exceeded:
+        elif exhaustion_details is not None:
             return _reject_rpc(rpc_event, cygrpc.StatusCode.resource_exhausted,
-                               b'Concurrent RPC limit exceeded!'), None
+                               exhaustion_details), None
         else:
-            return _handle_with_method_handler(rpc_event, method_handler,
-                                               thread_pool)
+            return _handle_with_method_handler(
+                rpc_event, method_handler, thread_pool, zero_copy_receive,
+                response_send_window)
     else:
         return None, None
 
 
+class _RequestCallTag(object):
+    """Tags one outstanding request_call made on a completion queue."""
+
+
+class _Lane(object):
+    """The thread pool and concurrency limit shared by a group of methods."""
+
+    def __init__(self, thread_pool, maximum_concurrent_rpcs):
+        self.thread_pool = thread_pool
+        self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
+        self.active_rpc_count = 0
+
+
+def _compile_lanes(method_lanes, default_lane):
+    """Maps raw method and service names to the _Lanes serving them.
+
+    Names given the same grpc.experimental.server_lane object share a single
+    _Lane, and so a single concurrency limit.
+    """
+    lanes_by_specification = {}
+    lanes = {}
+    for name, specification in six.iteritems(method_lanes):
+        lane = lanes_by_specification.get(id(specification))
+        if lane is None:
+            lane = _Lane(default_lane.thread_pool
+                         if specification.thread_pool is None else
+                         specification.thread_pool,
+                         specification.maximum_concurrent_rpcs)
+            lanes_by_specification[id(specification)] = lane
+        lanes[_common.encode(name).lstrip(b'/')] = lane
+    return lanes
+
+
+def _find_lane(state, method):
+    if state.lanes and method is not None:
+        # Methods are named b'/package.Service/Method'.
+        method = method[1:]
+        lane = state.lanes.get(method)
+        if lane is None:
+            lane = state.lanes.get(method.partition(b'/')[0])
+        if lane is not None:
+            return lane
+    return state.default_lane
+
+
 @enum.unique
 class _ServerStage(enum.Enum):
     STOPPED = 'stopped'
@@ -643,18 +840,24 @@ class _ServerStage(enum.Enum):
 class _ServerState(object):
 
     # pylint: disable=too-many-arguments
-    def __init__(self, completion_queue, server, generic_handlers,
-                 interceptor_pipeline, thread_pool, maximum_concurrent_rpcs):
+    def __init__(self, completion_queues, request_calls_per_completion_queue,
+                 server, generic_handlers, interceptor_pipeline, thread_pool,
+                 maximum_concurrent_rpcs, method_lanes, zero_copy_receive,
+                 response_send_window):
         self.lock = threading.RLock()
-        self.completion_queue = completion_queue
+        self.completion_queues = tuple(completion_queues)
+        self.request_calls_per_completion_queue = (
+            request_calls_per_completion_queue)
         self.server = server
         self.generic_handlers = list(generic_handlers)
+        self.routes = None
         self.interceptor_pipeline = interceptor_pipeline
-        self.thread_pool = thread_pool
         self.stage = _ServerStage.STOPPED
         self.shutdown_events = None
-        self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
-        self.active_rpc_count = 0
+        self.default_lane = _Lane(thread_pool, maximum_concurrent_rpcs)
+        self.lanes = _compile_lanes(method_lanes, self.default_lane)
+        self.zero_copy_receive = zero_copy_receive
+        self.response_send_window = response_send_window
 
         # TODO(https://github.com/grpc/grpc/issues/6597): eliminate these fields.
         self.rpc_states = set()
@@ -664,6 +867,7 @@ class _ServerState(object):
 def _add_generic_handlers(state, generic_handlers):
     with state.lock:
         state.generic_handlers.extend(generic_handlers)
+        state.routes = None
 
 
 def _add_insecure_port(state, address):
@@ -677,68 +881,119 @@ def _add_secure_port(state, address, server_credentials):
                                            server_credentials._credentials)
 
 
-def _request_call(state):
-    state.server.request_call(state.completion_queue, state.completion_queue,
-                              _REQUEST_CALL_TAG)
-    state.due.add(_REQUEST_CALL_TAG)
+def _request_call(state, completion_queue):
+    tag = _RequestCallTag()
+    call_error = state.server.request_call(completion_queue, completion_queue,
+                                           tag)
+    if call_error == cygrpc.CallError.ok:
+        state.due.add(tag)
+    else:
+        # No event will be delivered for a rejected request.
+        logging.error('Failed to request a call: %s', call_error)
 
 
 # TODO(https://github.com/grpc/grpc/issues/6597): delete this function.
 def _stop_serving(state):
     if not state.rpc_states and not state.due:
-        for shutdown_event in state.shutdown_events:
-            shutdown_event.set()
-        state.stage = _ServerStage.STOPPED
+        if state.stage is not _ServerStage.STOPPED:
+            for shutdown_event in state.shutdown_events:
+                shutdown_event.set()
+            state.stage = _ServerStage.STOPPED
+            # Every serving thread is blocked polling its own completion
+            # queue; shutting the queues down wakes them all up to exit.
+            for completion_queue in state.completion_queues:
+                completion_queue.shutdown()
         return True
     else:
         return False
 
 
-def _on_call_completed(state):
-    with state.lock:
-        state.active_rpc_count -= 1
+def _on_call_completed(state, lane):
+
+    def on_call_completed(unused_future):
+        with state.lock:
+            lane.active_rpc_count -= 1
+
+    return on_call_completed
 
 
-def _serve(state):
+def _exhaustion_details(lane):
+    if (lane.maximum_concurrent_rpcs is not None and
+            lane.active_rpc_count >= lane.maximum_concurrent_rpcs):
+        return b'Concurrent RPC limit exceeded!'
+    elif (isinstance(lane.thread_pool, _executor.AdaptiveThreadPoolExecutor) and
+          lane.thread_pool.overloaded()):
+        return b'Server overloaded!'
+    else:
+        return None
+
+
+def _accept_call(state, completion_queue, rpc_event):
+    with state.lock:
+        # Replace the consumed request_call before handling this one so that
+        # the server keeps all of its request_calls posted. The consumed one
+        # stays due until the call has been handled so that the server does
+        # not stop under it.
+        if state.stage is _ServerStage.STARTED:
+            _request_call(state, completion_queue)
+        if state.routes is None:
+            state.routes = _route_methods(state.generic_handlers)
+        routes = state.routes
+        lane = _find_lane(state, rpc_event.call_details.method)
+        exhaustion_details = _exhaustion_details(lane)
+        if exhaustion_details is None:
+            # Reserve the lane's capacity for the call while it is handled
+            # without the lock.
+            lane.active_rpc_count += 1
+
+    # Handler lookup, interceptors and submission to the thread pool run
+    # without the lock so that the pollers of several completion queues
+    # accept calls in parallel.
+    rpc_state, rpc_future = _handle_call(
+        rpc_event, routes, state.interceptor_pipeline, lane.thread_pool,
+        exhaustion_details, state.zero_copy_receive,
+        state.response_send_window)
+
+    with state.lock:
+        state.due.remove(rpc_event.tag)
+        if rpc_state is not None:
+            state.rpc_states.add(rpc_state)
+        if rpc_future is None and exhaustion_details is None:
+            lane.active_rpc_count -= 1
+        if state.stage is not _ServerStage.STARTED:
+            _stop_serving(state)
+    if rpc_future is not None:
+        rpc_future.add_done_callback(_on_call_completed(state, lane))
+
+
+def _serve(state, completion_queue):
     while True:
-        event = state.completion_queue.poll()
-        if event.tag is _SHUTDOWN_TAG:
-            with state.lock:
-                state.due.remove(_SHUTDOWN_TAG)
-                if _stop_serving(state):
-                    return
-        elif event.tag is _REQUEST_CALL_TAG:
-            with state.lock:
-                state.due.remove(_REQUEST_CALL_TAG)
-                concurrency_exceeded = (
-                    state.maximum_concurrent_rpcs is not None and
-                    state.active_rpc_count >= state.maximum_concurrent_rpcs)
-                rpc_state, rpc_future = _handle_call(
-                    event, state.generic_handlers, state.interceptor_pipeline,
-                    state.thread_pool, concurrency_exceeded)
-                if rpc_state is not None:
-                    state.rpc_states.add(rpc_state)
-                if rpc_future is not None:
-                    state.active_rpc_count += 1
-                    rpc_future.add_done_callback(
-                        lambda unused_future: _on_call_completed(state))
-                if state.stage is _ServerStage.STARTED:
-                    _request_call(state)
-                elif _stop_serving(state):
-                    return
-        else:
-            rpc_state, callbacks = event.tag(event)
-            for callback in callbacks:
-                callable_util.call_logging_exceptions(
-                    callback, 'Exception calling callback!')
-            if rpc_state is not None:
+        # Each poll takes up every event already ready, so that bursts of
+        # events are delivered for one release of the GIL.
+        events = completion_queue.poll_many(_MAXIMUM_EVENTS_PER_POLL)
+        for event in events:
+            if event.tag is None:
+                # The queue has been shut down by _stop_serving.
+                return
+            elif event.tag is _SHUTDOWN_TAG:
                 with state.lock:
-                    state.rpc_states.remove(rpc_state)
-                    if _stop_serving(state):
-                        return
-        # We want to force the deletion of the previous event
-        # ~before~ we poll again; if the event has a reference
+                    state.due.remove(_SHUTDOWN_TAG)
+                    _stop_serving(state)
+            elif isinstance(event.tag, _RequestCallTag):
+                _accept_call(state, completion_queue, event)
+            else:
+                rpc_state, callbacks = event.tag(event)
+                for callback in callbacks:
+                    callable_util.call_logging_exceptions(
+                        callback, 'Exception calling callback!')
+                if rpc_state is not None:
+                    with state.lock:
+                        state.rpc_states.remove(rpc_state)
+                        _stop_serving(state)
+        # We want to force the deletion of the previous events
+        # ~before~ we poll again; if an event has a reference
         # to a shutdown Call object, this can induce spinlock.
+        events = None
         event = None
 
 
@@ -750,7 +1005,8 @@ def _stop(state, grace):
             return shutdown_event
         else:
             if state.stage is _ServerStage.STARTED:
-                state.server.shutdown(state.completion_queue, _SHUTDOWN_TAG)
+                state.server.shutdown(state.completion_queues[0],
+                                      _SHUTDOWN_TAG)
                 state.stage = _ServerStage.GRACE
                 state.shutdown_events = []
                 state.due.add(_SHUTDOWN_TAG)
@@ -778,7 +1034,9 @@ def _start(state):
             raise ValueError('Cannot start already-started server!')
         state.server.start()
         state.stage = _ServerStage.STARTED
-        _request_call(state)
+        for completion_queue in state.completion_queues:
+            for _ in range(state.request_calls_per_completion_queue):
+                _request_call(state, completion_queue)
 
         def cleanup_server(timeout):
             if timeout is None:
@@ -786,22 +1044,44 @@ def _start(state):
             else:
                 _stop(state, timeout).wait()
 
-        thread = _common.CleanupThread(
-            cleanup_server, target=_serve, args=(state,))
-        thread.start()
+        for completion_queue in state.completion_queues:
+            thread = _common.CleanupThread(
+                cleanup_server, target=_serve, args=(state, completion_queue))
+            thread.start()
 
 
 class Server(grpc.Server):
 
     # pylint: disable=too-many-arguments
     def __init__(self, thread_pool, generic_handlers, interceptors, options,
-                 maximum_concurrent_rpcs):
-        completion_queue = cygrpc.CompletionQueue()
+                 maximum_concurrent_rpcs, completion_queue_count, method_lanes):
+        if completion_queue_count < 1:
+            raise ValueError('completion_queue_count must be at least 1!')
+        request_calls_per_completion_queue = int(
+            _common.python_option(
+                options, ChannelOptions.RequestCallsPerCompletionQueue,
+                _DEFAULT_REQUEST_CALLS_PER_COMPLETION_QUEUE))
+        if request_calls_per_completion_queue < 1:
+            raise ValueError('{} must be at least 1!'.format(
+                ChannelOptions.RequestCallsPerCompletionQueue))
+        response_send_window = int(
+            _common.python_option(options, ChannelOptions.ResponseSendWindow,
+                                  _DEFAULT_RESPONSE_SEND_WINDOW))
+        if response_send_window < 1:
+            raise ValueError('{} must be at least 1!'.format(
+                ChannelOptions.ResponseSendWindow))
+        completion_queues = tuple(
+            cygrpc.CompletionQueue() for _ in range(completion_queue_count))
         server = cygrpc.Server(options)
-        server.register_completion_queue(completion_queue)
-        self._state = _ServerState(completion_queue, server, generic_handlers,
-                                   _interceptor.service_pipeline(interceptors),
-                                   thread_pool, maximum_concurrent_rpcs)
+        for completion_queue in completion_queues:
+            server.register_completion_queue(completion_queue)
+        self._state = _ServerState(
+            completion_queues, request_calls_per_completion_queue, server,
+            generic_handlers, _interceptor.service_pipeline(interceptors),
+            thread_pool, maximum_concurrent_rpcs, method_lanes,
+            bool(
+                _common.python_option(options, ChannelOptions.ZeroCopyReceive,
+                                      False)), response_send_window)
 
     def add_generic_rpc_handlers(self, generic_rpc_handlers):
         _add_generic_handlers(self._state, generic_rpc_handlers)
@@ -821,3 +1101,213 @@ class Server(grpc.Server):
 
     def __del__(self):
         _stop(self._state, None)
+
+
+class _PreforkWorker(object):
+
+    def __init__(self, pid, stop_pipe):
+        self.pid = pid
+        self.stop_pipe = stop_pipe
+
+
+class _PreforkServerState(object):
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, server_factory, address, server_credentials,
+                 worker_count, reserved_socket):
+        self.lock = threading.Lock()
+        self.server_factory = server_factory
+        self.address = address
+        self.server_credentials = server_credentials
+        self.worker_count = worker_count
+        self.reserved_socket = reserved_socket
+        self.stage = _ServerStage.STOPPED
+        self.shutdown_events = None
+        self.workers = []
+
+
+def _reserve_port(address):
+    host, port = address.rsplit(':', 1)
+    if host.startswith('['):
+        host = host[1:-1]
+    family, socket_type, protocol, _, socket_address = socket.getaddrinfo(
+        host or None, int(port), socket.AF_UNSPEC, socket.SOCK_STREAM, 0,
+        socket.AI_PASSIVE)[0]
+    reserved_socket = socket.socket(family, socket_type, protocol)
+    reserved_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+    reserved_socket.bind(socket_address)
+    return reserved_socket
+
+
+def _serve_prefork_worker(state, stop_pipe):
+    server = state.server_factory(_PREFORK_WORKER_OPTIONS)
+    if state.server_credentials is None:
+        port = server.add_insecure_port(state.address)
+    else:
+        port = server.add_secure_port(state.address, state.server_credentials)
+    if not port:
+        raise RuntimeError('Could not bind {}!'.format(state.address))
+    server.start()
+    # An empty read means that the supervising process has gone away.
+    message = os.read(stop_pipe, _PREFORK_STOP_MESSAGE_SIZE)
+    grace = float(message) if message and message != b'None' else None
+    server.stop(grace).wait()
+
+
+def _fork_prefork_worker(state):
+    stop_pipe, stop_pipe_writer = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(stop_pipe_writer)
+        # Each worker must see end-of-file on its pipe when the supervising
+        # process exits, so no worker may hold another worker's writer.
+        for worker in state.workers:
+            if worker.stop_pipe is not None:
+                os.close(worker.stop_pipe)
+        status = 0
+        try:
+            _serve_prefork_worker(state, stop_pipe)
+        except Exception:  # pylint: disable=broad-except
+            logging.exception('Prefork worker failed!')
+            status = 1
+        os._exit(status)  # pylint: disable=protected-access
+    else:
+        os.close(stop_pipe)
+        return _PreforkWorker(pid, stop_pipe_writer)
+
+
+def _stop_prefork_worker(worker, grace):
+    if worker.stop_pipe is not None:
+        try:
+            os.write(worker.stop_pipe, str(grace).encode('ascii'))
+        except OSError:
+            # The worker has already exited and will be reaped.
+            pass
+        os.close(worker.stop_pipe)
+        worker.stop_pipe = None
+
+
+def _kill_prefork_worker(worker):
+    try:
+        os.kill(worker.pid, signal.SIGKILL)
+    except OSError:
+        # The worker has already exited and will be reaped.
+        pass
+
+
+def _wait_for_prefork_worker(worker):
+    """Blocks until worker has exited and been reaped."""
+    while True:
+        try:
+            os.waitpid(worker.pid, 0)
+            return
+        except OSError as error:
+            # ECHILD means that the worker has already been reaped.
+            if error.errno != errno.EINTR:
+                return
+
+
+def _supervise_prefork_worker(state, worker):
+    _wait_for_prefork_worker(worker)
+    with state.lock:
+        state.workers.remove(worker)
+        if worker.stop_pipe is not None:
+            os.close(worker.stop_pipe)
+            worker.stop_pipe = None
+        if state.stage is _ServerStage.STARTED:
+            logging.warning('Prefork worker %d exited; replacing it.',
+                            worker.pid)
+            _add_prefork_worker(state)
+        elif not state.workers:
+            state.reserved_socket.close()
+            for shutdown_event in state.shutdown_events:
+                shutdown_event.set()
+            state.stage = _ServerStage.STOPPED
+
+
+def _add_prefork_worker(state):
+    """Must be called with state.lock held."""
+    worker = _fork_prefork_worker(state)
+    state.workers.append(worker)
+    # Each worker is waited on by pid, so that children of the process that
+    # are not workers are left to whoever started them.
+    thread = threading.Thread(
+        target=_supervise_prefork_worker, args=(state, worker))
+    thread.daemon = True
+    thread.start()
+
+
+def _start_prefork(state):
+    with state.lock:
+        if state.stage is not _ServerStage.STOPPED:
+            raise ValueError('Cannot start already-started server!')
+        elif state.shutdown_events is not None:
+            raise ValueError('Cannot restart a stopped prefork server!')
+        state.stage = _ServerStage.STARTED
+        for _ in range(state.worker_count):
+            _add_prefork_worker(state)
+
+
+def _stop_prefork(state, grace):
+    with state.lock:
+        if state.stage is _ServerStage.STOPPED:
+            shutdown_event = threading.Event()
+            shutdown_event.set()
+            return shutdown_event
+        else:
+            if state.stage is _ServerStage.STARTED:
+                state.stage = _ServerStage.GRACE
+                state.shutdown_events = []
+                for worker in state.workers:
+                    _stop_prefork_worker(worker, grace)
+            shutdown_event = threading.Event()
+            state.shutdown_events.append(shutdown_event)
+            if grace is not None:
+
+                def kill_workers_after_grace():
+                    if not shutdown_event.wait(timeout=grace):
+                        with state.lock:
+                            for worker in state.workers:
+                                _kill_prefork_worker(worker)
+
+                thread = threading.Thread(target=kill_workers_after_grace)
+                thread.start()
+                return shutdown_event
+    shutdown_event.wait()
+    return shutdown_event
+
+
+class PreforkServer(object):
+    """Services RPCs from several forked processes sharing one port.
+
+    The supervising process binds the port with SO_REUSEPORT so that it stays
+    reserved for the server's lifetime, and forks workers that each create,
+    bind and start a server of their own on the same port. The kernel spreads
+    incoming connections among the workers. Workers that exit while the server
+    is started are replaced; workers that outlast a stop's grace are killed.
+    """
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, server_factory, address, worker_count,
+                 server_credentials):
+        if not hasattr(os, 'fork') or not hasattr(socket, 'SO_REUSEPORT'):
+            raise NotImplementedError(
+                'Prefork serving requires fork and SO_REUSEPORT!')
+        if worker_count < 1:
+            raise ValueError('worker_count must be at least 1!')
+        reserved_socket = _reserve_port(address)
+        self._port = reserved_socket.getsockname()[1]
+        self._state = _PreforkServerState(
+            server_factory, '{}:{}'.format(
+                address.rsplit(':', 1)[0], self._port), server_credentials,
+            worker_count, reserved_socket)
+
+    @property
+    def port(self):
+        return self._port
+
+    def start(self):
+        _start_prefork(self._state)
+
+    def stop(self, grace):
+        return _stop_prefork(self._state, grace)
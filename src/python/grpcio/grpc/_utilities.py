@@ -41,6 +41,10 @@ class RpcMethodHandler(
     pass
 
 
+class InlineRpcMethodHandler(RpcMethodHandler):
+    """An RpcMethodHandler whose behavior runs on the polling thread."""
+
+
 class DictionaryGenericHandler(grpc.ServiceRpcHandler):
 
     def __init__(self, service, method_handlers):
@@ -56,6 +60,10 @@ class DictionaryGenericHandler(grpc.ServiceRpcHandler):
     def service(self, handler_call_details):
         return self._method_handlers.get(handler_call_details.method)
 
+    def method_handlers(self):
+        """Returns a dict from fully-qualified method name to handler."""
+        return self._method_handlers
+
 
 class _ChannelReadyFuture(grpc.Future):
 
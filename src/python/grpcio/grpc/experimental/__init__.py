@@ -0,0 +1,193 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""gRPC's experimental APIs.
+
+These APIs are subject to be removed during any minor version release.
+"""
+
+import collections
+
+import grpc
+
+
+class ChannelOptions(object):
+    """Channel options unique to gRPC Python.
+
+    These keys may be passed alongside the gRPC runtime's own channel arguments
+    in the options given to grpc.insecure_channel and grpc.secure_channel.
+    Those marked as server options are instead passed in the options given to
+    grpc.server.
+
+    Attributes:
+      RequestCallsPerCompletionQueue: Server option. A positive integer number
+        of requests for incoming RPCs the server keeps posted on each of its
+        completion queues. Each request is replaced as soon as an RPC arrives
+        on it, before the RPC is handled, so that bursts of incoming RPCs are
+        accepted concurrently rather than one at a time. Defaults to 1.
+      RequestSendWindow: A positive integer bounding how many request messages of
+        a request-streaming RPC may be taken from the request iterator before
+        earlier ones have been written to the transport. Messages queued behind
+        a write in progress are sent with the buffer hint so that the transport
+        may coalesce them. Defaults to 1, which waits for every write.
+      ResponsePrefetchDepth: A non-negative integer number of response messages
+        of a response-streaming RPC to receive and deserialize ahead of the
+        application drawing them from the call. Defaults to 0, which receives
+        a response only when the application asks for it.
+      ResponseSendWindow: Server option. A positive integer bounding how many
+        response messages of a response-streaming RPC may be taken from the
+        servicer's response iterator before earlier ones have been written to
+        the transport. Messages queued behind a write in progress are sent
+        with the buffer hint so that the transport may coalesce them. Defaults
+        to 1, which waits for every write.
+      ZeroCopyReceive: If true, received messages are handed to deserializers
+        (or, absent a deserializer, to the application) as read-only
+        memoryviews of the transport's buffers instead of as bytes. A message
+        arriving in a single slice is not copied at all; one arriving in
+        several is copied once. Also accepted in the options of grpc.server,
+        where it applies to request messages.
+    """
+    RequestCallsPerCompletionQueue = (
+        'grpc.python.request_calls_per_completion_queue')
+    RequestSendWindow = 'grpc.python.request_send_window'
+    ResponsePrefetchDepth = 'grpc.python.response_prefetch_depth'
+    ResponseSendWindow = 'grpc.python.response_send_window'
+    ZeroCopyReceive = 'grpc.python.zero_copy_receive'
+
+
+class StaticServerInterceptor(grpc.ServerInterceptor):
+    """A ServerInterceptor whose result depends only on the RPC's method.
+
+    An implementation must base its result only on the method of the
+    HandlerCallDetails it is given and on the result of its continuation,
+    never on the invocation metadata. A server may then call it once per
+    method, rather than once per RPC, when it and every interceptor after it
+    are static, and reuse the RpcMethodHandler it returned for later RPCs of
+    that method. Behavior that must run for every RPC belongs in the returned
+    RpcMethodHandler.
+    """
+
+
+class _ServerLane(
+        collections.namedtuple('_ServerLane', (
+            'thread_pool',
+            'maximum_concurrent_rpcs',
+        ))):
+    pass
+
+
+def server_lane(thread_pool=None, maximum_concurrent_rpcs=None):
+    """Creates a lane of capacity dedicated to some of a server's methods.
+
+    Lanes are given to grpc.server through its method_lanes parameter so that
+    expensive methods cannot take up the capacity that latency-sensitive ones
+    rely on. All the methods and services given the same lane share its
+    thread pool and its concurrency limit.
+
+    Args:
+      thread_pool: An optional futures.ThreadPoolExecutor with which to execute
+        the lane's RPC handlers, or None to use the server's own thread pool.
+      maximum_concurrent_rpcs: The maximum number of concurrent RPCs of the
+        lane that the server will service before returning RESOURCE_EXHAUSTED
+        status, or None to indicate no limit.
+
+    Returns:
+      A lane to be used in the method_lanes given to grpc.server.
+    """
+    return _ServerLane(thread_pool, maximum_concurrent_rpcs)
+
+
+def prefork_server(server_factory,
+                   address,
+                   worker_count,
+                   server_credentials=None):
+    """Creates a server whose RPCs are serviced by several forked processes.
+
+    Because handlers in a single process contend for one interpreter lock, a
+    server servicing CPU-bound RPCs benefits from being spread over several
+    processes. The returned server reserves address immediately and, when
+    started, forks worker_count processes that each serve on the address with
+    SO_REUSEPORT; workers that exit are replaced until the server is stopped.
+
+    The calling process must not have created any other gRPC objects, since
+    the gRPC runtime does not survive being forked. Only POSIX platforms
+    supporting SO_REUSEPORT are supported.
+
+    Args:
+      server_factory: A callable called in each worker process with a sequence
+        of channel arguments and returning a grpc.Server, created with those
+        channel arguments among its options, to which all handlers have been
+        added.
+      address: The address on which to service RPCs, e.g. '[::]:50051'. A port
+        of 0 picks an unused port, which is then shared by all workers.
+      worker_count: The number of worker processes.
+      server_credentials: An optional ServerCredentials object with which the
+        workers service RPCs securely.
+
+    Returns:
+      An object with a port attribute holding the bound port and start() and
+      stop(grace) methods behaving like those of grpc.Server.
+    """
+    from grpc import _server  # pylint: disable=cyclic-import
+    return _server.PreforkServer(server_factory, address, worker_count,
+                                 server_credentials)
+
+
+def adaptive_thread_pool(max_workers,
+                         min_workers=0,
+                         idle_timeout=60.0,
+                         target_delay=0.005,
+                         interval=0.1):
+    """Creates a thread pool for grpc.server that adapts to the server's load.
+
+    The pool starts worker threads as RPCs arrive to find every worker busy,
+    up to max_workers, and lets workers idle for longer than idle_timeout exit
+    down to min_workers. It also measures how long each RPC waits for a
+    worker. Once every RPC taken up over an interval of interval seconds has
+    waited longer than target_delay seconds, in the manner of the CoDel queue
+    management algorithm, a server using the pool rejects new RPCs with
+    StatusCode.RESOURCE_EXHAUSTED until waits fall back below target_delay or
+    the backlog clears. This bounds queueing latency under overload where a
+    static maximum_concurrent_rpcs cannot.
+
+    Args:
+      max_workers: The maximum number of worker threads.
+      min_workers: The number of worker threads kept even when idle.
+      idle_timeout: The number of seconds a worker thread idles before exiting.
+      target_delay: The number of seconds RPCs may acceptably wait for a
+        worker thread.
+      interval: The number of seconds for which waits must stay above
+        target_delay before RPCs are rejected.
+
+    Returns:
+      A futures.Executor to pass to grpc.server.
+    """
+    from grpc import _executor
+    return _executor.AdaptiveThreadPoolExecutor(
+        min_workers, max_workers, idle_timeout, target_delay, interval)
+
+
+def set_signal_check_period(period):
+    """Sets how often gRPC waits on the main thread wake to handle signals.
+
+    A thread blocked in gRPC on the main thread wakes periodically, every 0.2
+    seconds by default, so that Python can run signal handlers such as the
+    one raising KeyboardInterrupt. Other threads never receive signals and
+    block until their work is ready without waking. A longer period makes an
+    idle main thread quieter at the cost of slower reaction to signals.
+
+    Args:
+      period: The number of seconds, at least 0.001, between wake-ups.
+    """
+    from grpc._cython import cygrpc
+    cygrpc.set_interrupt_check_period(period)
@@ -0,0 +1,99 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""gRPC Python's asyncio API.
+
+RPCs made through these channels are driven by the asyncio event loop on which
+they are invoked rather than by threads of their own: unary-response calls are
+awaitable and streaming-response calls are asynchronous iterators. A single
+thread per process delivers completion queue events to event loops.
+
+Servers created by this module service RPCs on an event loop as well, so
+coroutine and asynchronous generator behaviors are served without a thread
+per RPC.
+
+This is an EXPERIMENTAL API and requires Python 3.5 or later.
+"""
+
+from grpc.experimental.aio._channel import AioRpcError
+from grpc.experimental.aio._channel import Channel
+from grpc.experimental.aio._server import Server
+
+
+def insecure_channel(target, options=None):
+    """Creates an insecure asyncio Channel to a server.
+
+    Args:
+      target: The server address
+      options: An optional list of key-value pairs (channel args
+        in gRPC Core runtime) to configure the channel.
+
+    Returns:
+      A Channel object.
+    """
+    return Channel(target, () if options is None else options, None)
+
+
+def secure_channel(target, credentials, options=None):
+    """Creates a secure asyncio Channel to a server.
+
+    Args:
+      target: The server address.
+      credentials: A grpc.ChannelCredentials instance.
+      options: An optional list of key-value pairs (channel args
+        in gRPC Core runtime) to configure the channel.
+
+    Returns:
+      A Channel object.
+    """
+    return Channel(target, () if options is None else options,
+                   credentials._credentials)
+
+
+def server(handlers=None,
+           interceptors=None,
+           options=None,
+           maximum_concurrent_rpcs=None):
+    """Creates a Server with which RPCs can be serviced on an event loop.
+
+    Args:
+      handlers: An optional list of GenericRpcHandlers used for executing RPCs.
+        More handlers may be added by calling add_generic_rpc_handlers any time
+        before the server is started. The behaviors of their RpcMethodHandlers
+        may be coroutine functions or asynchronous generator functions.
+      interceptors: An optional list of ServerInterceptor objects that observe
+        and optionally manipulate the incoming RPCs before handing them over to
+        handlers. The interceptors are given control in the order they are
+        specified.
+      options: An optional list of key-value pairs (channel args in gRPC runtime)
+      to configure the channel.
+      maximum_concurrent_rpcs: The maximum number of concurrent RPCs this server
+        will service before returning RESOURCE_EXHAUSTED status, or None to
+        indicate no limit.
+
+    Returns:
+      A Server object.
+    """
+    return Server(() if handlers is None else handlers, ()
+                  if interceptors is None else interceptors, () if
+                  options is None else options, maximum_concurrent_rpcs)
+
+
+__all__ = (
+    'AioRpcError',
+    'Channel',
+    'Server',
+    'insecure_channel',
+    'secure_channel',
+    'server',
+)
@@ -0,0 +1,581 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Invocation-side implementation of gRPC Python on asyncio."""
+
+import asyncio
+import collections
+import logging
+import time
+
+import grpc
+from grpc import _common
+from grpc import _grpcio_metadata
+from grpc._cython import cygrpc
+from grpc.experimental.aio import _poller
+
+_USER_AGENT = 'grpc-python-asyncio/{}'.format(_grpcio_metadata.__version__)
+
+_EMPTY_FLAGS = 0
+
+_INTERNAL_CALL_ERROR_MESSAGE_FORMAT = (
+    'Internal gRPC call error %d. ' +
+    'Please report to https://github.com/grpc/grpc/issues')
+
+_Status = collections.namedtuple('_Status', (
+    'code',
+    'details',
+    'trailing_metadata',
+))
+
+
+def _deadline(timeout):
+    return None if timeout is None else time.time() + timeout
+
+
+def _unknown_code_details(unknown_cygrpc_code, details):
+    return 'Server sent unknown code {} and details "{}"'.format(
+        unknown_cygrpc_code, details)
+
+
+def _resolve(future, handler):
+
+    def resolve(event):
+        result = handler(event)
+        if not future.done():
+            future.set_result(result)
+
+    return resolve
+
+
+class AioRpcError(grpc.RpcError):
+    """The error raised from an asyncio RPC that did not terminate with OK."""
+
+    def __init__(self, code, details, initial_metadata, trailing_metadata):
+        super(AioRpcError, self).__init__()
+        self._code = code
+        self._details = details
+        self._initial_metadata = initial_metadata
+        self._trailing_metadata = trailing_metadata
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+    def initial_metadata(self):
+        return self._initial_metadata
+
+    def trailing_metadata(self):
+        return self._trailing_metadata
+
+    def __repr__(self):
+        return '<AioRpcError of RPC that terminated with ({}, {})>'.format(
+            self._code, self._details)
+
+    def __str__(self):
+        return self.__repr__()
+
+
+class _Call(object):
+    """State and behaviors common to all asyncio RPCs.
+
+    All methods must be called on the event loop with which the call was
+    created; completion queue events are delivered to that loop by the
+    channel's Poller.
+    """
+
+    def __init__(self, channel, poller, method, deadline, metadata,
+                 credentials, response_deserializer, loop):
+        self._poller = poller
+        self._deadline = deadline
+        self._metadata = metadata
+        self._response_deserializer = response_deserializer
+        self._loop = loop
+        self._initial_metadata = loop.create_future()
+        self._status = loop.create_future()
+        self._cancelled = False
+        self._done_callbacks = []
+        self._call = channel.create_call(None, 0, poller.completion_queue,
+                                         method, None, deadline)
+        if credentials is not None:
+            self._call.set_credentials(credentials._credentials)
+
+    def _set_initial_metadata(self, initial_metadata):
+        if not self._initial_metadata.done():
+            self._initial_metadata.set_result(initial_metadata)
+
+    def _set_status(self, status):
+        if not self._status.done():
+            self._set_initial_metadata(())
+            self._status.set_result(status)
+            done_callbacks = self._done_callbacks
+            self._done_callbacks = None
+            for done_callback in done_callbacks:
+                self._loop.call_soon(done_callback, self)
+
+    def _abort(self, code, details):
+        if not self._status.done():
+            # Stop the core call too, so that the server stops sending and the
+            # call's resources are released.
+            self._call.cancel()
+            self._set_status(_Status(code, details, ()))
+
+    def _handle_event(self, event):
+        """Folds a batch completion into this call; returns any response."""
+        response = None
+        for batch_operation in event.batch_operations:
+            operation_type = batch_operation.type()
+            if operation_type == cygrpc.OperationType.receive_initial_metadata:
+                self._set_initial_metadata(batch_operation.initial_metadata())
+            elif operation_type == cygrpc.OperationType.receive_message:
+                serialized_response = batch_operation.message()
+                if serialized_response is not None:
+                    response = _common.deserialize(serialized_response,
+                                                   self._response_deserializer)
+                    if response is None:
+                        self._abort(grpc.StatusCode.INTERNAL,
+                                    'Exception deserializing response!')
+            elif operation_type == cygrpc.OperationType.receive_status_on_client:
+                code = _common.CYGRPC_STATUS_CODE_TO_STATUS_CODE.get(
+                    batch_operation.code())
+                if code is None:
+                    self._set_status(
+                        _Status(grpc.StatusCode.UNKNOWN,
+                                _unknown_code_details(batch_operation.code(),
+                                                      batch_operation.details()),
+                                batch_operation.trailing_metadata()))
+                else:
+                    self._set_status(
+                        _Status(code, batch_operation.details(),
+                                batch_operation.trailing_metadata()))
+        return response
+
+    def _start_batch(self, operations, callback):
+        call_error = self._call.start_client_batch(
+            operations, self._poller.tag(self._loop, callback))
+        if call_error == cygrpc.CallError.ok:
+            return True
+        elif call_error == cygrpc.CallError.invalid_metadata:
+            self._abort(grpc.StatusCode.INTERNAL,
+                        'metadata was invalid: %s' % (self._metadata,))
+        else:
+            self._abort(grpc.StatusCode.INTERNAL,
+                        _INTERNAL_CALL_ERROR_MESSAGE_FORMAT % call_error)
+        return False
+
+    def _raise_for_status(self):
+        status = self._status.result()
+        if self._cancelled:
+            raise asyncio.CancelledError()
+        elif status.code is not grpc.StatusCode.OK:
+            raise AioRpcError(status.code, status.details,
+                              self._initial_metadata.result(),
+                              status.trailing_metadata)
+
+    async def _await_completion(self, future):
+        try:
+            return await asyncio.shield(future)
+        except asyncio.CancelledError:
+            self.cancel()
+            raise
+
+    def cancel(self):
+        """Cancels the RPC; returns whether it was still in progress."""
+        if self._status.done():
+            return False
+        else:
+            self._cancelled = True
+            self._abort(grpc.StatusCode.CANCELLED, 'Cancelled!')
+            return True
+
+    def cancelled(self):
+        return self._cancelled
+
+    def done(self):
+        return self._status.done()
+
+    def time_remaining(self):
+        if self._deadline is None:
+            return None
+        else:
+            return max(self._deadline - time.time(), 0)
+
+    def add_done_callback(self, fn):
+        """Calls fn with this call once the RPC has terminated."""
+        if self._status.done():
+            self._loop.call_soon(fn, self)
+        else:
+            self._done_callbacks.append(fn)
+
+    async def initial_metadata(self):
+        return await asyncio.shield(self._initial_metadata)
+
+    async def trailing_metadata(self):
+        status = await asyncio.shield(self._status)
+        return status.trailing_metadata
+
+    async def code(self):
+        status = await asyncio.shield(self._status)
+        return status.code
+
+    async def details(self):
+        status = await asyncio.shield(self._status)
+        return status.details
+
+
+class _UnaryResponseCall(_Call):
+    """An RPC awaited for exactly one response."""
+
+    def __init__(self, *args):
+        super(_UnaryResponseCall, self).__init__(*args)
+        self._response = self._loop.create_future()
+
+    def _handle_response_event(self, event):
+        response = self._handle_event(event)
+        if not self._response.done():
+            self._response.set_result(response)
+
+    async def _await_response(self):
+        if self._status.done() and not self._response.done():
+            # The RPC failed before any operations were started.
+            self._raise_for_status()
+        response = await self._await_completion(self._response)
+        self._raise_for_status()
+        return response
+
+    def __await__(self):
+        return self._await_response().__await__()
+
+
+class _StreamResponseCall(_Call):
+    """An RPC whose responses are consumed by asynchronous iteration."""
+
+    async def _read(self):
+        if not self._status.done():
+            received = self._loop.create_future()
+            operations = (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),)
+            if self._start_batch(operations,
+                                 _resolve(received, self._handle_event)):
+                response = await self._await_completion(received)
+                if response is not None:
+                    return response
+        await asyncio.shield(self._status)
+        self._raise_for_status()
+        return None
+
+    async def read(self):
+        """Returns the next response, or None if the server is done."""
+        return await self._read()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        response = await self._read()
+        if response is None:
+            raise StopAsyncIteration()
+        return response
+
+
+class _StreamRequestMixin(object):
+    """Sends requests either from an iterator or pushed by write calls."""
+
+    def _init_requests(self, request_iterator, request_serializer):
+        self._request_serializer = request_serializer
+        if request_iterator is None:
+            self._request_consumer = None
+        else:
+            self._request_consumer = self._loop.create_task(
+                self._consume_request_iterator(request_iterator))
+            self.add_done_callback(
+                lambda unused_call: self._request_consumer.cancel())
+
+    async def _write(self, request):
+        if self._status.done():
+            return False
+        serialized_request = _common.serialize(request,
+                                               self._request_serializer)
+        if serialized_request is None:
+            self._abort(grpc.StatusCode.INTERNAL,
+                        'Exception serializing request!')
+            return False
+        sent = self._loop.create_future()
+        operations = (cygrpc.SendMessageOperation(serialized_request,
+                                                  _EMPTY_FLAGS),)
+        if not self._start_batch(operations,
+                                 _resolve(sent, lambda event: event.success)):
+            return False
+        return await asyncio.shield(sent)
+
+    async def _done_writing(self):
+        if not self._status.done():
+            closed = self._loop.create_future()
+            operations = (cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),)
+            if self._start_batch(operations,
+                                 _resolve(closed, lambda event: event.success)):
+                await asyncio.shield(closed)
+
+    async def _consume_request_iterator(self, request_iterator):
+        try:
+            if hasattr(request_iterator, '__aiter__'):
+                async for request in request_iterator:
+                    if not await self._write(request):
+                        return
+            else:
+                # Synchronous iterators are drained on the event loop and so
+                # must not block.
+                for request in request_iterator:
+                    if not await self._write(request):
+                        return
+        except asyncio.CancelledError:
+            raise
+        except Exception:  # pylint: disable=broad-except
+            logging.exception('Exception iterating requests!')
+            self._abort(grpc.StatusCode.UNKNOWN,
+                        'Exception iterating requests!')
+            return
+        await self._done_writing()
+
+    def _check_writable(self):
+        if self._request_consumer is not None:
+            raise ValueError(
+                'Requests of this RPC are drawn from its request iterator!')
+
+    async def write(self, request):
+        """Sends a request of an RPC invoked without a request iterator.
+
+        Each write must complete before the next is started. If the RPC has
+        already terminated with a non-OK status an AioRpcError is raised.
+        """
+        self._check_writable()
+        if not await self._write(request):
+            await asyncio.shield(self._status)
+            self._raise_for_status()
+
+    async def done_writing(self):
+        """Indicates that no more requests will be written to the RPC."""
+        self._check_writable()
+        await self._done_writing()
+
+
+class UnaryUnaryCall(_UnaryResponseCall):
+    """An awaitable unary-unary RPC."""
+
+    def __init__(self, request, request_serializer, *args):
+        super(UnaryUnaryCall, self).__init__(*args)
+        serialized_request = _common.serialize(request, request_serializer)
+        if serialized_request is None:
+            self._abort(grpc.StatusCode.INTERNAL,
+                        'Exception serializing request!')
+        else:
+            operations = (
+                cygrpc.SendInitialMetadataOperation(self._metadata,
+                                                    _EMPTY_FLAGS),
+                cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+                cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
+                cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),
+                cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
+                cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+            )
+            self._start_batch(operations, self._handle_response_event)
+
+
+class UnaryStreamCall(_StreamResponseCall):
+    """A unary-stream RPC whose responses are asynchronously iterable."""
+
+    def __init__(self, request, request_serializer, *args):
+        super(UnaryStreamCall, self).__init__(*args)
+        serialized_request = _common.serialize(request, request_serializer)
+        if serialized_request is None:
+            self._abort(grpc.StatusCode.INTERNAL,
+                        'Exception serializing request!')
+        else:
+            self._start_batch(
+                (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
+                self._handle_event)
+            operations = (
+                cygrpc.SendInitialMetadataOperation(self._metadata,
+                                                    _EMPTY_FLAGS),
+                cygrpc.SendMessageOperation(serialized_request, _EMPTY_FLAGS),
+                cygrpc.SendCloseFromClientOperation(_EMPTY_FLAGS),
+                cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+            )
+            self._start_batch(operations, self._handle_event)
+
+
+class StreamUnaryCall(_StreamRequestMixin, _UnaryResponseCall):
+    """An awaitable stream-unary RPC."""
+
+    def __init__(self, request_iterator, request_serializer, *args):
+        super(StreamUnaryCall, self).__init__(*args)
+        self._start_batch(
+            (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
+            self._handle_event)
+        operations = (
+            cygrpc.SendInitialMetadataOperation(self._metadata, _EMPTY_FLAGS),
+            cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),
+            cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+        )
+        started = self._start_batch(operations, self._handle_response_event)
+        self._init_requests(request_iterator if started else None,
+                            request_serializer)
+
+
+class StreamStreamCall(_StreamRequestMixin, _StreamResponseCall):
+    """A stream-stream RPC whose responses are asynchronously iterable."""
+
+    def __init__(self, request_iterator, request_serializer, *args):
+        super(StreamStreamCall, self).__init__(*args)
+        self._start_batch(
+            (cygrpc.ReceiveInitialMetadataOperation(_EMPTY_FLAGS),),
+            self._handle_event)
+        operations = (
+            cygrpc.SendInitialMetadataOperation(self._metadata, _EMPTY_FLAGS),
+            cygrpc.ReceiveStatusOnClientOperation(_EMPTY_FLAGS),
+        )
+        started = self._start_batch(operations, self._handle_event)
+        self._init_requests(request_iterator if started else None,
+                            request_serializer)
+
+
+class _MultiCallable(object):
+
+    def __init__(self, channel, poller, method, request_serializer,
+                 response_deserializer):
+        self._channel = channel
+        self._poller = poller
+        self._method = method
+        self._request_serializer = request_serializer
+        self._response_deserializer = response_deserializer
+
+    def _call_arguments(self, timeout, metadata, credentials):
+        return (self._channel, self._poller, self._method, _deadline(timeout),
+                metadata, credentials, self._response_deserializer,
+                asyncio.get_event_loop())
+
+
+class UnaryUnaryMultiCallable(_MultiCallable):
+
+    def __call__(self, request, timeout=None, metadata=None, credentials=None):
+        """Invokes the RPC; the returned UnaryUnaryCall awaits its response."""
+        return UnaryUnaryCall(request, self._request_serializer,
+                              *self._call_arguments(timeout, metadata,
+                                                    credentials))
+
+
+class UnaryStreamMultiCallable(_MultiCallable):
+
+    def __call__(self, request, timeout=None, metadata=None, credentials=None):
+        """Invokes the RPC; the returned UnaryStreamCall is async iterable."""
+        return UnaryStreamCall(request, self._request_serializer,
+                               *self._call_arguments(timeout, metadata,
+                                                     credentials))
+
+
+class StreamUnaryMultiCallable(_MultiCallable):
+
+    def __call__(self,
+                 request_iterator=None,
+                 timeout=None,
+                 metadata=None,
+                 credentials=None):
+        """Invokes the RPC; the returned StreamUnaryCall awaits its response.
+
+        request_iterator may be an asynchronous or a non-blocking synchronous
+        iterable. If it is None requests are instead sent with the returned
+        call's write and done_writing coroutines.
+        """
+        return StreamUnaryCall(request_iterator, self._request_serializer,
+                               *self._call_arguments(timeout, metadata,
+                                                     credentials))
+
+
+class StreamStreamMultiCallable(_MultiCallable):
+
+    def __call__(self,
+                 request_iterator=None,
+                 timeout=None,
+                 metadata=None,
+                 credentials=None):
+        """Invokes the RPC; the returned StreamStreamCall is async iterable.
+
+        request_iterator may be an asynchronous or a non-blocking synchronous
+        iterable. If it is None requests are instead sent with the returned
+        call's write and done_writing coroutines.
+        """
+        return StreamStreamCall(request_iterator, self._request_serializer,
+                                *self._call_arguments(timeout, metadata,
+                                                      credentials))
+
+
+def _options(options):
+    return list(options) + [
+        (
+            cygrpc.ChannelArgKey.primary_user_agent_string,
+            _USER_AGENT,
+        ),
+    ]
+
+
+class Channel(object):
+    """A cygrpc.Channel-backed channel whose RPCs are driven by asyncio."""
+
+    def __init__(self, target, options, credentials):
+        """Constructor.
+
+        Args:
+          target: The target to which to connect.
+          options: Configuration options for the channel.
+          credentials: A cygrpc.ChannelCredentials or None.
+        """
+        self._channel = cygrpc.Channel(
+            _common.encode(target), _options(options), credentials)
+        self._poller = _poller.default_poller()
+
+    def unary_unary(self,
+                    method,
+                    request_serializer=None,
+                    response_deserializer=None):
+        return UnaryUnaryMultiCallable(self._channel, self._poller,
+                                       _common.encode(method),
+                                       request_serializer,
+                                       response_deserializer)
+
+    def unary_stream(self,
+                     method,
+                     request_serializer=None,
+                     response_deserializer=None):
+        return UnaryStreamMultiCallable(self._channel, self._poller,
+                                        _common.encode(method),
+                                        request_serializer,
+                                        response_deserializer)
+
+    def stream_unary(self,
+                     method,
+                     request_serializer=None,
+                     response_deserializer=None):
+        return StreamUnaryMultiCallable(self._channel, self._poller,
+                                        _common.encode(method),
+                                        request_serializer,
+                                        response_deserializer)
+
+    def stream_stream(self,
+                      method,
+                      request_serializer=None,
+                      response_deserializer=None):
+        return StreamStreamMultiCallable(self._channel, self._poller,
+                                         _common.encode(method),
+                                         request_serializer,
+                                         response_deserializer)
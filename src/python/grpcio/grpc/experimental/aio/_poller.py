@@ -0,0 +1,86 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Delivery of completion queue events to asyncio event loops."""
+
+import logging
+import threading
+
+from grpc._cython import cygrpc
+
+
+class _LoopTag(object):
+    """A completion queue tag that hands its event to an event loop."""
+
+    def __init__(self, loop, callback):
+        self._loop = loop
+        self._callback = callback
+
+    def __call__(self, event):
+        try:
+            self._loop.call_soon_threadsafe(self._callback, event)
+        except RuntimeError:
+            # The loop was closed while the operation was in flight; nothing
+            # remains to observe its completion.
+            logging.debug('Dropping event for closed event loop.')
+
+
+class Poller(object):
+    """Drains a completion queue on behalf of any number of event loops.
+
+    Every event on the queue must carry a tag created by this object's tag
+    method; the event is then delivered to the tag's loop by way of
+    call_soon_threadsafe. A single Poller serves every RPC using its queue, so
+    the number of threads does not grow with the number of RPCs.
+    """
+
+    def __init__(self, completion_queue):
+        self.completion_queue = completion_queue
+        self._lock = threading.Lock()
+        self._thread = None
+
+    def _poll(self):
+        while True:
+            event = self.completion_queue.poll()
+            if event.tag is None:
+                # Only the shutdown of the queue produces an untagged event.
+                return
+            event.tag(event)
+            # Drop the event before polling again; it may hold the last
+            # reference to a Call.
+            event = None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._poll)
+                self._thread.daemon = True
+                self._thread.start()
+
+    def tag(self, loop, callback):
+        """Creates a tag that calls callback with its event on loop."""
+        return _LoopTag(loop, callback)
+
+
+_DEFAULT_POLLER_LOCK = threading.Lock()
+_DEFAULT_POLLER = None
+
+
+def default_poller():
+    """Returns the process-wide Poller shared by all asyncio channels."""
+    global _DEFAULT_POLLER
+    with _DEFAULT_POLLER_LOCK:
+        if _DEFAULT_POLLER is None:
+            _DEFAULT_POLLER = Poller(cygrpc.CompletionQueue())
+            _DEFAULT_POLLER.start()
+        return _DEFAULT_POLLER
@@ -0,0 +1,576 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Service-side implementation of gRPC Python on asyncio."""
+
+import asyncio
+import enum
+import inspect
+import logging
+import time
+
+import six
+
+import grpc
+from grpc import _common
+from grpc import _interceptor
+from grpc import _server as _sync_server
+from grpc._cython import cygrpc
+from grpc.experimental.aio import _poller
+from grpc.framework.foundation import callable_util
+
+_OPEN = 'open'
+_CLOSED = 'closed'
+_CANCELLED = 'cancelled'
+
+_EMPTY_FLAGS = 0
+
+
+class _RPCState(object):
+
+    def __init__(self, loop, poller):
+        self.loop = loop
+        self.poller = poller
+        self.task = None
+        self.servicing = True
+        self.client = _OPEN
+        self.initial_metadata_allowed = True
+        self.disable_next_compression = False
+        self.trailing_metadata = None
+        self.code = None
+        self.details = None
+        self.statused = None
+        self.rpc_errors = []
+        self.callbacks = []
+        self.abortion = None
+
+
+def _start_batch(rpc_event, state, operations):
+    """Starts a batch on the RPC's call; returns a future of its event."""
+    completion = state.loop.create_future()
+
+    def complete(event):
+        if not completion.done():
+            completion.set_result(event)
+
+    rpc_event.call.start_server_batch(operations,
+                                      state.poller.tag(state.loop, complete))
+    return completion
+
+
+def _raise_rpc_error(state):
+    rpc_error = grpc.RpcError()
+    state.rpc_errors.append(rpc_error)
+    raise rpc_error
+
+
+def _abort(state, rpc_event, code, details):
+    if state.client is not _CANCELLED and state.statused is None:
+        effective_code = _sync_server._abortion_code(state, code)
+        effective_details = details if state.details is None else state.details
+        operations = [
+            cygrpc.SendStatusFromServerOperation(
+                state.trailing_metadata, effective_code, effective_details,
+                _EMPTY_FLAGS),
+        ]
+        if state.initial_metadata_allowed:
+            operations.append(
+                cygrpc.SendInitialMetadataOperation(None, _EMPTY_FLAGS))
+        state.statused = _start_batch(rpc_event, state, operations)
+
+
+def _receive_close_on_server(state):
+
+    def receive_close_on_server(receive_close_on_server_event):
+        if receive_close_on_server_event.batch_operations[0].cancelled():
+            state.client = _CANCELLED
+            if state.servicing and state.task is not None:
+                state.task.cancel()
+        elif state.client is _OPEN:
+            state.client = _CLOSED
+
+    return receive_close_on_server
+
+
+class _Context(grpc.ServicerContext):
+
+    def __init__(self, rpc_event, state):
+        self._rpc_event = rpc_event
+        self._state = state
+
+    def is_active(self):
+        return (self._state.client is not _CANCELLED and
+                self._state.statused is None)
+
+    def time_remaining(self):
+        return max(self._rpc_event.call_details.deadline - time.time(), 0)
+
+    def cancel(self):
+        self._rpc_event.call.cancel()
+
+    def add_callback(self, callback):
+        if self._state.callbacks is None:
+            return False
+        else:
+            self._state.callbacks.append(callback)
+            return True
+
+    def disable_next_message_compression(self):
+        self._state.disable_next_compression = True
+
+    def invocation_metadata(self):
+        return self._rpc_event.invocation_metadata
+
+    def peer(self):
+        return _common.decode(self._rpc_event.call.peer())
+
+    def peer_identities(self):
+        return cygrpc.peer_identities(self._rpc_event.call)
+
+    def peer_identity_key(self):
+        id_key = cygrpc.peer_identity_key(self._rpc_event.call)
+        return id_key if id_key is None else _common.decode(id_key)
+
+    def auth_context(self):
+        return {
+            _common.decode(key): value
+            for key, value in six.iteritems(
+                cygrpc.auth_context(self._rpc_event.call))
+        }
+
+    def send_initial_metadata(self, initial_metadata):
+        if self._state.client is _CANCELLED:
+            _raise_rpc_error(self._state)
+        elif self._state.initial_metadata_allowed:
+            _start_batch(self._rpc_event, self._state,
+                         (cygrpc.SendInitialMetadataOperation(
+                             initial_metadata, _EMPTY_FLAGS),))
+            self._state.initial_metadata_allowed = False
+        else:
+            raise ValueError('Initial metadata no longer allowed!')
+
+    def set_trailing_metadata(self, trailing_metadata):
+        self._state.trailing_metadata = trailing_metadata
+
+    def abort(self, code, details):
+        # treat OK like other invalid arguments: fail the RPC
+        if code == grpc.StatusCode.OK:
+            logging.error(
+                'abort() called with StatusCode.OK; returning UNKNOWN')
+            code = grpc.StatusCode.UNKNOWN
+            details = ''
+        self._state.code = code
+        self._state.details = _common.encode(details)
+        self._state.abortion = Exception()
+        raise self._state.abortion
+
+    def set_code(self, code):
+        self._state.code = code
+
+    def set_details(self, details):
+        self._state.details = _common.encode(details)
+
+
+async def _receive_request(rpc_event, state, request_deserializer):
+    """Receives one request; returns None once the client is done sending."""
+    if state.client is _CANCELLED:
+        _raise_rpc_error(state)
+    elif state.client is _CLOSED or state.statused is not None:
+        return None
+    event = await _start_batch(rpc_event, state,
+                               (cygrpc.ReceiveMessageOperation(_EMPTY_FLAGS),))
+    serialized_request = event.batch_operations[0].message()
+    if serialized_request is None:
+        if state.client is _OPEN:
+            state.client = _CLOSED
+        return None
+    request = _common.deserialize(serialized_request, request_deserializer)
+    if request is None:
+        _abort(state, rpc_event, cygrpc.StatusCode.internal,
+               b'Exception deserializing request!')
+    return request
+
+
+class _RequestIterator(object):
+    """An asynchronous iterator over the requests of an RPC."""
+
+    def __init__(self, rpc_event, state, request_deserializer):
+        self._rpc_event = rpc_event
+        self._state = state
+        self._request_deserializer = request_deserializer
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        request = await _receive_request(self._rpc_event, self._state,
+                                         self._request_deserializer)
+        if request is None:
+            raise StopAsyncIteration()
+        else:
+            return request
+
+
+async def _unary_request(rpc_event, state, request_deserializer):
+    if state.client is _CANCELLED:
+        return None
+    request = await _receive_request(rpc_event, state, request_deserializer)
+    if request is None:
+        if state.client is _CLOSED and state.statused is None:
+            details = '"{}" requires exactly one request message.'.format(
+                rpc_event.call_details.method)
+            _abort(state, rpc_event, cygrpc.StatusCode.unimplemented,
+                   _common.encode(details))
+    return request
+
+
+def _handle_behavior_exception(rpc_event, state, exception, description):
+    if exception is state.abortion:
+        _abort(state, rpc_event, cygrpc.StatusCode.unknown, b'RPC Aborted')
+    elif exception not in state.rpc_errors:
+        details = '{}: {}'.format(description, exception)
+        logging.exception(details)
+        _abort(state, rpc_event, cygrpc.StatusCode.unknown,
+               _common.encode(details))
+
+
+async def _call_behavior(rpc_event, state, behavior, argument):
+    context = _Context(rpc_event, state)
+    try:
+        result = behavior(argument, context)
+        if inspect.isawaitable(result):
+            result = await result
+        return result, True
+    except asyncio.CancelledError:
+        raise
+    except Exception as exception:  # pylint: disable=broad-except
+        _handle_behavior_exception(rpc_event, state, exception,
+                                   'Exception calling application')
+        return None, False
+
+
+async def _take_response_from_response_iterator(rpc_event, state,
+                                                response_iterator):
+    try:
+        if hasattr(response_iterator, '__anext__'):
+            return await response_iterator.__anext__(), True
+        else:
+            return next(response_iterator), True
+    except (StopIteration, StopAsyncIteration):
+        return None, True
+    except asyncio.CancelledError:
+        raise
+    except Exception as exception:  # pylint: disable=broad-except
+        _handle_behavior_exception(rpc_event, state, exception,
+                                   'Exception iterating responses')
+        return None, False
+
+
+def _serialize_response(rpc_event, state, response, response_serializer):
+    serialized_response = _common.serialize(response, response_serializer)
+    if serialized_response is None:
+        _abort(state, rpc_event, cygrpc.StatusCode.internal,
+               b'Failed to serialize response!')
+    return serialized_response
+
+
+async def _send_response(rpc_event, state, serialized_response):
+    if state.client is _CANCELLED or state.statused is not None:
+        return False
+    if state.initial_metadata_allowed:
+        operations = (
+            cygrpc.SendInitialMetadataOperation(None, _EMPTY_FLAGS),
+            cygrpc.SendMessageOperation(serialized_response, _EMPTY_FLAGS),
+        )
+        state.initial_metadata_allowed = False
+    else:
+        operations = (cygrpc.SendMessageOperation(serialized_response,
+                                                  _EMPTY_FLAGS),)
+    await _start_batch(rpc_event, state, operations)
+    return state.client is not _CANCELLED and state.statused is None
+
+
+def _status(rpc_event, state, serialized_response):
+    if state.client is not _CANCELLED and state.statused is None:
+        code = _sync_server._completion_code(state)
+        details = _sync_server._details(state)
+        operations = [
+            cygrpc.SendStatusFromServerOperation(
+                state.trailing_metadata, code, details, _EMPTY_FLAGS),
+        ]
+        if state.initial_metadata_allowed:
+            operations.append(
+                cygrpc.SendInitialMetadataOperation(None, _EMPTY_FLAGS))
+        if serialized_response is not None:
+            operations.append(
+                cygrpc.SendMessageOperation(serialized_response, _EMPTY_FLAGS))
+        state.statused = _start_batch(rpc_event, state, operations)
+
+
+async def _unary_response(rpc_event, state, behavior, argument,
+                          response_serializer):
+    response, proceed = await _call_behavior(rpc_event, state, behavior,
+                                             argument)
+    if proceed:
+        serialized_response = _serialize_response(rpc_event, state, response,
+                                                  response_serializer)
+        if serialized_response is not None:
+            _status(rpc_event, state, serialized_response)
+
+
+async def _stream_response(rpc_event, state, behavior, argument,
+                           response_serializer):
+    response_iterator, proceed = await _call_behavior(rpc_event, state,
+                                                      behavior, argument)
+    if proceed:
+        if hasattr(response_iterator, '__aiter__'):
+            response_iterator = response_iterator.__aiter__()
+        else:
+            response_iterator = iter(response_iterator)
+        while True:
+            response, proceed = await _take_response_from_response_iterator(
+                rpc_event, state, response_iterator)
+            if not proceed:
+                break
+            elif response is None:
+                _status(rpc_event, state, None)
+                break
+            serialized_response = _serialize_response(
+                rpc_event, state, response, response_serializer)
+            if serialized_response is None or not await _send_response(
+                    rpc_event, state, serialized_response):
+                break
+
+
+async def _handle_with_method_handler(rpc_event, state, method_handler):
+    closed = _start_batch(rpc_event, state,
+                          (cygrpc.ReceiveCloseOnServerOperation(_EMPTY_FLAGS),))
+    closed.add_done_callback(
+        lambda completion: _receive_close_on_server(state)(completion.result()))
+    try:
+        if method_handler.request_streaming:
+            argument = _RequestIterator(rpc_event, state,
+                                        method_handler.request_deserializer)
+        else:
+            argument = await _unary_request(
+                rpc_event, state, method_handler.request_deserializer)
+        if argument is not None:
+            if method_handler.request_streaming:
+                if method_handler.response_streaming:
+                    behavior, respond = (method_handler.stream_stream,
+                                         _stream_response)
+                else:
+                    behavior, respond = (method_handler.stream_unary,
+                                         _unary_response)
+            else:
+                if method_handler.response_streaming:
+                    behavior, respond = (method_handler.unary_stream,
+                                         _stream_response)
+                else:
+                    behavior, respond = (method_handler.unary_unary,
+                                         _unary_response)
+            await respond(rpc_event, state, behavior, argument,
+                          method_handler.response_serializer)
+    except asyncio.CancelledError:
+        # The client cancelled the RPC; the behavior has been interrupted.
+        pass
+    state.servicing = False
+    if state.statused is not None:
+        await state.statused
+    await closed
+    callbacks = state.callbacks
+    state.callbacks = None
+    for callback in callbacks:
+        callable_util.call_logging_exceptions(callback,
+                                              'Exception calling callback!')
+
+
+def _reject_rpc(rpc_event, state, status, details):
+    operations = (
+        cygrpc.SendInitialMetadataOperation(None, _EMPTY_FLAGS),
+        cygrpc.ReceiveCloseOnServerOperation(_EMPTY_FLAGS),
+        cygrpc.SendStatusFromServerOperation(None, status, details,
+                                             _EMPTY_FLAGS),
+    )
+    return _start_batch(rpc_event, state, operations)
+
+
+def _find_method_handler(rpc_event, generic_handlers, interceptor_pipeline):
+
+    def query_handlers(handler_call_details):
+        for generic_handler in generic_handlers:
+            method_handler = generic_handler.service(handler_call_details)
+            if method_handler is not None:
+                return method_handler
+        return None
+
+    handler_call_details = _sync_server._HandlerCallDetails(
+        _common.decode(rpc_event.call_details.method),
+        rpc_event.invocation_metadata)
+
+    if interceptor_pipeline is not None:
+        return interceptor_pipeline.execute(query_handlers,
+                                            handler_call_details)
+    else:
+        return query_handlers(handler_call_details)
+
+
+@enum.unique
+class _ServerStage(enum.Enum):
+    STOPPED = 'stopped'
+    STARTED = 'started'
+    GRACE = 'grace'
+
+
+class _ServerState(object):
+
+    # pylint: disable=too-many-arguments
+    def __init__(self, poller, server, generic_handlers, interceptor_pipeline,
+                 maximum_concurrent_rpcs):
+        self.poller = poller
+        self.server = server
+        self.generic_handlers = list(generic_handlers)
+        self.interceptor_pipeline = interceptor_pipeline
+        self.maximum_concurrent_rpcs = maximum_concurrent_rpcs
+        self.loop = None
+        self.stage = _ServerStage.STOPPED
+        self.rpc_tasks = set()
+        self.shutdown = None
+        self.grace_timer = None
+
+
+def _request_call(state):
+    state.server.request_call(
+        state.poller.completion_queue, state.poller.completion_queue,
+        state.poller.tag(state.loop, lambda event: _on_call(state, event)))
+
+
+def _on_call(state, rpc_event):
+    if state.stage is not _ServerStage.STARTED:
+        return
+    # Post the next request before servicing this one so that the server
+    # keeps accepting RPCs while the handler is looked up.
+    _request_call(state)
+    if not rpc_event.success or rpc_event.call_details.method is None:
+        return
+    rpc_state = _RPCState(state.loop, state.poller)
+    try:
+        method_handler = _find_method_handler(
+            rpc_event, state.generic_handlers, state.interceptor_pipeline)
+    except Exception as exception:  # pylint: disable=broad-except
+        details = 'Exception servicing handler: {}'.format(exception)
+        logging.exception(details)
+        _reject_rpc(rpc_event, rpc_state, cygrpc.StatusCode.unknown,
+                    b'Error in service handler!')
+        return
+    if method_handler is None:
+        _reject_rpc(rpc_event, rpc_state, cygrpc.StatusCode.unimplemented,
+                    b'Method not found!')
+    elif (state.maximum_concurrent_rpcs is not None and
+          len(state.rpc_tasks) >= state.maximum_concurrent_rpcs):
+        _reject_rpc(rpc_event, rpc_state, cygrpc.StatusCode.resource_exhausted,
+                    b'Concurrent RPC limit exceeded!')
+    else:
+        rpc_state.task = state.loop.create_task(
+            _handle_with_method_handler(rpc_event, rpc_state, method_handler))
+        state.rpc_tasks.add(rpc_state.task)
+        rpc_state.task.add_done_callback(state.rpc_tasks.discard)
+
+
+def _on_shutdown(state):
+
+    def on_shutdown(unused_shutdown_event):
+        if state.grace_timer is not None:
+            state.grace_timer.cancel()
+        state.loop.create_task(_finish_shutdown(state))
+
+    return on_shutdown
+
+
+async def _finish_shutdown(state):
+    if state.rpc_tasks:
+        await asyncio.wait(tuple(state.rpc_tasks))
+    state.poller.completion_queue.shutdown()
+    state.stage = _ServerStage.STOPPED
+    state.shutdown.set_result(None)
+
+
+def _start(state):
+    if state.stage is not _ServerStage.STOPPED:
+        raise ValueError('Cannot start already-started server!')
+    state.loop = asyncio.get_event_loop()
+    state.server.start()
+    state.poller.start()
+    state.stage = _ServerStage.STARTED
+    _request_call(state)
+
+
+async def _stop(state, grace):
+    if state.stage is _ServerStage.STOPPED:
+        return
+    elif state.stage is _ServerStage.STARTED:
+        state.shutdown = state.loop.create_future()
+        state.server.shutdown(state.poller.completion_queue,
+                              state.poller.tag(state.loop,
+                                               _on_shutdown(state)))
+        state.stage = _ServerStage.GRACE
+    if grace is None:
+        state.server.cancel_all_calls()
+    elif state.grace_timer is None:
+        state.grace_timer = state.loop.call_later(
+            grace, state.server.cancel_all_calls)
+    await asyncio.shield(state.shutdown)
+
+
+class Server(object):
+    """A cygrpc.Server-backed server whose RPCs are served by asyncio.
+
+    Behaviors of the RpcMethodHandlers of this server may be coroutine
+    functions (for unary responses) and asynchronous generators (for streaming
+    responses); plain functions and generators are also accepted and are run
+    directly on the event loop. Streaming requests are passed to behaviors as
+    asynchronous iterators.
+    """
+
+    def __init__(self, generic_handlers, interceptors, options,
+                 maximum_concurrent_rpcs):
+        completion_queue = cygrpc.CompletionQueue()
+        server = cygrpc.Server(options)
+        server.register_completion_queue(completion_queue)
+        self._state = _ServerState(
+            _poller.Poller(completion_queue), server, generic_handlers,
+            _interceptor.service_pipeline(interceptors),
+            maximum_concurrent_rpcs)
+
+    def add_generic_rpc_handlers(self, generic_rpc_handlers):
+        self._state.generic_handlers.extend(generic_rpc_handlers)
+
+    def add_insecure_port(self, address):
+        return self._state.server.add_http2_port(_common.encode(address))
+
+    def add_secure_port(self, address, server_credentials):
+        return self._state.server.add_http2_port(
+            _common.encode(address), server_credentials._credentials)
+
+    def start(self):
+        """Starts serving RPCs on the current thread's event loop."""
+        _start(self._state)
+
+    async def stop(self, grace):
+        """Stops this Server, completing once it has completely stopped.
+
+        Args:
+          grace: A duration of time in seconds after which RPCs still active
+            are aborted, or None to abort all active RPCs immediately.
+        """
+        await _stop(self._state, grace)
@@ -0,0 +1,169 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the adaptive server thread pool."""
+
+import threading
+import time
+import unittest
+
+import grpc
+from grpc import experimental
+
+from tests.unit.framework.common import test_constants
+
+_MAX_WORKERS = 2
+_IDLE_TIMEOUT = 0.1
+_TARGET_DELAY = 0.005
+_INTERVAL = 0.05
+
+_BLOCKING_UNARY_UNARY = '/test/BlockingUnaryUnary'
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def __init__(self):
+        self._barrier = threading.Event()
+
+    def release(self):
+        self._barrier.set()
+
+    def _block(self, request, servicer_context):
+        self._barrier.wait()
+        return request
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _BLOCKING_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(self._block)
+        else:
+            return None
+
+
+def _thread_pool():
+    return experimental.adaptive_thread_pool(
+        _MAX_WORKERS,
+        idle_timeout=_IDLE_TIMEOUT,
+        target_delay=_TARGET_DELAY,
+        interval=_INTERVAL)
+
+
+class AdaptiveThreadPoolTest(unittest.TestCase):
+
+    def testResultsAndExceptions(self):
+        thread_pool = _thread_pool()
+
+        value_future = thread_pool.submit(lambda value: value, 7)
+        exception_future = thread_pool.submit(lambda: 1 // 0)
+
+        self.assertEqual(7, value_future.result())
+        self.assertIsInstance(exception_future.exception(), ZeroDivisionError)
+        thread_pool.shutdown()
+
+    def testBaseExceptions(self):
+        thread_pool = _thread_pool()
+
+        def exit_task():
+            raise SystemExit()
+
+        exit_futures = [
+            thread_pool.submit(exit_task)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+        value_future = thread_pool.submit(lambda value: value, 7)
+
+        for exit_future in exit_futures:
+            self.assertIsInstance(
+                exit_future.exception(timeout=test_constants.SHORT_TIMEOUT),
+                SystemExit)
+        self.assertEqual(7,
+                         value_future.result(
+                             timeout=test_constants.SHORT_TIMEOUT))
+        thread_pool.shutdown()
+
+    def testGrowsToMaxWorkersAndShrinksWhenIdle(self):
+        thread_pool = _thread_pool()
+        initial_thread_count = threading.active_count()
+        barrier = threading.Event()
+
+        futures = [
+            thread_pool.submit(barrier.wait)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+        busy_thread_count = threading.active_count()
+        barrier.set()
+        for future in futures:
+            future.result()
+        time.sleep(_IDLE_TIMEOUT * 10)
+
+        self.assertEqual(initial_thread_count + _MAX_WORKERS,
+                         busy_thread_count)
+        self.assertEqual(initial_thread_count, threading.active_count())
+        thread_pool.shutdown()
+
+    def testOverloadedOnlyWhileQueueingDelayStaysAboveTarget(self):
+        thread_pool = _thread_pool()
+        not_overloaded_while_idle = not thread_pool.overloaded()
+
+        futures = [
+            thread_pool.submit(time.sleep, _INTERVAL)
+            for _ in range(_MAX_WORKERS * 6)
+        ]
+        time.sleep(_INTERVAL * 2.5)
+        overloaded_with_backlog = thread_pool.overloaded()
+        for future in futures:
+            future.result()
+
+        self.assertTrue(not_overloaded_while_idle)
+        self.assertTrue(overloaded_with_backlog)
+        self.assertFalse(thread_pool.overloaded())
+        thread_pool.shutdown()
+
+    def testNoSubmissionAfterShutdown(self):
+        thread_pool = _thread_pool()
+        thread_pool.shutdown()
+
+        with self.assertRaises(RuntimeError):
+            thread_pool.submit(time.sleep, 0)
+
+    def testServerShedsLoadWhenOverloaded(self):
+        handler = _GenericHandler()
+        server = grpc.server(
+            _thread_pool(),
+            handlers=(handler,),
+            options=(('grpc.so_reuseport', 0),))
+        port = server.add_insecure_port('[::]:0')
+        server.start()
+        channel = grpc.insecure_channel('localhost:%d' % port)
+        multi_callable = channel.unary_unary(_BLOCKING_UNARY_UNARY)
+
+        backlog_futures = [
+            multi_callable.future(b'backlog') for _ in range(_MAX_WORKERS * 2)
+        ]
+        deadline = time.time() + test_constants.SHORT_TIMEOUT
+        while True:
+            try:
+                multi_callable(b'probe', timeout=_INTERVAL)
+            except grpc.RpcError as rpc_error:
+                if rpc_error.code() is grpc.StatusCode.RESOURCE_EXHAUSTED:
+                    break
+            self.assertLess(time.time(), deadline)
+            time.sleep(_INTERVAL)
+        handler.release()
+
+        for backlog_future in backlog_futures:
+            self.assertEqual(b'backlog', backlog_future.result())
+        server.stop(None)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
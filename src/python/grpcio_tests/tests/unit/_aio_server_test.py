@@ -0,0 +1,175 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the asyncio server of grpc.experimental.aio."""
+
+import sys
+import unittest
+
+import grpc
+
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b'\x00\x00\x00'
+_RESPONSE = b'\x00\x00\x01'
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_UNARY_STREAM = '/test/UnaryStream'
+_STREAM_UNARY = '/test/StreamUnary'
+_STREAM_STREAM = '/test/StreamStream'
+_EXCEPTIONAL_UNARY_UNARY = '/test/ExceptionalUnaryUnary'
+
+
+def _handle_unary_unary(request, servicer_context):
+    import asyncio  # pylint: disable=import-error
+    return asyncio.sleep(0, result=_RESPONSE)
+
+
+def _handle_exceptional_unary_unary(request, servicer_context):
+    raise Exception('Raised from the servicer!')
+
+
+def _handle_unary_stream(request, servicer_context):
+    for _ in range(test_constants.STREAM_LENGTH):
+        yield _RESPONSE
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    import asyncio  # pylint: disable=import-error
+    joined = asyncio.get_event_loop().create_future()
+    requests = []
+
+    def on_request(request_future):
+        try:
+            requests.append(request_future.result())
+        except StopAsyncIteration:  # pylint: disable=undefined-variable
+            joined.set_result(b''.join(requests))
+        else:
+            asyncio.ensure_future(
+                request_iterator.__anext__()).add_done_callback(on_request)
+
+    asyncio.ensure_future(
+        request_iterator.__anext__()).add_done_callback(on_request)
+    return joined
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    return request_iterator
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(_handle_unary_unary)
+        elif handler_call_details.method == _EXCEPTIONAL_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                _handle_exceptional_unary_unary)
+        elif handler_call_details.method == _UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(_handle_unary_stream)
+        elif handler_call_details.method == _STREAM_UNARY:
+            return grpc.stream_unary_rpc_method_handler(_handle_stream_unary)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(_handle_stream_stream)
+        else:
+            return None
+
+
+def _drain(loop, response_iterator):
+    responses = []
+    while True:
+        try:
+            responses.append(
+                loop.run_until_complete(response_iterator.__anext__()))
+        except StopAsyncIteration:  # pylint: disable=undefined-variable
+            return responses
+
+
+@unittest.skipIf(sys.version_info < (3, 5), 'asyncio API requires Python 3.5')
+class AioServerTest(unittest.TestCase):
+
+    def setUp(self):
+        import asyncio  # pylint: disable=import-error
+        from grpc.experimental import aio  # pylint: disable=import-error
+        self._aio = aio
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+        self._server = aio.server(
+            handlers=(_GenericHandler(),),
+            options=(('grpc.so_reuseport', 0),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = aio.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._loop.run_until_complete(self._server.stop(None))
+        self._loop.close()
+
+    def testUnaryUnary(self):
+        response = self._loop.run_until_complete(
+            self._channel.unary_unary(_UNARY_UNARY)(_REQUEST))
+
+        self.assertEqual(_RESPONSE, response)
+
+    def testExceptionalUnaryUnary(self):
+        call = self._channel.unary_unary(_EXCEPTIONAL_UNARY_UNARY)(_REQUEST)
+        with self.assertRaises(self._aio.AioRpcError) as exception_context:
+            self._loop.run_until_complete(call)
+
+        self.assertIs(grpc.StatusCode.UNKNOWN,
+                      exception_context.exception.code())
+
+    def testUnknownMethod(self):
+        call = self._channel.unary_unary('/test/Unknown')(_REQUEST)
+        with self.assertRaises(self._aio.AioRpcError) as exception_context:
+            self._loop.run_until_complete(call)
+
+        self.assertIs(grpc.StatusCode.UNIMPLEMENTED,
+                      exception_context.exception.code())
+
+    def testUnaryStream(self):
+        call = self._channel.unary_stream(_UNARY_STREAM)(_REQUEST)
+
+        self.assertSequenceEqual([_RESPONSE] * test_constants.STREAM_LENGTH,
+                                 _drain(self._loop, call))
+
+    def testStreamUnary(self):
+        call = self._channel.stream_unary(_STREAM_UNARY)(iter(
+            [_REQUEST] * test_constants.STREAM_LENGTH))
+
+        self.assertEqual(_REQUEST * test_constants.STREAM_LENGTH,
+                         self._loop.run_until_complete(call))
+
+    def testStreamStream(self):
+        call = self._channel.stream_stream(_STREAM_STREAM)(iter(
+            [_REQUEST] * test_constants.STREAM_LENGTH))
+
+        self.assertSequenceEqual([_REQUEST] * test_constants.STREAM_LENGTH,
+                                 _drain(self._loop, call))
+
+    def testManyConcurrentStreams(self):
+        import asyncio  # pylint: disable=import-error
+        multi_callable = self._channel.stream_unary(_STREAM_UNARY)
+        calls = [
+            multi_callable(iter([_REQUEST] * test_constants.STREAM_LENGTH))
+            for _ in range(test_constants.RPC_CONCURRENCY)
+        ]
+        responses = self._loop.run_until_complete(asyncio.gather(*calls))
+
+        self.assertSequenceEqual(
+            [_REQUEST * test_constants.STREAM_LENGTH] *
+            test_constants.RPC_CONCURRENCY, responses)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
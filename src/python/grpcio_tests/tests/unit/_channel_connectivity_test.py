@@ -140,6 +140,34 @@ class ChannelConnectivityTest(unittest.TestCase):
         channel.unsubscribe(callback.update)
         self.assertFalse(thread_pool.was_used())
 
+    def test_many_subscribed_channels_share_a_watching_thread(self):
+        # Make sure the process-wide watching thread already exists.
+        warm_up_callback = _Callback()
+        warm_up_channel = grpc.insecure_channel('localhost:12345')
+        warm_up_channel.subscribe(warm_up_callback.update, try_to_connect=False)
+        warm_up_callback.block_until_connectivities_satisfy(bool)
+        initial_thread_count = threading.active_count()
+        callbacks = []
+        channels = []
+
+        for _ in range(test_constants.THREAD_CONCURRENCY):
+            callback = _Callback()
+            channel = grpc.insecure_channel('localhost:12345')
+            channel.subscribe(callback.update, try_to_connect=False)
+            callbacks.append(callback)
+            channels.append(channel)
+        for callback in callbacks:
+            callback.block_until_connectivities_satisfy(bool)
+        deadline = time.time() + test_constants.SHORT_TIMEOUT
+        while (initial_thread_count < threading.active_count() and
+               time.time() < deadline):
+            time.sleep(0.05)
+
+        self.assertLessEqual(threading.active_count(), initial_thread_count)
+        for channel, callback in zip(channels, callbacks):
+            channel.unsubscribe(callback.update)
+        warm_up_channel.unsubscribe(warm_up_callback.update)
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
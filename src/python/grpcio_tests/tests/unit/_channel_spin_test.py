@@ -0,0 +1,83 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the thread that drives a channel's managed calls."""
+
+import threading
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b'\x00\x00\x00'
+_RESPONSE = b'\x00\x00\x01'
+
+_UNARY_UNARY = '/test/UnaryUnary'
+
+_ROUNDS = 200
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, servicer_context: _RESPONSE)
+        else:
+            return None
+
+
+class ChannelSpinTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def testCallsStartedAsOthersFinishComplete(self):
+        multi_callable = self._channel.unary_unary(_UNARY_UNARY)
+        responses = []
+        lock = threading.Lock()
+
+        def call_in_turn():
+            # Each call starts while other threads' calls are finishing, so
+            # the channel's set of managed calls keeps emptying and refilling.
+            for _ in range(_ROUNDS):
+                response = multi_callable.future(_REQUEST).result(
+                    timeout=test_constants.SHORT_TIMEOUT)
+                with lock:
+                    responses.append(response)
+
+        threads = [
+            threading.Thread(target=call_in_turn)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertSequenceEqual(
+            (_RESPONSE,) * (_ROUNDS * test_constants.THREAD_CONCURRENCY),
+            responses)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -65,6 +65,47 @@ class ChannelTest(unittest.TestCase):
     def test_multiple_channels_lonely_connectivity(self):
         _in_parallel(_create_loop_destroy, ())
 
+    def test_start_client_batches_reports_failures_per_call(self):
+        channel, completion_queue = _channel_and_completion_queue()
+        calls = channel.create_calls(None, 0, completion_queue, b'/test/Method',
+                                     None, time.time() + 1, 2)
+
+        call_errors = cygrpc.start_client_batches(
+            calls, (
+                (object(),),
+                (cygrpc.SendInitialMetadataOperation((), 0),),
+            ), ('first_tag', 'second_tag'))
+        event = completion_queue.poll()
+        for call in calls:
+            call.cancel()
+
+        self.assertEqual(
+            [cygrpc.CallError.error, cygrpc.CallError.ok], call_errors)
+        self.assertEqual('second_tag', event.tag)
+        completion_queue.shutdown()
+
+    def test_rejected_unary_unary_client_batch_is_released(self):
+        channel, completion_queue = _channel_and_completion_queue()
+        call = channel.create_call(None, 0, completion_queue, b'/test/Method',
+                                   None, time.time() + 1)
+        started_batch = cygrpc.UnaryUnaryClientBatch()
+        started_batch.fill((), b'\x07')
+        rejected_batch = cygrpc.UnaryUnaryClientBatch()
+        rejected_batch.fill((), b'\x08')
+
+        started_error = call.start_client_batch(started_batch, 'started_tag')
+        rejected_error = call.start_client_batch(rejected_batch,
+                                                 'rejected_tag')
+        call.cancel()
+        event = completion_queue.poll()
+        rejected_batch.fill((), b'\x09')
+
+        self.assertEqual(cygrpc.CallError.ok, started_error)
+        self.assertEqual(cygrpc.CallError.too_many_operations, rejected_error)
+        self.assertEqual('started_tag', event.tag)
+        self.assertIs(started_batch, event.batch_operations)
+        completion_queue.shutdown()
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
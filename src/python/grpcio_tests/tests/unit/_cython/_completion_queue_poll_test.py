@@ -0,0 +1,125 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of CompletionQueue.poll and CompletionQueue.poll_many."""
+
+import threading
+import time
+import unittest
+
+from grpc._cython import cygrpc
+
+_POLL_DURATION = 0.5
+_REQUEST_CALL_COUNT = 3
+
+
+def _poll_until_timeout(completion_queue):
+    start = time.time()
+    event = completion_queue.poll(deadline=start + _POLL_DURATION)
+    return event, time.time() - start
+
+
+class CompletionQueuePollTest(unittest.TestCase):
+
+    def tearDown(self):
+        cygrpc.set_interrupt_check_period(0.2)
+
+    def testMainThreadPollTimesOutAtDeadline(self):
+        cygrpc.set_interrupt_check_period(0.05)
+        completion_queue = cygrpc.CompletionQueue()
+
+        event, duration = _poll_until_timeout(completion_queue)
+
+        self.assertEqual(cygrpc.CompletionType.queue_timeout, event.type)
+        self.assertLessEqual(_POLL_DURATION * 0.9, duration)
+
+    def testOtherThreadPollTimesOutAtDeadline(self):
+        completion_queue = cygrpc.CompletionQueue()
+        results = []
+        thread = threading.Thread(target=lambda: results.append(
+            _poll_until_timeout(completion_queue)))
+
+        thread.start()
+        thread.join()
+
+        event, duration = results[0]
+        self.assertEqual(cygrpc.CompletionType.queue_timeout, event.type)
+        self.assertLessEqual(_POLL_DURATION * 0.9, duration)
+
+    def testOtherThreadPollReturnsAtShutdown(self):
+        completion_queue = cygrpc.CompletionQueue()
+        events = []
+        thread = threading.Thread(
+            target=lambda: events.append(completion_queue.poll()))
+
+        thread.start()
+        completion_queue.shutdown()
+        thread.join()
+
+        self.assertEqual(cygrpc.CompletionType.queue_timeout, events[0].type)
+        self.assertTrue(events[0].success)
+
+    def testPollManyTakesReadyEvents(self):
+        completion_queue = cygrpc.CompletionQueue()
+        server = cygrpc.Server(None)
+        server.register_completion_queue(completion_queue)
+        server.add_http2_port(b'[::]:0')
+        server.start()
+        request_call_tags = tuple(
+            'request_call_tag_{}'.format(index)
+            for index in range(_REQUEST_CALL_COUNT))
+        for request_call_tag in request_call_tags:
+            server.request_call(completion_queue, completion_queue,
+                                request_call_tag)
+
+        server.shutdown(completion_queue, 'shutdown_tag')
+        server.cancel_all_calls()
+        # Give the server time to fail all of its request_calls.
+        time.sleep(_POLL_DURATION)
+        bursts = []
+        tags = set()
+        while len(tags) < _REQUEST_CALL_COUNT + 1:
+            events = completion_queue.poll_many(
+                _REQUEST_CALL_COUNT + 2, deadline=time.time() + 5)
+            bursts.append(events)
+            tags.update(event.tag for event in events)
+
+        self.assertLess(1, len(bursts[0]))
+        self.assertEqual(set(request_call_tags + ('shutdown_tag',)), tags)
+        self.assertFalse(
+            any(event.success
+                for events in bursts for event in events
+                if event.tag in request_call_tags))
+
+    def testPollManyTimesOutAtDeadline(self):
+        completion_queue = cygrpc.CompletionQueue()
+
+        events = completion_queue.poll_many(
+            3, deadline=time.time() + _POLL_DURATION)
+
+        self.assertEqual(1, len(events))
+        self.assertEqual(cygrpc.CompletionType.queue_timeout, events[0].type)
+
+    def testPollManyOfNoEvents(self):
+        completion_queue = cygrpc.CompletionQueue()
+
+        with self.assertRaises(ValueError):
+            completion_queue.poll_many(0)
+
+    def testInvalidInterruptCheckPeriod(self):
+        with self.assertRaises(ValueError):
+            cygrpc.set_interrupt_check_period(0)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
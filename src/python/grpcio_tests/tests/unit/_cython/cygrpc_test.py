@@ -54,6 +54,14 @@ class TypeSmokeTest(unittest.TestCase):
         channel = cygrpc.Channel(b'[::]:0', None)
         del channel
 
+    def testCallUpDown(self):
+        for _ in range(3):
+            call = cygrpc.Call()
+            call_details = cygrpc.CallDetails()
+            self.assertFalse(call.is_valid)
+            self.assertEqual(b'', call_details.method)
+            del call, call_details
+
     def test_metadata_plugin_call_credentials_up_down(self):
         cygrpc.MetadataPluginCallCredentials(_metadata_plugin,
                                              b'test plugin name!')
@@ -0,0 +1,127 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of unary-unary handlers run on the server's polling thread."""
+
+import unittest
+
+import grpc
+
+from tests.unit import _thread_pool
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b'\x00\x00\x00'
+_RESPONSE = b'\x00\x00\x01'
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_ABORTING_UNARY_UNARY = '/test/AbortingUnaryUnary'
+_RAISING_UNARY_UNARY = '/test/RaisingUnaryUnary'
+_UNDESERIALIZABLE_UNARY_UNARY = '/test/UndeserializableUnaryUnary'
+
+_ABORT_DETAILS = 'Aborted inline!'
+
+
+def _abort(request, servicer_context):
+    servicer_context.abort(grpc.StatusCode.FAILED_PRECONDITION, _ABORT_DETAILS)
+
+
+def _raise(request, servicer_context):
+    raise ValueError('Raised inline!')
+
+
+def _undeserializable(request):
+    raise ValueError('Undeserializable request!')
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, servicer_context: _RESPONSE, inline=True)
+        elif handler_call_details.method == _ABORTING_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(_abort, inline=True)
+        elif handler_call_details.method == _RAISING_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(_raise, inline=True)
+        elif handler_call_details.method == _UNDESERIALIZABLE_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, servicer_context: _RESPONSE,
+                request_deserializer=_undeserializable,
+                inline=True)
+        else:
+            return None
+
+
+class InlineHandlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._thread_pool = _thread_pool.RecordingThreadPool(max_workers=None)
+        self._server = grpc.server(
+            self._thread_pool,
+            handlers=(_GenericHandler(),),
+            options=(('grpc.so_reuseport', 0),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def _assert_code(self, code, method):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._channel.unary_unary(method)(_REQUEST)
+        self.assertIs(code, exception_context.exception.code())
+        return exception_context.exception
+
+    def testSuccessfulUnaryUnary(self):
+        multi_callable = self._channel.unary_unary(_UNARY_UNARY)
+
+        responses = [
+            multi_callable(_REQUEST)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+
+        self.assertSequenceEqual(
+            (_RESPONSE,) * test_constants.THREAD_CONCURRENCY, responses)
+        self.assertFalse(self._thread_pool.was_used())
+
+    def testAbortedUnaryUnary(self):
+        exception = self._assert_code(grpc.StatusCode.FAILED_PRECONDITION,
+                                      _ABORTING_UNARY_UNARY)
+
+        self.assertEqual(_ABORT_DETAILS, exception.details())
+
+    def testRaisingUnaryUnary(self):
+        self._assert_code(grpc.StatusCode.UNKNOWN, _RAISING_UNARY_UNARY)
+
+    def testUndeserializableUnaryUnary(self):
+        self._assert_code(grpc.StatusCode.INTERNAL,
+                          _UNDESERIALIZABLE_UNARY_UNARY)
+
+    def testMissingRequest(self):
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._channel.stream_unary(_UNARY_UNARY)(iter(()))
+
+        self.assertIs(grpc.StatusCode.UNIMPLEMENTED,
+                      exception_context.exception.code())
+
+    def testServerStaysResponsiveAfterInlineRpcs(self):
+        for _ in range(test_constants.STREAM_LENGTH):
+            self._assert_code(grpc.StatusCode.UNKNOWN, _RAISING_UNARY_UNARY)
+
+        self.assertEqual(_RESPONSE,
+                         self._channel.unary_unary(_UNARY_UNARY)(_REQUEST))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
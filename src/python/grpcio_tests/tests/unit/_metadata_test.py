@@ -42,6 +42,10 @@ _INVOCATION_METADATA = (
         u'invocation-md-key-bin',
         b'\x00\x01',
     ),
+    (
+        b'authorization',
+        u'invocation-md-authorization',
+    ),
 )
 _EXPECTED_INVOCATION_METADATA = (
     (
@@ -52,6 +56,10 @@ _EXPECTED_INVOCATION_METADATA = (
         'invocation-md-key-bin',
         b'\x00\x01',
     ),
+    (
+        'authorization',
+        'invocation-md-authorization',
+    ),
 )
 
 _INITIAL_METADATA = ((b'initial-md-key', u'initial-md-value'),
@@ -76,6 +84,10 @@ _TRAILING_METADATA = (
         'server-trailing-md-key-bin',
         b'\x00\x03',
     ),
+    (
+        'x-request-id',
+        'server-trailing-md-request-id',
+    ),
 )
 _EXPECTED_TRAILING_METADATA = _TRAILING_METADATA
 
@@ -235,6 +247,42 @@ class MetadataTest(unittest.TestCase):
             test_common.metadata_transmitted(_EXPECTED_TRAILING_METADATA,
                                              call.trailing_metadata()))
 
+    def testReceivedMetadataIsSequence(self):
+        multi_callable = self._channel.unary_unary(_UNARY_UNARY)
+        unused_response, call = multi_callable.with_call(
+            _REQUEST, metadata=_INVOCATION_METADATA)
+        trailing_metadata = call.trailing_metadata()
+
+        self.assertEqual(len(trailing_metadata), len(tuple(trailing_metadata)))
+        self.assertEqual(tuple(trailing_metadata), trailing_metadata)
+        self.assertEqual(trailing_metadata[-1],
+                         tuple(trailing_metadata)[-1])
+        self.assertEqual(
+            tuple(trailing_metadata)[1:], trailing_metadata[1:])
+        self.assertEqual(
+            dict(_EXPECTED_TRAILING_METADATA)['x-request-id'],
+            dict(trailing_metadata)['x-request-id'])
+        with self.assertRaises(IndexError):
+            trailing_metadata[len(trailing_metadata)]
+
+    def testReceivedMetadataConcatenates(self):
+        multi_callable = self._channel.unary_unary(_UNARY_UNARY)
+        unused_response, call = multi_callable.with_call(
+            _REQUEST, metadata=_INVOCATION_METADATA)
+        trailing_metadata = call.trailing_metadata()
+        extra_metadata = (('extra-md-key', 'extra-md-value'),)
+
+        self.assertEqual(
+            tuple(trailing_metadata) + extra_metadata,
+            trailing_metadata + extra_metadata)
+        self.assertEqual(
+            extra_metadata + tuple(trailing_metadata),
+            extra_metadata + trailing_metadata)
+        self.assertEqual(
+            tuple(trailing_metadata) * 2, trailing_metadata + trailing_metadata)
+        with self.assertRaises(TypeError):
+            trailing_metadata + 1
+
 
 if __name__ == '__main__':
     unittest.main(verbosity=2)
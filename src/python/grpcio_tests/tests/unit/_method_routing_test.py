@@ -0,0 +1,126 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the server's routing of RPCs to method handlers."""
+
+import threading
+import unittest
+from concurrent import futures
+
+import grpc
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE = 'test.Service'
+_METHOD = 'Method'
+_OTHER_METHOD = 'OtherMethod'
+
+_REQUEST = b'\x00\x00\x00'
+
+
+def _method_handler(response):
+    return grpc.unary_unary_rpc_method_handler(
+        lambda request, servicer_context: response)
+
+
+def _dictionary_handler(responses):
+    return grpc.method_handlers_generic_handler(_SERVICE, {
+        method: _method_handler(response)
+        for method, response in responses.items()
+    })
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def __init__(self, method, response):
+        self._lock = threading.Lock()
+        self._method = '/{}/{}'.format(_SERVICE, method)
+        self._response = response
+        self.service_count = 0
+
+    def service(self, handler_call_details):
+        with self._lock:
+            self.service_count += 1
+        if handler_call_details.method == self._method:
+            return _method_handler(self._response)
+        else:
+            return None
+
+
+class MethodRoutingTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=test_constants.POOL_SIZE),
+            options=(('grpc.so_reuseport', 0),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def _invoke(self, method):
+        return self._channel.unary_unary('/{}/{}'.format(_SERVICE,
+                                                         method))(_REQUEST)
+
+    def testDictionaryHandlersServedWithoutFallback(self):
+        generic_handler = _GenericHandler(_METHOD, b'generic')
+        self._server.add_generic_rpc_handlers((
+            _dictionary_handler({
+                _METHOD: b'first'
+            }),
+            _dictionary_handler({
+                _METHOD: b'second',
+                _OTHER_METHOD: b'other'
+            }),
+            generic_handler,
+        ))
+        self._server.start()
+
+        self.assertEqual(b'first', self._invoke(_METHOD))
+        self.assertEqual(b'other', self._invoke(_OTHER_METHOD))
+        self.assertEqual(0, generic_handler.service_count)
+
+    def testGenericHandlerPrecedesLaterDictionaryHandlers(self):
+        generic_handler = _GenericHandler(_METHOD, b'generic')
+        self._server.add_generic_rpc_handlers((
+            generic_handler,
+            _dictionary_handler({
+                _METHOD: b'dictionary',
+                _OTHER_METHOD: b'other'
+            }),
+        ))
+        self._server.start()
+
+        self.assertEqual(b'generic', self._invoke(_METHOD))
+        self.assertEqual(b'other', self._invoke(_OTHER_METHOD))
+
+    def testMissFallsBackToGenericHandlers(self):
+        generic_handler = _GenericHandler(_OTHER_METHOD, b'generic')
+        self._server.add_generic_rpc_handlers((_dictionary_handler({
+            _METHOD: b'dictionary'
+        }),))
+        self._server.add_generic_rpc_handlers((generic_handler,))
+        self._server.start()
+
+        self.assertEqual(b'generic', self._invoke(_OTHER_METHOD))
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            self._invoke('MissingMethod')
+
+        self.assertIs(grpc.StatusCode.UNIMPLEMENTED,
+                      exception_context.exception.code())
+        self.assertEqual(2, generic_handler.service_count)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
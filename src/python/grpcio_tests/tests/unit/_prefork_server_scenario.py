@@ -0,0 +1,67 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""A prefork server run in a process of its own by _prefork_server_test."""
+
+import os
+import signal
+import sys
+from concurrent import futures
+
+import grpc
+from grpc import experimental
+
+ADDRESS = '127.0.0.1:0'
+WORKER_COUNT = 2
+
+PID = '/test/Pid'
+STALL = '/test/Stall'
+
+
+def _pid(request, servicer_context):
+    return '{} {}'.format(os.getpid(), os.getppid()).encode('ascii')
+
+
+def _stall(request, servicer_context):
+    # A stopped worker cannot read its stop message, so it can only be ended
+    # by being killed.
+    os.kill(os.getpid(), signal.SIGSTOP)
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == PID:
+            return grpc.unary_unary_rpc_method_handler(_pid)
+        elif handler_call_details.method == STALL:
+            return grpc.unary_unary_rpc_method_handler(_stall)
+        else:
+            return None
+
+
+def _create_server(options):
+    return grpc.server(
+        futures.ThreadPoolExecutor(max_workers=1),
+        handlers=(_GenericHandler(),),
+        options=options)
+
+
+if __name__ == '__main__':
+    worker_count = int(sys.argv[1]) if 1 < len(sys.argv) else WORKER_COUNT
+    server = experimental.prefork_server(_create_server, ADDRESS, worker_count)
+    server.start()
+    sys.stdout.write('{}\n'.format(server.port))
+    sys.stdout.flush()
+    # An empty line stops the server with no grace, any other gives the grace.
+    grace_line = sys.stdin.readline().strip()
+    server.stop(float(grace_line) if grace_line else None).wait()
@@ -0,0 +1,161 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of servers servicing RPCs from several forked processes."""
+
+import os
+import signal
+import socket
+import subprocess
+import sys
+import time
+import unittest
+
+import grpc
+
+from tests.unit import _prefork_server_scenario
+from tests.unit.framework.common import test_constants
+
+_SCENARIO_FILE = os.path.abspath(
+    os.path.join(
+        os.path.dirname(os.path.realpath(__file__)),
+        '_prefork_server_scenario.py'))
+
+_EXIT_POLL_PERIOD_S = 0.05
+
+
+def _wait_for_exit(process, timeout):
+    deadline = time.time() + timeout
+    while process.poll() is None:
+        if deadline < time.time():
+            return None
+        time.sleep(_EXIT_POLL_PERIOD_S)
+    return process.returncode
+
+
+@unittest.skipUnless(
+    hasattr(os, 'fork') and hasattr(socket, 'SO_REUSEPORT'),
+    'Prefork serving requires fork and SO_REUSEPORT')
+class PreforkServerTest(unittest.TestCase):
+
+    def setUp(self):
+        self._process = None
+
+    def tearDown(self):
+        if self._process is not None and self._process.poll() is None:
+            self._process.kill()
+            self._process.wait()
+
+    def _start(self, worker_count=_prefork_server_scenario.WORKER_COUNT):
+        self._process = subprocess.Popen(
+            [sys.executable, _SCENARIO_FILE, str(worker_count)],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE)
+        self._port = int(self._process.stdout.readline())
+
+    def _stop(self, grace):
+        self._process.stdin.write(
+            b'\n' if grace is None else '{}\n'.format(grace).encode('ascii'))
+        self._process.stdin.flush()
+
+    def _channel(self, channel_id):
+        # Distinct channel arguments keep the channels from sharing a
+        # connection, so that their RPCs may reach different workers.
+        return grpc.insecure_channel(
+            '127.0.0.1:{}'.format(self._port),
+            options=(('grpc.testing.channel_id', channel_id),))
+
+    def _pid_and_parent_pid(self, channel):
+        response = channel.unary_unary(_prefork_server_scenario.PID)(
+            b'', timeout=test_constants.SHORT_TIMEOUT)
+        pid, parent_pid = response.split()
+        return int(pid), int(parent_pid)
+
+    def _pid(self, channel_id):
+        return self._pid_and_parent_pid(self._channel(channel_id))[0]
+
+    def _await_stall(self, channel):
+        deadline = time.time() + test_constants.SHORT_TIMEOUT
+        while True:
+            try:
+                channel.unary_unary(_prefork_server_scenario.PID)(
+                    b'', timeout=test_constants.SHORT_TIMEOUT / 8.0)
+            except grpc.RpcError:
+                return
+            self.assertLess(time.time(), deadline)
+
+    def testRpcsServicedByWorkers(self):
+        self._start()
+
+        pids_and_parent_pids = set(
+            self._pid_and_parent_pid(self._channel(channel_id))
+            for channel_id in range(test_constants.THREAD_CONCURRENCY))
+
+        pids = set(pid for pid, _ in pids_and_parent_pids)
+        self.assertNotIn(self._process.pid, pids)
+        self.assertLessEqual(len(pids), _prefork_server_scenario.WORKER_COUNT)
+        self.assertEqual(
+            set((self._process.pid,)),
+            set(parent_pid for _, parent_pid in pids_and_parent_pids))
+
+    def testExitedWorkerReplaced(self):
+        # With a single worker every RPC after its death reaches a replacement.
+        self._start(worker_count=1)
+        exited_pid = self._pid(0)
+        os.kill(exited_pid, signal.SIGKILL)
+
+        deadline = time.time() + 2 * test_constants.SHORT_TIMEOUT
+        channel_id = 1
+        while True:
+            try:
+                pid, parent_pid = self._pid_and_parent_pid(
+                    self._channel(channel_id))
+            except grpc.RpcError:
+                pid = None
+            if pid is not None:
+                break
+            self.assertLess(time.time(), deadline)
+            channel_id += 1
+
+        self.assertNotEqual(exited_pid, pid)
+        self.assertEqual(self._process.pid, parent_pid)
+
+    def testStop(self):
+        self._start()
+        self._pid(0)
+
+        self._stop(None)
+
+        self.assertEqual(0,
+                         _wait_for_exit(self._process,
+                                        test_constants.SHORT_TIMEOUT))
+
+    def testWorkerOutlastingGraceKilled(self):
+        self._start(worker_count=1)
+        channel = self._channel(0)
+        stall_future = channel.unary_unary(
+            _prefork_server_scenario.STALL).future(b'')
+        self._await_stall(channel)
+
+        self._stop(test_constants.SHORT_TIMEOUT / 4.0)
+
+        # The stopped worker never exits of itself, so the server finishes
+        # stopping only if the worker is killed once the grace has elapsed.
+        self.assertEqual(0,
+                         _wait_for_exit(self._process,
+                                        test_constants.SHORT_TIMEOUT))
+        stall_future.cancel()
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
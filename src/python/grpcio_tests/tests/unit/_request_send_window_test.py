@@ -0,0 +1,117 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of request-streaming RPCs made with a request send window."""
+
+import unittest
+
+import grpc
+from grpc import experimental
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SEND_WINDOW = 8
+
+_STREAM_UNARY = '/test/StreamUnary'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b''.join(request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _STREAM_UNARY:
+            return grpc.stream_unary_rpc_method_handler(_handle_stream_unary)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(_handle_stream_stream)
+        else:
+            return None
+
+
+def _requests():
+    return tuple(
+        bytes(bytearray((index % 256,)))
+        for index in range(test_constants.STREAM_LENGTH))
+
+
+def _failing_request_iterator(requests):
+    for request in requests:
+        yield request
+    raise ValueError('Raised from the request iterator!')
+
+
+class RequestSendWindowTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            'localhost:%d' % port,
+            options=((experimental.ChannelOptions.RequestSendWindow,
+                      _SEND_WINDOW),))
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def testBlockingStreamUnary(self):
+        requests = _requests()
+
+        response = self._channel.stream_unary(_STREAM_UNARY)(iter(requests))
+
+        self.assertEqual(b''.join(requests), response)
+
+    def testFutureStreamUnary(self):
+        requests = _requests()
+
+        response_future = self._channel.stream_unary(_STREAM_UNARY).future(
+            iter(requests))
+
+        self.assertEqual(b''.join(requests), response_future.result())
+
+    def testStreamStream(self):
+        requests = _requests()
+
+        response_iterator = self._channel.stream_stream(_STREAM_STREAM)(
+            iter(requests))
+
+        self.assertSequenceEqual(requests, tuple(response_iterator))
+
+    def testEmptyStreamStream(self):
+        response_iterator = self._channel.stream_stream(_STREAM_STREAM)(iter(
+            ()))
+
+        self.assertSequenceEqual((), tuple(response_iterator))
+
+    def testFailingRequestIterator(self):
+        multi_callable = self._channel.stream_unary(_STREAM_UNARY)
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            multi_callable(_failing_request_iterator(_requests()))
+
+        self.assertIs(grpc.StatusCode.UNKNOWN,
+                      exception_context.exception.code())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,120 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of request-streaming RPCs whose requests are written by the caller."""
+
+import threading
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_REQUEST = b'\x01\x02'
+
+_STREAM_UNARY = '/test/StreamUnary'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+def _handle_stream_unary(request_iterator, servicer_context):
+    return b''.join(request_iterator)
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _STREAM_UNARY:
+            return grpc.stream_unary_rpc_method_handler(_handle_stream_unary)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(_handle_stream_stream)
+        else:
+            return None
+
+
+class RequestWritingTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def testStreamUnary(self):
+        call = self._channel.stream_unary(_STREAM_UNARY).future(None)
+        for _ in range(test_constants.STREAM_LENGTH):
+            call.write(_REQUEST)
+        call.done_writing()
+
+        self.assertEqual(_REQUEST * test_constants.STREAM_LENGTH,
+                         call.result())
+
+    def testStreamStreamPingPong(self):
+        call = self._channel.stream_stream(_STREAM_STREAM)(None)
+        for _ in range(test_constants.STREAM_LENGTH):
+            call.write(_REQUEST)
+            self.assertEqual(_REQUEST, next(call))
+        call.done_writing()
+
+        self.assertSequenceEqual((), tuple(call))
+        self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testStreamStreamWrittenFromAnotherThread(self):
+        call = self._channel.stream_stream(_STREAM_STREAM)(None)
+
+        def write_requests():
+            for _ in range(test_constants.STREAM_LENGTH):
+                call.write(_REQUEST)
+            call.done_writing()
+
+        writing_thread = threading.Thread(target=write_requests)
+        writing_thread.start()
+        responses = tuple(call)
+        writing_thread.join()
+
+        self.assertSequenceEqual((_REQUEST,) * test_constants.STREAM_LENGTH,
+                                 responses)
+
+    def testWriteAfterDoneWriting(self):
+        call = self._channel.stream_unary(_STREAM_UNARY).future(None)
+        call.done_writing()
+
+        with self.assertRaises(ValueError):
+            call.write(_REQUEST)
+        self.assertEqual(b'', call.result())
+
+    def testWriteAfterCancellation(self):
+        call = self._channel.stream_stream(_STREAM_STREAM)(None)
+        call.cancel()
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            call.write(_REQUEST)
+        self.assertIs(grpc.StatusCode.CANCELLED,
+                      exception_context.exception.code())
+
+    def testBlockingInvocationRequiresRequestIterator(self):
+        with self.assertRaises(ValueError):
+            self._channel.stream_unary(_STREAM_UNARY)(None)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,143 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of response-streaming RPCs made with a response prefetch depth."""
+
+import unittest
+
+import grpc
+from grpc import experimental
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_PREFETCH_DEPTH = 4
+
+_UNARY_STREAM = '/test/UnaryStream'
+_FAILING_UNARY_STREAM = '/test/FailingUnaryStream'
+_STREAM_STREAM = '/test/StreamStream'
+
+
+def _responses():
+    return tuple(
+        bytes(bytearray((index % 256,)))
+        for index in range(test_constants.STREAM_LENGTH))
+
+
+def _deserialize(response):
+    return ('deserialized', response)
+
+
+def _handle_unary_stream(request, servicer_context):
+    for response in _responses():
+        yield response
+
+
+def _handle_failing_unary_stream(request, servicer_context):
+    for response in _responses():
+        yield response
+    servicer_context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, 'Exhausted!')
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(_handle_unary_stream)
+        elif handler_call_details.method == _FAILING_UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(
+                _handle_failing_unary_stream)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(_handle_stream_stream)
+        else:
+            return None
+
+
+class ResponsePrefetchTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            'localhost:%d' % port,
+            options=((experimental.ChannelOptions.ResponsePrefetchDepth,
+                      _PREFETCH_DEPTH),))
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def testUnaryStream(self):
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM)(b'')
+
+        self.assertSequenceEqual(_responses(), tuple(response_iterator))
+        self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+
+    def testFailingUnaryStream(self):
+        response_iterator = self._channel.unary_stream(_FAILING_UNARY_STREAM)(
+            b'')
+
+        responses = []
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            for response in response_iterator:
+                responses.append(response)
+
+        self.assertSequenceEqual(_responses(), responses)
+        self.assertIs(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                      exception_context.exception.code())
+
+    def testStreamStream(self):
+        requests = _responses()
+
+        response_iterator = self._channel.stream_stream(_STREAM_STREAM)(
+            iter(requests))
+
+        self.assertSequenceEqual(requests, tuple(response_iterator))
+
+    def testDeserializedUnaryStream(self):
+        response_iterator = self._channel.unary_stream(
+            _UNARY_STREAM, response_deserializer=_deserialize)(b'')
+
+        self.assertSequenceEqual(
+            tuple(_deserialize(response) for response in _responses()),
+            tuple(response_iterator))
+
+    def testDeserializedStreamStream(self):
+        requests = _responses()
+
+        response_iterator = self._channel.stream_stream(
+            _STREAM_STREAM, response_deserializer=_deserialize)(iter(requests))
+
+        self.assertSequenceEqual(
+            tuple(_deserialize(request) for request in requests),
+            tuple(response_iterator))
+
+    def testCancelledUnaryStream(self):
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM)(b'')
+        next(response_iterator)
+        response_iterator.cancel()
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            tuple(response_iterator)
+        self.assertIs(grpc.StatusCode.CANCELLED,
+                      exception_context.exception.code())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
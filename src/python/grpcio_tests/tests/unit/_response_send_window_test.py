@@ -0,0 +1,153 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of response-streaming RPCs served with a response send window."""
+
+import unittest
+from concurrent import futures
+
+import grpc
+from grpc import experimental
+
+from tests.unit.framework.common import test_constants
+
+_SEND_WINDOW = 8
+
+_UNARY_STREAM = '/test/UnaryStream'
+_STREAM_STREAM = '/test/StreamStream'
+_FAILING_UNARY_STREAM = '/test/FailingUnaryStream'
+_METADATA_UNARY_STREAM = '/test/MetadataUnaryStream'
+
+_INITIAL_METADATA = (('initial-md-key', 'initial-md-value'),)
+_TRAILING_METADATA = (('trailing-md-key', 'trailing-md-value'),)
+
+
+def _responses():
+    return tuple(
+        bytes(bytearray((index % 256,)))
+        for index in range(test_constants.STREAM_LENGTH))
+
+
+def _handle_unary_stream(request, servicer_context):
+    for response in _responses():
+        yield response
+
+
+def _handle_stream_stream(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield request
+
+
+def _handle_failing_unary_stream(request, servicer_context):
+    for response in _responses():
+        yield response
+    raise ValueError('Raised from the response iterator!')
+
+
+def _handle_metadata_unary_stream(request, servicer_context):
+    servicer_context.send_initial_metadata(_INITIAL_METADATA)
+    servicer_context.set_trailing_metadata(_TRAILING_METADATA)
+    for response in _responses():
+        yield response
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(_handle_unary_stream)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(_handle_stream_stream)
+        elif handler_call_details.method == _FAILING_UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(
+                _handle_failing_unary_stream)
+        elif handler_call_details.method == _METADATA_UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(
+                _handle_metadata_unary_stream)
+        else:
+            return None
+
+
+class ResponseSendWindowTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=test_constants.POOL_SIZE),
+            handlers=(_GenericHandler(),),
+            options=(('grpc.so_reuseport', 0),
+                     (experimental.ChannelOptions.ResponseSendWindow,
+                      _SEND_WINDOW),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def testInvalidResponseSendWindow(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=1),
+                options=((experimental.ChannelOptions.ResponseSendWindow, 0),))
+
+    def testUnaryStream(self):
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM)(b'')
+
+        self.assertSequenceEqual(_responses(), tuple(response_iterator))
+        self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+
+    def testStreamStream(self):
+        requests = _responses()
+
+        response_iterator = self._channel.stream_stream(_STREAM_STREAM)(
+            iter(requests))
+
+        self.assertSequenceEqual(requests, tuple(response_iterator))
+
+    def testEmptyStreamStream(self):
+        response_iterator = self._channel.stream_stream(_STREAM_STREAM)(iter(
+            ()))
+
+        self.assertSequenceEqual((), tuple(response_iterator))
+
+    def testFailingResponseIterator(self):
+        response_iterator = self._channel.unary_stream(_FAILING_UNARY_STREAM)(
+            b'')
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            tuple(response_iterator)
+
+        self.assertIs(grpc.StatusCode.UNKNOWN,
+                      exception_context.exception.code())
+
+    def testMetadata(self):
+        response_iterator = self._channel.unary_stream(_METADATA_UNARY_STREAM)(
+            b'')
+
+        self.assertSequenceEqual(_responses(), tuple(response_iterator))
+        self.assertIn(_INITIAL_METADATA[0],
+                      response_iterator.initial_metadata())
+        self.assertIn(_TRAILING_METADATA[0],
+                      response_iterator.trailing_metadata())
+
+    def testCancelledMidStream(self):
+        response_iterator = self._channel.unary_stream(_UNARY_STREAM)(b'')
+        next(response_iterator)
+
+        response_iterator.cancel()
+
+        self.assertIs(grpc.StatusCode.CANCELLED, response_iterator.code())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -202,6 +202,24 @@ class RPCTest(unittest.TestCase):
         self.assertEqual(grpc.StatusCode.UNIMPLEMENTED,
                          exception_context.exception.code())
 
+    def testMissingUnaryRequestUnaryResponse(self):
+        multi_callable = self._channel.stream_unary(_UNARY_UNARY)
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            multi_callable(iter(()))
+
+        self.assertEqual(grpc.StatusCode.UNIMPLEMENTED,
+                         exception_context.exception.code())
+
+    def testMissingUnaryRequestStreamResponse(self):
+        multi_callable = self._channel.stream_stream(_UNARY_STREAM)
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            tuple(multi_callable(iter(())))
+
+        self.assertEqual(grpc.StatusCode.UNIMPLEMENTED,
+                         exception_context.exception.code())
+
     def testSuccessfulUnaryRequestBlockingUnaryResponse(self):
         request = b'\x07\x08'
         expected_response = self._handler.handle_unary_unary(request, None)
@@ -242,6 +260,40 @@ class RPCTest(unittest.TestCase):
         self.assertIsNone(response_future.exception())
         self.assertIsNone(response_future.traceback())
 
+    def testSuccessfulUnaryRequestBatchUnaryResponse(self):
+        requests = tuple(
+            bytes(bytearray((index,)))
+            for index in range(test_constants.RPC_CONCURRENCY))
+        expected_responses = tuple(
+            self._handler.handle_unary_unary(request, None)
+            for request in requests)
+
+        multi_callable = _unary_unary_multi_callable(self._channel)
+        response_futures = multi_callable.batch(
+            requests,
+            metadata=(('test', 'SuccessfulUnaryRequestBatchUnaryResponse'),))
+        responses = tuple(
+            response_future.result() for response_future in response_futures)
+
+        for response_future in response_futures:
+            self.assertIsInstance(response_future, grpc.Future)
+            self.assertIsInstance(response_future, grpc.Call)
+        self.assertSequenceEqual(expected_responses, responses)
+
+    def testPartlyUnserializableUnaryRequestBatchUnaryResponse(self):
+        requests = (b'\x07\x08', None, b'\x09\x0a')
+
+        multi_callable = self._channel.unary_unary(
+            _UNARY_UNARY, request_serializer=lambda request: request[:])
+        response_futures = multi_callable.batch(
+            requests,
+            metadata=(('test',
+                       'PartlyUnserializableUnaryRequestBatchUnaryResponse'),))
+
+        self.assertEqual(requests[0], response_futures[0].result())
+        self.assertIs(grpc.StatusCode.INTERNAL, response_futures[1].code())
+        self.assertEqual(requests[2], response_futures[2].result())
+
     def testSuccessfulUnaryRequestStreamResponse(self):
         request = b'\x37\x58'
         expected_responses = tuple(
@@ -336,6 +388,73 @@ class RPCTest(unittest.TestCase):
         self.assertEqual(expected_first_response, first_response)
         self.assertEqual(expected_second_response, second_response)
 
+    def testSequentialInvocationsOfVaryingSizes(self):
+        requests = (b'\x07\x08', b'\x07' * 64 * 1024, b'', b'\x08' * 1024)
+        metadata = (('test', 'SequentialInvocationsOfVaryingSizes'),)
+
+        multi_callable = _unary_unary_multi_callable(self._channel)
+        for request in requests + tuple(reversed(requests)):
+            response, call = multi_callable.with_call(
+                request, metadata=metadata)
+
+            self.assertEqual(
+                self._handler.handle_unary_unary(request, None), response)
+            self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testSequentialStreamUnaryInvocationsOfVaryingSizes(self):
+        requests = (b'\x07\x08', b'\x07' * 64 * 1024, b'', b'\x08' * 1024)
+        metadata = (('test', 'SequentialStreamUnaryInvocationsOfVaryingSizes'),)
+
+        multi_callable = _stream_unary_multi_callable(self._channel)
+        for request in requests + tuple(reversed(requests)):
+            response, call = multi_callable.with_call(
+                iter((request, request)), metadata=metadata)
+
+            self.assertEqual(
+                self._handler.handle_stream_unary(
+                    iter((request, request)), None), response)
+            self.assertEqual((('testkey', 'testvalue'),),
+                             call.trailing_metadata())
+            self.assertIs(grpc.StatusCode.OK, call.code())
+
+    def testUnaryStreamTrailingMetadata(self):
+        request = b'\x07\x08'
+        metadata = (('test', 'UnaryStreamTrailingMetadata'),)
+
+        response_iterator = _unary_stream_multi_callable(self._channel)(
+            request, metadata=metadata)
+        responses = tuple(response_iterator)
+
+        self.assertSequenceEqual(
+            (request,) * test_constants.STREAM_LENGTH, responses)
+        self.assertEqual((('testkey', 'testvalue'),),
+                         response_iterator.trailing_metadata())
+        self.assertIs(grpc.StatusCode.OK, response_iterator.code())
+
+    def testSequentialBlockingInvocationsAfterFailures(self):
+        request = b'\x07\x08'
+        requests = tuple(request for _ in range(test_constants.STREAM_LENGTH))
+        metadata = (('test', 'SequentialBlockingInvocationsAfterFailures'),)
+        expected_unary_response = self._handler.handle_unary_unary(
+            request, None)
+        expected_stream_response = self._handler.handle_stream_unary(
+            iter(requests), None)
+
+        unary_multi_callable = _unary_unary_multi_callable(self._channel)
+        stream_multi_callable = _stream_unary_multi_callable(self._channel)
+        for _ in range(3):
+            with self._control.fail():
+                with self.assertRaises(grpc.RpcError):
+                    unary_multi_callable(request, metadata=metadata)
+                with self.assertRaises(grpc.RpcError):
+                    stream_multi_callable(iter(requests), metadata=metadata)
+            unary_response = unary_multi_callable(request, metadata=metadata)
+            stream_response = stream_multi_callable(
+                iter(requests), metadata=metadata)
+
+            self.assertEqual(expected_unary_response, unary_response)
+            self.assertEqual(expected_stream_response, stream_response)
+
     def testConcurrentBlockingInvocations(self):
         pool = logging_pool.pool(test_constants.THREAD_CONCURRENCY)
         requests = tuple(
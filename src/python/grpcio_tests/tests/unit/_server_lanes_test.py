@@ -0,0 +1,139 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of servers with per-method lanes of capacity."""
+
+import threading
+import unittest
+from concurrent import futures
+
+import grpc
+from grpc import experimental
+
+from tests.unit import _thread_pool
+from tests.unit.framework.common import test_constants
+
+_SLOW_SERVICE = 'test.SlowService'
+_FAST_SERVICE = 'test.FastService'
+
+_SLOW = '/{}/Slow'.format(_SLOW_SERVICE)
+_FAST = '/{}/Fast'.format(_FAST_SERVICE)
+_OTHER_FAST = '/{}/OtherFast'.format(_FAST_SERVICE)
+
+_REQUEST = b'\x00\x00\x00'
+_RESPONSE = b'\x00\x00\x01'
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def __init__(self):
+        self._barrier = threading.Event()
+        self._entered = threading.Semaphore(0)
+
+    def release(self):
+        self._barrier.set()
+
+    def wait_for_entry(self):
+        self._entered.acquire()
+
+    def _slow(self, request, servicer_context):
+        self._entered.release()
+        self._barrier.wait()
+        return _RESPONSE
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _SLOW:
+            return grpc.unary_unary_rpc_method_handler(self._slow)
+        elif handler_call_details.method in (_FAST, _OTHER_FAST):
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, servicer_context: _RESPONSE)
+        else:
+            return None
+
+
+class ServerLanesTest(unittest.TestCase):
+
+    def setUp(self):
+        self._handler = _GenericHandler()
+        self._server = None
+
+    def tearDown(self):
+        self._handler.release()
+        self._server.stop(None)
+
+    def _start(self, thread_pool, maximum_concurrent_rpcs, method_lanes):
+        self._server = grpc.server(
+            thread_pool,
+            handlers=(self._handler,),
+            options=(('grpc.so_reuseport', 0),),
+            maximum_concurrent_rpcs=maximum_concurrent_rpcs,
+            method_lanes=method_lanes)
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        return grpc.insecure_channel('localhost:%d' % port)
+
+    def testMethodLaneLimit(self):
+        channel = self._start(
+            futures.ThreadPoolExecutor(max_workers=test_constants.POOL_SIZE),
+            None, {_SLOW: experimental.server_lane(maximum_concurrent_rpcs=1)})
+        slow_future = channel.unary_unary(_SLOW).future(_REQUEST)
+        self._handler.wait_for_entry()
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            channel.unary_unary(_SLOW)(_REQUEST)
+        fast_response = channel.unary_unary(_FAST)(_REQUEST)
+        self._handler.release()
+
+        self.assertIs(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                      exception_context.exception.code())
+        self.assertEqual(_RESPONSE, fast_response)
+        self.assertEqual(_RESPONSE, slow_future.result())
+
+    def testServiceLaneThreadPool(self):
+        server_thread_pool = _thread_pool.RecordingThreadPool(max_workers=None)
+        lane_thread_pool = _thread_pool.RecordingThreadPool(max_workers=None)
+        channel = self._start(server_thread_pool, None, {
+            _FAST_SERVICE: experimental.server_lane(
+                thread_pool=lane_thread_pool)
+        })
+
+        responses = (channel.unary_unary(_FAST)(_REQUEST),
+                     channel.unary_unary(_OTHER_FAST)(_REQUEST))
+
+        self.assertSequenceEqual((_RESPONSE, _RESPONSE), responses)
+        self.assertTrue(lane_thread_pool.was_used())
+        self.assertFalse(server_thread_pool.was_used())
+
+    def testLaneKeepsCapacityWhenServerLimitReached(self):
+        channel = self._start(
+            futures.ThreadPoolExecutor(max_workers=test_constants.POOL_SIZE), 1,
+            {
+                _FAST_SERVICE:
+                experimental.server_lane(maximum_concurrent_rpcs=1)
+            })
+        slow_future = channel.unary_unary(_SLOW).future(_REQUEST)
+        self._handler.wait_for_entry()
+
+        with self.assertRaises(grpc.RpcError) as exception_context:
+            channel.unary_unary(_SLOW)(_REQUEST)
+        fast_response = channel.unary_unary(_FAST)(_REQUEST)
+        self._handler.release()
+
+        self.assertIs(grpc.StatusCode.RESOURCE_EXHAUSTED,
+                      exception_context.exception.code())
+        self.assertEqual(_RESPONSE, fast_response)
+        self.assertEqual(_RESPONSE, slow_future.result())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,155 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of servers polling several completion queues and request_calls."""
+
+import threading
+import unittest
+from concurrent import futures
+
+import grpc
+from grpc import experimental
+
+from tests.unit.framework.common import test_constants
+
+_COMPLETION_QUEUE_COUNT = 4
+_REQUEST_CALLS_PER_COMPLETION_QUEUE = 8
+
+_REQUEST = b'\x00\x00\x00'
+_RESPONSE = b'\x00\x00\x01'
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_STREAM_STREAM = '/test/StreamStream'
+_BLOCKING_UNARY_UNARY = '/test/BlockingUnaryUnary'
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def __init__(self):
+        self._barrier = threading.Event()
+
+    def release(self):
+        self._barrier.set()
+
+    def _block(self, request, servicer_context):
+        self._barrier.wait()
+        return _RESPONSE
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, servicer_context: _RESPONSE)
+        elif handler_call_details.method == _BLOCKING_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(self._block)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(
+                lambda request_iterator, servicer_context: request_iterator)
+        else:
+            return None
+
+
+def _start_server(handler, completion_queue_count, options=()):
+    server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=test_constants.THREAD_CONCURRENCY),
+        handlers=(handler,),
+        options=(('grpc.so_reuseport', 0),) + options,
+        completion_queue_count=completion_queue_count)
+    port = server.add_insecure_port('[::]:0')
+    server.start()
+    return server, port
+
+
+class ServerPollingTest(unittest.TestCase):
+
+    def setUp(self):
+        self._handler = _GenericHandler()
+        self._server, port = _start_server(self._handler,
+                                           _COMPLETION_QUEUE_COUNT)
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._handler.release()
+        self._server.stop(None)
+
+    def testInvalidCompletionQueueCount(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=1),
+                completion_queue_count=0)
+
+    def testInvalidRequestCallsPerCompletionQueue(self):
+        with self.assertRaises(ValueError):
+            grpc.server(
+                futures.ThreadPoolExecutor(max_workers=1),
+                options=((
+                    experimental.ChannelOptions.RequestCallsPerCompletionQueue,
+                    0),))
+
+    def testBurstOfRpcsWithManyRequestCallsPosted(self):
+        handler = _GenericHandler()
+        server, port = _start_server(handler, 1, (
+            (experimental.ChannelOptions.RequestCallsPerCompletionQueue,
+             _REQUEST_CALLS_PER_COMPLETION_QUEUE),))
+        channel = grpc.insecure_channel('localhost:%d' % port)
+        multi_callable = channel.unary_unary(_BLOCKING_UNARY_UNARY)
+
+        response_futures = [
+            multi_callable.future(_REQUEST)
+            for _ in range(_REQUEST_CALLS_PER_COMPLETION_QUEUE * 2)
+        ]
+        handler.release()
+
+        for response_future in response_futures:
+            self.assertEqual(_RESPONSE, response_future.result())
+        server.stop(None)
+
+    def testConcurrentUnaryUnary(self):
+        multi_callable = self._channel.unary_unary(_UNARY_UNARY)
+
+        response_futures = [
+            multi_callable.future(_REQUEST)
+            for _ in range(test_constants.THREAD_CONCURRENCY)
+        ]
+
+        for response_future in response_futures:
+            self.assertEqual(_RESPONSE, response_future.result())
+
+    def testConcurrentStreamStream(self):
+        multi_callable = self._channel.stream_stream(_STREAM_STREAM)
+        requests = tuple(_REQUEST for _ in range(test_constants.STREAM_LENGTH))
+
+        response_iterators = [
+            multi_callable(iter(requests))
+            for _ in range(_COMPLETION_QUEUE_COUNT * 2)
+        ]
+
+        for response_iterator in response_iterators:
+            self.assertSequenceEqual(requests, tuple(response_iterator))
+
+    def testStopWithRpcsInFlight(self):
+        multi_callable = self._channel.unary_unary(_BLOCKING_UNARY_UNARY)
+        response_futures = [
+            multi_callable.future(_REQUEST)
+            for _ in range(_COMPLETION_QUEUE_COUNT * 2)
+        ]
+
+        stopped = self._server.stop(test_constants.SHORT_TIMEOUT)
+        self._handler.release()
+        stopped.wait()
+
+        for response_future in response_futures:
+            self.assertIsNotNone(response_future.code())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
@@ -0,0 +1,153 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of the server's memoization of static server interceptors."""
+
+import collections
+import threading
+import unittest
+from concurrent import futures
+
+import grpc
+from grpc import experimental
+
+from tests.unit.framework.common import test_constants
+
+_SERVICE = 'test.Service'
+_METHOD = 'Method'
+_OTHER_METHOD = 'OtherMethod'
+
+_REQUEST = b'\x00\x00\x00'
+_RESPONSE = b'\x00\x00\x01'
+
+_RPC_COUNT = 5
+
+
+def _method_handler(request, servicer_context):
+    return _RESPONSE
+
+
+class _CountingInterceptor(grpc.ServerInterceptor):
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.methods = []
+
+    def intercept_service(self, continuation, handler_call_details):
+        with self._lock:
+            self.methods.append(handler_call_details.method)
+        return continuation(handler_call_details)
+
+
+class _StaticCountingInterceptor(_CountingInterceptor,
+                                 experimental.StaticServerInterceptor):
+    pass
+
+
+class _ReroutingInterceptor(grpc.ServerInterceptor):
+
+    def __init__(self, method):
+        self._method = method
+
+    def intercept_service(self, continuation, handler_call_details):
+        return continuation(
+            _HandlerCallDetails(self._method,
+                                handler_call_details.invocation_metadata))
+
+
+class _HandlerCallDetails(
+        collections.namedtuple('_HandlerCallDetails', (
+            'method',
+            'invocation_metadata',
+        )), grpc.HandlerCallDetails):
+    pass
+
+
+class StaticInterceptorTest(unittest.TestCase):
+
+    def _serve(self, interceptors):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=test_constants.POOL_SIZE),
+            options=(('grpc.so_reuseport', 0),),
+            interceptors=interceptors)
+        self._server.add_generic_rpc_handlers((
+            grpc.method_handlers_generic_handler(_SERVICE, {
+                _METHOD:
+                grpc.unary_unary_rpc_method_handler(_method_handler),
+                _OTHER_METHOD:
+                grpc.unary_unary_rpc_method_handler(_method_handler),
+            }),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def _invoke(self, method):
+        return self._channel.unary_unary('/{}/{}'.format(_SERVICE,
+                                                         method))(_REQUEST)
+
+    def testStaticInterceptorsCalledOncePerMethod(self):
+        dynamic_interceptor = _CountingInterceptor()
+        static_interceptor = _StaticCountingInterceptor()
+        self._serve((dynamic_interceptor, static_interceptor))
+
+        for _ in range(_RPC_COUNT):
+            self.assertEqual(_RESPONSE, self._invoke(_METHOD))
+            self.assertEqual(_RESPONSE, self._invoke(_OTHER_METHOD))
+
+        self.assertEqual(2 * _RPC_COUNT, len(dynamic_interceptor.methods))
+        self.assertEqual(
+            sorted((
+                '/{}/{}'.format(_SERVICE, _METHOD),
+                '/{}/{}'.format(_SERVICE, _OTHER_METHOD),
+            )), sorted(static_interceptor.methods))
+
+    def testStaticInterceptorBeforeDynamicInterceptorNotMemoized(self):
+        static_interceptor = _StaticCountingInterceptor()
+        dynamic_interceptor = _CountingInterceptor()
+        self._serve((static_interceptor, dynamic_interceptor))
+
+        for _ in range(_RPC_COUNT):
+            self.assertEqual(_RESPONSE, self._invoke(_METHOD))
+
+        self.assertEqual(_RPC_COUNT, len(static_interceptor.methods))
+        self.assertEqual(_RPC_COUNT, len(dynamic_interceptor.methods))
+
+    def testReroutedMethodNotMemoized(self):
+        other_method = '/{}/{}'.format(_SERVICE, _OTHER_METHOD)
+        static_interceptor = _StaticCountingInterceptor()
+        self._serve((_ReroutingInterceptor(other_method), static_interceptor))
+
+        for _ in range(_RPC_COUNT):
+            self.assertEqual(_RESPONSE, self._invoke(_METHOD))
+
+        self.assertEqual([other_method] * _RPC_COUNT,
+                         static_interceptor.methods)
+
+    def testUnknownMethodNotMemoized(self):
+        static_interceptor = _StaticCountingInterceptor()
+        self._serve((static_interceptor,))
+
+        for _ in range(_RPC_COUNT):
+            with self.assertRaises(grpc.RpcError) as exception_context:
+                self._invoke('UnknownMethod')
+            self.assertIs(grpc.StatusCode.UNIMPLEMENTED,
+                          exception_context.exception.code())
+
+        self.assertEqual(_RPC_COUNT, len(static_interceptor.methods))
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
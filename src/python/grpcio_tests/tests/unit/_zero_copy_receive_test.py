@@ -0,0 +1,123 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of receiving messages without copying them out of the transport."""
+
+import unittest
+from concurrent import futures
+
+import grpc
+from grpc import experimental
+
+from tests.unit.framework.common import test_constants
+
+_SMALL_MESSAGE = b'\x07\x08'
+_LARGE_MESSAGE = b'\x09' * (4 * 1024 * 1024)
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_STREAM_STREAM = '/test/StreamStream'
+_DESERIALIZING_UNARY_UNARY = '/test/DeserializingUnaryUnary'
+
+_ZERO_COPY_RECEIVE_OPTIONS = (
+    (experimental.ChannelOptions.ZeroCopyReceive, 1),
+    ('grpc.max_send_message_length', -1),
+    ('grpc.max_receive_message_length', -1),
+)
+
+
+def _echo_view(request, servicer_context):
+    if not isinstance(request, memoryview):
+        servicer_context.abort(grpc.StatusCode.FAILED_PRECONDITION,
+                               'Request was not a memoryview!')
+    return bytes(request)
+
+
+def _echo_views(request_iterator, servicer_context):
+    for request in request_iterator:
+        yield _echo_view(request, servicer_context)
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(_echo_view)
+        elif handler_call_details.method == _DESERIALIZING_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, servicer_context: request,
+                request_deserializer=bytes)
+        elif handler_call_details.method == _STREAM_STREAM:
+            return grpc.stream_stream_rpc_method_handler(_echo_views)
+        else:
+            return None
+
+
+class ZeroCopyReceiveTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=test_constants.POOL_SIZE),
+            options=(('grpc.so_reuseport', 0),) + _ZERO_COPY_RECEIVE_OPTIONS)
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel(
+            'localhost:%d' % port, options=_ZERO_COPY_RECEIVE_OPTIONS)
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def testSmallUnaryUnary(self):
+        response = self._channel.unary_unary(_UNARY_UNARY)(_SMALL_MESSAGE)
+
+        self.assertIsInstance(response, memoryview)
+        self.assertEqual(_SMALL_MESSAGE, bytes(response))
+
+    def testLargeUnaryUnary(self):
+        response = self._channel.unary_unary(_UNARY_UNARY)(_LARGE_MESSAGE)
+
+        self.assertIsInstance(response, memoryview)
+        self.assertEqual(_LARGE_MESSAGE, bytes(response))
+
+    def testEmptyUnaryUnary(self):
+        response = self._channel.unary_unary(_UNARY_UNARY)(b'')
+
+        self.assertEqual(b'', bytes(response))
+
+    def testDeserializers(self):
+        multi_callable = self._channel.unary_unary(
+            _DESERIALIZING_UNARY_UNARY, response_deserializer=bytes)
+
+        self.assertEqual(_LARGE_MESSAGE, multi_callable(_LARGE_MESSAGE))
+
+    def testStreamStream(self):
+        requests = tuple(_SMALL_MESSAGE
+                         for _ in range(test_constants.STREAM_LENGTH))
+
+        responses = self._channel.stream_stream(_STREAM_STREAM)(iter(requests))
+
+        self.assertSequenceEqual(requests,
+                                 tuple(bytes(response)
+                                       for response in responses))
+
+    def testViewOutlivesCall(self):
+        response = self._channel.unary_unary(_UNARY_UNARY)(_LARGE_MESSAGE)
+        self._channel.unary_unary(_UNARY_UNARY)(_SMALL_MESSAGE)
+
+        self.assertTrue(response.readonly)
+        self.assertEqual(len(_LARGE_MESSAGE), len(response))
+        self.assertEqual(_LARGE_MESSAGE, response.tobytes())
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)
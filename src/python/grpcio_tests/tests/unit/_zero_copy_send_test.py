@@ -0,0 +1,99 @@
+# Copyright 2018 gRPC authors.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests of sending messages serialized to buffers other than bytes."""
+
+import unittest
+
+import grpc
+
+from tests.unit import test_common
+from tests.unit.framework.common import test_constants
+
+_SMALL_MESSAGE = b'\x07\x08'
+_MEDIUM_MESSAGE = b'\x0b' * (64 * 1024)
+_LARGE_MESSAGE = b'\x09\x0a' * (1024 * 1024)
+
+_UNARY_UNARY = '/test/UnaryUnary'
+_BYTEARRAY_UNARY_UNARY = '/test/BytearrayUnaryUnary'
+_MEMORYVIEW_UNARY_STREAM = '/test/MemoryviewUnaryStream'
+
+
+class _GenericHandler(grpc.GenericRpcHandler):
+
+    def service(self, handler_call_details):
+        if handler_call_details.method == _UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, servicer_context: request)
+        elif handler_call_details.method == _BYTEARRAY_UNARY_UNARY:
+            return grpc.unary_unary_rpc_method_handler(
+                lambda request, servicer_context: request,
+                response_serializer=bytearray)
+        elif handler_call_details.method == _MEMORYVIEW_UNARY_STREAM:
+            return grpc.unary_stream_rpc_method_handler(
+                lambda request, servicer_context: (
+                    request for _ in range(test_constants.STREAM_LENGTH)),
+                response_serializer=memoryview)
+        else:
+            return None
+
+
+class ZeroCopySendTest(unittest.TestCase):
+
+    def setUp(self):
+        self._server = test_common.test_server()
+        self._server.add_generic_rpc_handlers((_GenericHandler(),))
+        port = self._server.add_insecure_port('[::]:0')
+        self._server.start()
+        self._channel = grpc.insecure_channel('localhost:%d' % port)
+
+    def tearDown(self):
+        self._server.stop(None)
+
+    def _assert_echoed(self, method, request_serializer, message):
+        multi_callable = self._channel.unary_unary(
+            method, request_serializer=request_serializer)
+
+        self.assertEqual(message, multi_callable(message))
+
+    def testLargeBytes(self):
+        self._assert_echoed(_UNARY_UNARY, None, _LARGE_MESSAGE)
+
+    def testSmallBytearray(self):
+        self._assert_echoed(_BYTEARRAY_UNARY_UNARY, bytearray, _SMALL_MESSAGE)
+
+    def testLargeBytearray(self):
+        self._assert_echoed(_BYTEARRAY_UNARY_UNARY, bytearray, _LARGE_MESSAGE)
+
+    def testLargeMemoryview(self):
+        self._assert_echoed(_UNARY_UNARY, memoryview, _LARGE_MESSAGE)
+
+    def testStreamedMemoryviews(self):
+        responses = self._channel.unary_stream(
+            _MEMORYVIEW_UNARY_STREAM, request_serializer=memoryview)(
+                _MEDIUM_MESSAGE)
+
+        self.assertSequenceEqual(
+            (_MEDIUM_MESSAGE,) * test_constants.STREAM_LENGTH,
+            tuple(responses))
+
+    def testNonBufferRequest(self):
+        multi_callable = self._channel.unary_unary(
+            _UNARY_UNARY, request_serializer=lambda request: object())
+
+        with self.assertRaises(TypeError):
+            multi_callable(_SMALL_MESSAGE)
+
+
+if __name__ == '__main__':
+    unittest.main(verbosity=2)